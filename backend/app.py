@@ -1,6 +1,8 @@
 import logging
 import os
+import re
 import sys
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -17,13 +19,29 @@ try:
     from backend.config import DefaultConfig
     from backend.database import init_db, init_engine, SessionLocal, get_session
     from backend.routes import register_blueprints
+    from backend.routes.meetings import meeting_events_asgi
+    from backend.pipelines.orchestrator import (
+        complete_assemblyai_transcription,
+        process_meeting,
+        reconcile_assemblyai_transcription,
+        recover_orphaned_meetings,
+    )
     from backend.services.background import BackgroundTaskRunner
+    from backend.services.whisper_models import get_whisper_registry
     from backend.migrations import run_migrations
 except ModuleNotFoundError:
     from config import DefaultConfig
     from database import init_db, init_engine, SessionLocal, get_session
     from routes import register_blueprints
+    from routes.meetings import meeting_events_asgi
+    from pipelines.orchestrator import (
+        complete_assemblyai_transcription,
+        process_meeting,
+        reconcile_assemblyai_transcription,
+        recover_orphaned_meetings,
+    )
     from services.background import BackgroundTaskRunner
+    from services.whisper_models import get_whisper_registry
     from migrations import run_migrations
 
 
@@ -48,7 +66,12 @@ def create_app(config_object: type | None = None) -> Flask:
     logger.info("Storage directory set to %s", storage_dir)
 
     # Configure CORS with debug logging
-    CORS(app, resources={r"/*": {"origins": "*"}})
+    # Browsers only let scripts read response headers that are listed as exposed
+    CORS(
+        app,
+        resources={r"/*": {"origins": "*"}},
+        expose_headers=["X-Next-Cursor", "Link", "ETag", "Retry-After"],
+    )
     logger.info("CORS enabled for all origins")
 
     # Add request logging middleware
@@ -79,6 +102,13 @@ def create_app(config_object: type | None = None) -> Flask:
             database_url=app.config["SQLALCHEMY_DATABASE_URI"],
             echo=app.config.get("SQLALCHEMY_ECHO", False),
             force=bool(app.config.get("TESTING", False)),
+            pool_size=app.config.get("DB_POOL_SIZE", 10),
+            max_overflow=app.config.get("DB_MAX_OVERFLOW", 20),
+            pool_timeout=app.config.get("DB_POOL_TIMEOUT", 30.0),
+            pool_recycle=app.config.get("DB_POOL_RECYCLE", 1800),
+            sqlite_busy_timeout_ms=app.config.get("SQLITE_BUSY_TIMEOUT_MS", 5000),
+            sqlite_mmap_size_mb=app.config.get("SQLITE_MMAP_SIZE_MB", 256),
+            sqlite_cache_size_mb=app.config.get("SQLITE_CACHE_SIZE_MB", 64),
         )
         logger.info(
             "Database engine initialized (driver=%s)",
@@ -98,14 +128,41 @@ def create_app(config_object: type | None = None) -> Flask:
         raise
 
     background_runner = BackgroundTaskRunner(
-        enabled=app.config.get("ENABLE_BACKGROUND_JOBS", True)
+        max_workers=app.config.get("BACKGROUND_WORKERS", 2),
+        enabled=app.config.get("ENABLE_BACKGROUND_JOBS", True),
+        poll_interval=app.config.get("JOB_POLL_INTERVAL", 1.0),
+        visibility_timeout=app.config.get("JOB_VISIBILITY_TIMEOUT", 900.0),
+        max_attempts=app.config.get("JOB_MAX_ATTEMPTS", 3),
+        retry_backoff=app.config.get("JOB_RETRY_BACKOFF", 30.0),
+        max_depth=app.config.get("JOB_QUEUE_MAX_DEPTH", 100),
+        retention_hours=app.config.get("JOB_RETENTION_HOURS", 168.0),
     )
+    background_runner.register(process_meeting)
+    background_runner.register(complete_assemblyai_transcription)
+    background_runner.register(reconcile_assemblyai_transcription)
     app.extensions["background_runner"] = background_runner
+    if background_runner.enabled:
+        # Pick up meetings a crashed or restarted process left behind
+        recover_orphaned_meetings(background_runner)
+        background_runner.start()
     logger.info(
         "Background runner enabled=%s",
         app.config.get("ENABLE_BACKGROUND_JOBS", True),
     )
 
+    if (
+        app.config.get("TRANSCRIPTION_PROVIDER", "").lower() == "whisper"
+        and app.config.get("WHISPER_PRELOAD", True)
+    ):
+        # Load the model off the request path so the first upload does not pay for it
+        threading.Thread(
+            target=get_whisper_registry().warm_up,
+            args=(app.config.get("WHISPER_MODEL", "base"),),
+            name="whisper-warmup",
+            daemon=True,
+        ).start()
+        logger.info("Warming up Whisper model %s", app.config.get("WHISPER_MODEL", "base"))
+
     # Add a root endpoint
     @app.route("/", methods=["GET"])
     def root():
@@ -163,6 +220,34 @@ def get_background_runner(app: Flask) -> BackgroundTaskRunner:
     return app.extensions["background_runner"]
 
 
+EVENT_STREAM_PATH = re.compile(r"/meetings/(\d+)/events")
+
+
+def create_asgi_app(app: Flask | None = None):
+    """
+    ASGI entry point for production (``asgi:app`` under uvicorn).
+
+    Meeting event streams are served by ``meeting_events_asgi`` on the event
+    loop, so an idle SSE subscriber costs a coroutine rather than a thread.
+    Every other request goes to the Flask app on a pool of ``WSGI_THREADS``
+    threads via a2wsgi.
+    """
+    from a2wsgi import WSGIMiddleware
+
+    app = app or create_app()
+    wsgi = WSGIMiddleware(app, workers=app.config.get("WSGI_THREADS", 32))
+
+    async def asgi_app(scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "GET":
+            match = EVENT_STREAM_PATH.fullmatch(scope["path"])
+            if match:
+                await meeting_events_asgi(app, int(match.group(1)), scope, receive, send)
+                return
+        await wsgi(scope, receive, send)
+
+    return asgi_app
+
+
 if __name__ == "__main__":
     flask_app = create_app()
     port = int(os.getenv("PORT", 5000))
@@ -0,0 +1,15 @@
+"""
+ASGI entry point for Railway deployment (see Procfile).
+This file should be in the backend folder.
+"""
+import sys
+from pathlib import Path
+
+# Since we're deploying only the backend folder, add current directory to path
+# This allows imports like "from config import..." instead of "from backend.config import..."
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app import create_asgi_app
+
+# Event streams run on the event loop; everything else in the Flask app's thread pool
+app = create_asgi_app()
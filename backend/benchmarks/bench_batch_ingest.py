@@ -0,0 +1,104 @@
+"""
+Ingestion throughput of one-at-a-time ``POST /meetings`` versus
+``POST /meetings/batch`` (JSON array and NDJSON).
+
+Each run starts the app on a fresh SQLite file with a durable job runner
+that is enabled but not started, so every meeting is stored and its job
+persisted without being processed. Reports meetings per second, including
+request parsing, validation, the inserts, search indexing and the job
+enqueue.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_batch_ingest
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    from backend.app import create_app
+    from backend.config import DefaultConfig
+    from backend.database import SessionLocal
+    from backend.models import Job, Meeting
+    from backend.pipelines.orchestrator import process_meeting
+    from backend.services.background import BackgroundTaskRunner
+except ModuleNotFoundError:
+    from app import create_app
+    from config import DefaultConfig
+    from database import SessionLocal
+    from models import Job, Meeting
+    from pipelines.orchestrator import process_meeting
+    from services.background import BackgroundTaskRunner
+
+MEETINGS = 2000
+TRANSCRIPT = "We reviewed the roadmap and agreed on next steps. ACTION: send the recap @Alex. " * 40
+
+
+def make_client(tmp: Path, name: str):
+    class BenchConfig(DefaultConfig):
+        TESTING = True
+        ENABLE_BACKGROUND_JOBS = False
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp / (name + '.db')}"
+        STORAGE_DIR = tmp / "uploads"
+
+    app = create_app(BenchConfig)
+    # Enabled but never started: jobs are persisted, not run
+    runner = BackgroundTaskRunner(max_depth=10**6)
+    runner.register(process_meeting)
+    app.extensions["background_runner"] = runner
+    return app.test_client()
+
+
+def check(count: int) -> None:
+    session = SessionLocal()
+    try:
+        assert session.query(Meeting).count() == count
+        assert session.query(Job).count() == count
+    finally:
+        session.close()
+
+
+def one_at_a_time(client, items) -> None:
+    for item in items:
+        response = client.post("/meetings", json=item)
+        assert response.status_code == 201, response.json
+
+
+def json_batch(client, items) -> None:
+    response = client.post("/meetings/batch", json=items)
+    assert response.status_code == 201, response.json
+
+
+def ndjson_batch(client, items) -> None:
+    body = "\n".join(json.dumps(item) for item in items)
+    response = client.post("/meetings/batch", data=body, content_type="application/x-ndjson")
+    assert response.status_code == 201, response.json
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    os.environ.setdefault("MOCK_SUMMARY", "1")
+    items = [{"title": f"Meeting {index}", "transcript": TRANSCRIPT} for index in range(MEETINGS)]
+    print(f"{MEETINGS} meetings, {len(TRANSCRIPT)} characters each")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, label, ingest in (
+            ("single", "POST /meetings x N", one_at_a_time),
+            ("json", "POST /meetings/batch (JSON)", json_batch),
+            ("ndjson", "POST /meetings/batch (NDJSON)", ndjson_batch),
+        ):
+            client = make_client(Path(tmp), name)
+            started = time.perf_counter()
+            ingest(client, items)
+            elapsed = time.perf_counter() - started
+            check(MEETINGS)
+            print(f"{label:>30}: {elapsed:6.2f} s | {MEETINGS / elapsed:8.0f} meetings/s")
+
+
+if __name__ == "__main__":
+    main()
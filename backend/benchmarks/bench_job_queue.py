@@ -0,0 +1,71 @@
+"""
+Throughput of the durable job queue versus an in-memory thread pool.
+
+Each job sleeps for JOB_SECONDS to stand in for I/O-bound pipeline work
+(transcription and Gemini calls). The durable runner persists, claims and
+completes every job through a temporary SQLite database.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_job_queue
+"""
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    from backend.database import SessionLocal, init_db, init_engine
+    from backend.services.background import BackgroundTaskRunner
+except ModuleNotFoundError:
+    from database import SessionLocal, init_db, init_engine
+    from services.background import BackgroundTaskRunner
+
+JOBS = 100
+WORKERS = 4
+JOB_SECONDS = 0.1
+
+
+def work(index: int) -> None:
+    time.sleep(JOB_SECONDS)
+
+
+def thread_pool() -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        wait([executor.submit(work, index) for index in range(JOBS)])
+    return time.perf_counter() - start
+
+
+def durable_queue() -> float:
+    runner = BackgroundTaskRunner(max_workers=WORKERS, poll_interval=0.05)
+    runner.register(work)
+    start = time.perf_counter()
+    runner.start()
+    for index in range(JOBS):
+        runner.enqueue(work, args=(index,))
+    while runner.stats()["jobs"]["done"] < JOBS:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    runner.shutdown()
+    return elapsed
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        init_engine(f"sqlite:///{Path(tmp) / 'jobs.db'}", force=True)
+        init_db()
+        ideal = JOBS * JOB_SECONDS / WORKERS
+        for name, func in (("thread pool", thread_pool), ("durable queue", durable_queue)):
+            elapsed = func()
+            print(
+                f"{name:>14}: {JOBS / elapsed:7.1f} jobs/s | {elapsed:.2f}s "
+                f"(ideal {ideal:.2f}s with {WORKERS} workers)"
+            )
+        SessionLocal.remove()
+
+
+if __name__ == "__main__":
+    main()
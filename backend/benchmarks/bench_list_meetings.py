@@ -0,0 +1,108 @@
+"""
+Latency of GET /meetings on a large table.
+
+Seeds MEETINGS meetings (with transcripts and one action item each) into a
+temporary SQLite database, then times the first page and a page deep into
+the table reached by cursor, with and without the ``fields=`` projection.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_list_meetings
+"""
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    from backend.app import create_app
+    from backend.config import DefaultConfig
+    from backend.database import get_session
+    from backend.models import ActionItem, Meeting, MeetingContent
+except ModuleNotFoundError:
+    from app import create_app
+    from config import DefaultConfig
+    from database import get_session
+    from models import ActionItem, Meeting, MeetingContent
+
+MEETINGS = 20000
+PAGE = 50
+ITERATIONS = 20
+TRANSCRIPT = "We reviewed the roadmap and agreed on next steps. " * 200
+
+
+def seed() -> None:
+    session = get_session()
+    start = datetime(2025, 1, 1)
+    ids = range(1, MEETINGS + 1)
+    meetings = [
+        {
+            "id": meeting_id,
+            "title": f"Meeting {meeting_id}",
+            "status": "done",
+            "created_at": start + timedelta(minutes=meeting_id),
+        }
+        for meeting_id in ids
+    ]
+    session.bulk_insert_mappings(Meeting, meetings)
+    session.bulk_insert_mappings(
+        MeetingContent,
+        [{"meeting_id": meeting_id, "transcript": TRANSCRIPT, "summary": "Roadmap review."} for meeting_id in ids],
+    )
+    session.bulk_insert_mappings(
+        ActionItem, [{"meeting_id": meeting_id, "description": "Follow up"} for meeting_id in ids]
+    )
+    session.commit()
+    session.close()
+
+
+def measure(client, url: str) -> list[float]:
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        response = client.get(url)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200
+    return samples
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    os.environ.setdefault("MOCK_SUMMARY", "1")
+    with tempfile.TemporaryDirectory() as tmp:
+
+        class BenchConfig(DefaultConfig):
+            TESTING = True
+            ENABLE_BACKGROUND_JOBS = False
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{Path(tmp) / 'bench.db'}"
+            STORAGE_DIR = Path(tmp) / "uploads"
+
+        app = create_app(BenchConfig)
+        seed()
+        client = app.test_client()
+
+        # Walk 100 pages deep to get a cursor far from the head of the table
+        cursor = None
+        for _ in range(100):
+            response = client.get(f"/meetings?fields=id&limit={PAGE}" + (f"&cursor={cursor}" if cursor else ""))
+            cursor = response.headers["X-Next-Cursor"]
+
+        cases = {
+            "first page, all fields": f"/meetings?limit={PAGE}",
+            "first page, projected": f"/meetings?limit={PAGE}&fields=title,status,created_at",
+            "first page, + items": f"/meetings?limit={PAGE}&fields=title,status,action_items",
+            "page 101, projected": f"/meetings?limit={PAGE}&fields=title,status,created_at&cursor={cursor}",
+        }
+        print(f"{MEETINGS} meetings, {PAGE} per page")
+        for name, url in cases.items():
+            samples = measure(client, url)
+            print(f"{name:>24}: median {statistics.median(samples):.2f} ms | max {max(samples):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
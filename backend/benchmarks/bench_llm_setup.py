@@ -0,0 +1,75 @@
+"""
+Micro-benchmark of per-call Gemini setup overhead.
+
+Compares building a ChatPromptTemplate and ChatGoogleGenerativeAI on every
+call (the previous behaviour) with the shared client registry and the
+cached prompt templates (``get_prompt``). No network requests are made.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_llm_setup
+"""
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from langchain.prompts import ChatPromptTemplate
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    from backend.pipelines.summarization import SUMMARY_PROMPT
+    from backend.services.llm import clear_chat_models, get_chat_model, get_prompt
+except ModuleNotFoundError:
+    from pipelines.summarization import SUMMARY_PROMPT
+    from services.llm import clear_chat_models, get_chat_model, get_prompt
+
+ITERATIONS = 200
+MODEL = "gemini-2.5-flash"
+API_KEY = "benchmark-key"
+TRANSCRIPT = "Alice will send the deck by Friday. " * 200
+
+
+def per_call_setup() -> None:
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", "Summarize the provided meeting transcript in {max_sentences} sentences or less."),
+            ("human", "Meeting Transcript:\n\n{transcript}\n\nProvide a concise summary:"),
+        ]
+    )
+    ChatGoogleGenerativeAI(
+        model=MODEL,
+        temperature=0.2,
+        google_api_key=API_KEY,
+        convert_system_message_to_human=True,
+    )
+    prompt.format_messages(transcript=TRANSCRIPT, max_sentences=5)
+
+
+def shared_setup() -> None:
+    get_chat_model(MODEL, temperature=0.2, api_key=API_KEY)
+    get_prompt(SUMMARY_PROMPT).format_messages(transcript=TRANSCRIPT, max_sentences=5)
+
+
+def measure(func) -> list[float]:
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    clear_chat_models()
+    for name, func in (("per-call setup", per_call_setup), ("shared registry", shared_setup)):
+        samples = measure(func)
+        print(
+            f"{name:>16}: mean {statistics.mean(samples):.3f} ms | "
+            f"median {statistics.median(samples):.3f} ms | p95 {sorted(samples)[int(len(samples) * 0.95)]:.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Database size and list-query latency before and after moving transcripts
+out of the ``meetings`` row.
+
+Seeds MEETINGS meetings in the old layout (transcript and summary inline in
+``meetings``) into a temporary SQLite database and measures it; then starts
+the app on it, which migrates the text into compressed ``meeting_contents``
+rows, VACUUMs, and measures again. The list queries are the ones
+``GET /meetings`` issues, run on a fresh connection each time.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_meeting_storage
+"""
+import logging
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    from backend.app import create_app
+    from backend.config import DefaultConfig
+except ModuleNotFoundError:
+    from app import create_app
+    from config import DefaultConfig
+
+MEETINGS = 5000
+TRANSCRIPT_WORDS = 5000  # ~30 KB of text
+ITERATIONS = 20
+VOCABULARY = [f"word{index}" for index in range(3000)]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+LEGACY_SCHEMA = """
+CREATE TABLE meetings (
+    id INTEGER PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    created_at DATETIME NOT NULL,
+    audio_url VARCHAR(1024),
+    transcript TEXT,
+    summary TEXT,
+    status VARCHAR(50) NOT NULL,
+    source_agent VARCHAR(255),
+    error_message TEXT
+);
+CREATE INDEX ix_meetings_created_at_id ON meetings (created_at, id);
+"""
+
+QUERIES = {
+    "first page (title, status)": (
+        "SELECT id, created_at, title, status FROM meetings ORDER BY created_at DESC, id DESC LIMIT 51"
+    ),
+    "status counts (full pass)": "SELECT status, COUNT(*) FROM meetings GROUP BY status",
+}
+
+
+def seed(path: Path) -> None:
+    rng = random.Random(7)
+    start = datetime(2025, 1, 1)
+    connection = sqlite3.connect(path)
+    connection.executescript(LEGACY_SCHEMA)
+    for offset in range(0, MEETINGS, 500):
+        rows = []
+        for index in range(offset, offset + 500):
+            words = rng.choices(VOCABULARY, WEIGHTS, k=TRANSCRIPT_WORDS)
+            rows.append((
+                f"Meeting {index}",
+                (start + timedelta(minutes=index)).isoformat(sep=" "),
+                " ".join(words),
+                " ".join(words[:150]),
+                "done",
+            ))
+        connection.executemany(
+            "INSERT INTO meetings (title, created_at, transcript, summary, status) VALUES (?, ?, ?, ?, ?)", rows
+        )
+        connection.commit()
+    connection.close()
+
+
+def table_sizes(path: Path) -> dict:
+    connection = sqlite3.connect(path)
+    sizes = dict(connection.execute(
+        "SELECT CASE WHEN name LIKE 'meetings_fts%' THEN 'meetings_fts (search)' ELSE name END, "
+        "SUM(pgsize) FROM dbstat GROUP BY 1"
+    ))
+    connection.close()
+    return sizes
+
+
+def measure(path: Path, label: str) -> None:
+    sizes = table_sizes(path)
+    print(f"\n{label}: file {path.stat().st_size / 2**20:.1f} MiB")
+    for name in ("meetings", "meeting_contents", "meetings_fts (search)"):
+        if name in sizes:
+            print(f"  {name:>28}: {sizes[name] / 2**20:.1f} MiB")
+    for name, sql in QUERIES.items():
+        samples = []
+        for _ in range(ITERATIONS):
+            connection = sqlite3.connect(path)
+            started = time.perf_counter()
+            connection.execute(sql).fetchall()
+            samples.append((time.perf_counter() - started) * 1000)
+            connection.close()
+        print(f"  {name:>28}: median {statistics.median(samples):.2f} ms | max {max(samples):.2f} ms")
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    os.environ.setdefault("MOCK_SUMMARY", "1")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        seed(path)
+        print(f"{MEETINGS} meetings, ~{TRANSCRIPT_WORDS} words per transcript")
+        measure(path, "inline transcripts")
+
+        class BenchConfig(DefaultConfig):
+            TESTING = True
+            ENABLE_BACKGROUND_JOBS = False
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{path}"
+            STORAGE_DIR = Path(tmp) / "uploads"
+
+        started = time.perf_counter()
+        app = create_app(BenchConfig)
+        print(f"\nmigration (incl. search index build): {time.perf_counter() - started:.1f} s")
+        connection = sqlite3.connect(path)
+        connection.execute("VACUUM")
+        connection.close()
+        measure(path, "compressed meeting_contents")
+
+        client = app.test_client()
+        samples = []
+        for _ in range(ITERATIONS):
+            started = time.perf_counter()
+            client.get("/meetings?limit=50&fields=title,status")
+            samples.append((time.perf_counter() - started) * 1000)
+        print(f"  {'GET /meetings (projected)':>28}: median {statistics.median(samples):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Meetings per second through the persistence step of ``process_meeting``.
+
+Summarization and extraction are replaced by instant stubs returning a
+fixed summary and ITEMS action items, so only the database work is timed:
+status transitions, stage checkpoints, the summary and the action items.
+The previous write pattern (a commit per stage start and finish, one
+``session.add`` per action item: eight commits per meeting) is replayed
+for comparison, on SQLAlchemy's default SQLite engine (rollback journal,
+synchronous=FULL: an fsync per commit) and on the ``init_engine`` profile.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_pipeline_persistence
+"""
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    import backend.database as database
+    from backend.migrations import run_migrations
+    from backend.models import ActionItem, Meeting, MeetingStage
+    from backend.pipelines import orchestrator
+except ModuleNotFoundError:
+    import database
+    from migrations import run_migrations
+    from models import ActionItem, Meeting, MeetingStage
+    from pipelines import orchestrator
+
+MEETINGS = 300
+ITEMS = 8
+TRANSCRIPT = "We reviewed the roadmap and agreed on next steps. " * 20
+SUMMARY = "Roadmap reviewed; next steps agreed."
+ACTION_ITEMS = [
+    {"description": f"Task {index}", "owner": "Sam" if index % 2 else None, "due_date": "2025-03-01"}
+    for index in range(ITEMS)
+]
+
+
+def seed(Session) -> list:
+    session = Session()
+    meetings = [Meeting(title=f"Bench {index}", transcript=TRANSCRIPT, status="pending") for index in range(MEETINGS)]
+    session.add_all(meetings)
+    session.commit()
+    ids = [meeting.id for meeting in meetings]
+    session.close()
+    return ids
+
+
+def previous_pattern(meeting_id: int, Session) -> None:
+    session = Session()
+    try:
+        meeting = session.get(Meeting, meeting_id)
+        meeting.status = "processing"
+        session.commit()
+        for name in orchestrator.STAGES:
+            stage = MeetingStage(meeting_id=meeting.id, name=name, status="running", started_at=datetime.utcnow())
+            meeting.stages.append(stage)
+            session.commit()
+            if name == "summarize":
+                meeting.summary = SUMMARY
+            elif name == "extract":
+                session.query(ActionItem).filter(ActionItem.meeting_id == meeting.id).delete()
+                for item in ACTION_ITEMS:
+                    session.add(ActionItem(
+                        meeting_id=meeting.id,
+                        description=item["description"],
+                        owner=item["owner"],
+                        due_date=datetime.fromisoformat(item["due_date"]).date(),
+                        status="pending",
+                    ))
+            stage.status = "done"
+            stage.finished_at = datetime.utcnow()
+            session.commit()
+        meeting.status = "done"
+        session.commit()
+    finally:
+        session.close()
+
+
+def run(engine, label: str, persist) -> None:
+    database.Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    setup = Session()
+    run_migrations(setup)
+    setup.close()
+    ids = seed(Session)
+
+    started = time.perf_counter()
+    for meeting_id in ids:
+        persist(meeting_id, Session)
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+
+    session = sessionmaker(bind=engine)()
+    assert session.query(ActionItem).count() == MEETINGS * ITEMS
+    assert session.query(Meeting).filter(Meeting.status == "done").count() == MEETINGS
+    session.close()
+    print(f"{label:>60}: {MEETINGS / elapsed:7.1f} meetings/s | {elapsed / MEETINGS * 1000:6.2f} ms/meeting")
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    orchestrator.summarize_transcript = lambda transcript: SUMMARY
+    orchestrator.extract_action_items = lambda transcript, summary: ACTION_ITEMS
+    patterns = (
+        ("previous (8 commits, per-item adds)", previous_pattern),
+        ("process_meeting (3 commits, bulk items)", lambda meeting_id, Session: orchestrator.process_meeting(
+            meeting_id, session_factory=Session
+        )),
+    )
+    print(f"{MEETINGS} meetings, {ITEMS} action items each")
+    with tempfile.TemporaryDirectory() as tmp:
+        for engine_label, make_engine in (
+            ("default engine", lambda path: create_engine(f"sqlite:///{path}")),
+            ("init_engine profile", lambda path: database.init_engine(f"sqlite:///{path}", force=True)),
+        ):
+            for index, (label, persist) in enumerate(patterns):
+                path = Path(tmp) / f"{engine_label.split()[0]}-{index}.db"
+                run(make_engine(path), f"{engine_label}, {label}", persist)
+
+
+if __name__ == "__main__":
+    main()
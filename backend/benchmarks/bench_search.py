@@ -0,0 +1,116 @@
+"""
+Latency of GET /meetings/search on a large table.
+
+Seeds MEETINGS meetings into a temporary SQLite database, with transcripts
+drawn from a Zipf-distributed filler vocabulary plus topic words planted in
+a known share of meetings, builds the FTS index, then times queries by how
+many meetings they match. Ranking cost grows with the number of matches;
+a filler word present in nearly every meeting is the worst case.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_search
+"""
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    from backend.app import create_app
+    from backend.config import DefaultConfig
+    from backend.database import get_session
+    from backend.models import Meeting, MeetingContent
+    from backend.services.search import rebuild_search_index
+except ModuleNotFoundError:
+    from app import create_app
+    from config import DefaultConfig
+    from database import get_session
+    from models import Meeting, MeetingContent
+    from services.search import rebuild_search_index
+
+MEETINGS = 100_000
+WORDS_PER_TRANSCRIPT = 300
+ITERATIONS = 20
+FILLER = [f"word{index}" for index in range(2000)]
+FILLER_WEIGHTS = [1 / (rank + 1) for rank in range(len(FILLER))]
+# Topic word -> share of meetings that mention it
+TOPICS = {"zeppelin": 0.0001, "catering": 0.01, "venue": 0.02, "budget": 0.1, "roadmap": 0.3}
+
+
+def seed() -> None:
+    rng = random.Random(7)
+    session = get_session()
+    start = datetime(2025, 1, 1)
+    meetings, contents = [], []
+    for index in range(MEETINGS):
+        words = rng.choices(FILLER, FILLER_WEIGHTS, k=WORDS_PER_TRANSCRIPT)
+        for topic, share in TOPICS.items():
+            if rng.random() < share:
+                words[rng.randrange(len(words))] = topic
+        meetings.append({
+            "id": index + 1,
+            "title": f"Meeting {index}",
+            "status": "done",
+            "created_at": start + timedelta(minutes=index),
+        })
+        contents.append({"meeting_id": index + 1, "transcript": " ".join(words), "summary": " ".join(words[:20])})
+        if len(meetings) == 10_000:
+            session.bulk_insert_mappings(Meeting, meetings)
+            session.bulk_insert_mappings(MeetingContent, contents)
+            session.commit()
+            meetings, contents = [], []
+    # Bulk inserts bypass the ORM flush that maintains the index
+    started = time.perf_counter()
+    rebuild_search_index(session)
+    print(f"indexed {MEETINGS} meetings in {time.perf_counter() - started:.1f} s")
+    session.close()
+
+
+def measure(client, url: str) -> list[float]:
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        response = client.get(url)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200
+    return samples
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    os.environ.setdefault("MOCK_SUMMARY", "1")
+    with tempfile.TemporaryDirectory() as tmp:
+
+        class BenchConfig(DefaultConfig):
+            TESTING = True
+            ENABLE_BACKGROUND_JOBS = False
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{Path(tmp) / 'bench.db'}"
+            STORAGE_DIR = Path(tmp) / "uploads"
+
+        app = create_app(BenchConfig)
+        seed()
+        client = app.test_client()
+
+        cases = {
+            "0.01% of meetings": "/meetings/search?q=zeppelin",
+            "1% of meetings": "/meetings/search?q=catering",
+            "10% of meetings": "/meetings/search?q=budget",
+            "30% of meetings": "/meetings/search?q=roadmap",
+            "10% AND 30%": "/meetings/search?q=budget+roadmap",
+            "~100% (filler)": "/meetings/search?q=word0",
+        }
+        print(f"{MEETINGS} meetings, top 20 results")
+        for name, url in cases.items():
+            samples = measure(client, url)
+            print(f"{name:>18}: median {statistics.median(samples):.2f} ms | max {max(samples):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
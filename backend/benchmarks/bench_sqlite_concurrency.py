@@ -0,0 +1,150 @@
+"""
+Mixed readers and writers on one SQLite file, with SQLAlchemy's default
+engine (rollback journal) and with the ``init_engine`` profile (WAL,
+synchronous=NORMAL, busy_timeout, mmap, cache and an explicit pool).
+
+WRITERS threads replay the commit pattern of ``process_meeting`` (create,
+mark processing, store summary, add action items, mark done: one commit
+each) while READERS threads list the newest meetings and fetch one, as
+request threads do (pausing READER_PAUSE between requests), for DURATION
+seconds per engine. Reports throughput, read latency and "database is
+locked" errors.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_sqlite_concurrency
+"""
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import load_only, sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+try:
+    import backend.database as database
+    from backend.migrations import run_migrations
+    from backend.models import ActionItem, Meeting
+except ModuleNotFoundError:
+    import database
+    from migrations import run_migrations
+    from models import ActionItem, Meeting
+
+WRITERS = 4
+READERS = 8
+DURATION = 5.0
+# Pause between a reader's requests; without it the readers only measure GIL contention
+READER_PAUSE = 0.005
+TRANSCRIPT = "We reviewed the roadmap and agreed on next steps. " * 100
+
+
+def write_meeting(Session) -> None:
+    session = Session()
+    try:
+        meeting = Meeting(title="Bench", transcript=TRANSCRIPT, status="pending")
+        session.add(meeting)
+        session.commit()
+        meeting.status = "processing"
+        session.commit()
+        meeting.summary = "Roadmap review."
+        session.commit()
+        meeting.action_items.extend(ActionItem(description=f"Task {index}") for index in range(3))
+        session.commit()
+        meeting.status = "done"
+        session.commit()
+    finally:
+        session.close()
+
+
+def read_meetings(Session, rng: random.Random) -> None:
+    session = Session()
+    try:
+        page = (
+            session.query(Meeting)
+            .options(load_only(Meeting.id, Meeting.title, Meeting.status, Meeting.created_at))
+            .order_by(Meeting.created_at.desc(), Meeting.id.desc())
+            .limit(50)
+            .all()
+        )
+        if page:
+            meeting = session.get(Meeting, rng.choice(page).id)
+            _ = meeting.summary, len(meeting.action_items)
+    finally:
+        session.close()
+
+
+def run(engine, label: str) -> None:
+    database.Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    setup = Session()
+    run_migrations(setup)
+    setup.close()
+    for _ in range(20):
+        write_meeting(Session)
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    counts = {"meetings written": 0, "reads": 0, "locked errors": 0}
+    read_latencies = []
+
+    def writer() -> None:
+        while not stop.is_set():
+            try:
+                write_meeting(Session)
+                with lock:
+                    counts["meetings written"] += 1
+            except OperationalError:
+                with lock:
+                    counts["locked errors"] += 1
+
+    def reader(seed: int) -> None:
+        rng = random.Random(seed)
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                read_meetings(Session, rng)
+            except OperationalError:
+                with lock:
+                    counts["locked errors"] += 1
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                counts["reads"] += 1
+                read_latencies.append(elapsed)
+            stop.wait(READER_PAUSE)
+
+    threads = [threading.Thread(target=writer) for _ in range(WRITERS)]
+    threads += [threading.Thread(target=reader, args=(index,)) for index in range(READERS)]
+    for thread in threads:
+        thread.start()
+    time.sleep(DURATION)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    latencies = sorted(read_latencies) or [0.0]
+    print(
+        f"{label:>28}: {counts['meetings written'] / DURATION:6.1f} meetings/s written | "
+        f"{counts['reads'] / DURATION:7.1f} reads/s | read median {statistics.median(latencies):.2f} ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)]:.2f} ms | {counts['locked errors']} locked errors"
+    )
+
+
+def main() -> None:
+    logging.disable(logging.WARNING)
+    print(f"{WRITERS} writers, {READERS} readers, {DURATION:.0f} s each")
+    with tempfile.TemporaryDirectory() as tmp:
+        run(create_engine(f"sqlite:///{Path(tmp) / 'default.db'}"), "default engine")
+        run(database.init_engine(f"sqlite:///{Path(tmp) / 'profile.db'}", force=True), "init_engine profile")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,78 @@ from pathlib import Path
 class DefaultConfig:
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///meeting_agent.db")
     SQLALCHEMY_ECHO = False
+    # Connection pool shared by request threads and background workers
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # SQLite file databases run in WAL mode with these per-connection settings
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_MMAP_SIZE_MB = int(os.getenv("SQLITE_MMAP_SIZE_MB", "256"))
+    SQLITE_CACHE_SIZE_MB = int(os.getenv("SQLITE_CACHE_SIZE_MB", "64"))
     WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+    WHISPER_PRELOAD = os.getenv("WHISPER_PRELOAD", "true").lower() == "true"
+    WHISPER_MEMORY_BUDGET_MB = int(os.getenv("WHISPER_MEMORY_BUDGET_MB", "0"))  # 0 = unlimited
+    # Segmented mode splits long audio at silences and transcribes it in a process pool
+    WHISPER_SEGMENTED = os.getenv("WHISPER_SEGMENTED", "false").lower() == "true"
+    WHISPER_SEGMENT_SECONDS = float(os.getenv("WHISPER_SEGMENT_SECONDS", "120"))
+    WHISPER_WORKERS = int(os.getenv("WHISPER_WORKERS", "0"))  # 0 = one per CPU core; capped by the memory budget
     TRANSCRIPTION_PROVIDER = os.getenv("TRANSCRIPTION_PROVIDER", "assemblyai")
     ASSEMBLYAI_API_KEY = os.getenv("ASSEMBLYAI_API_KEY", "")
     ASSEMBLYAI_BASE_URL = os.getenv("ASSEMBLYAI_BASE_URL", "https://api.assemblyai.com/v2")
     ASSEMBLYAI_MODEL = os.getenv("ASSEMBLYAI_MODEL")
     ASSEMBLYAI_POLL_INTERVAL = float(os.getenv("ASSEMBLYAI_POLL_INTERVAL", "3"))
     ASSEMBLYAI_POLL_TIMEOUT = float(os.getenv("ASSEMBLYAI_POLL_TIMEOUT", "600"))
+    ASSEMBLYAI_POLL_MAX_INTERVAL = float(os.getenv("ASSEMBLYAI_POLL_MAX_INTERVAL", "30"))
+    ASSEMBLYAI_CONNECT_TIMEOUT = float(os.getenv("ASSEMBLYAI_CONNECT_TIMEOUT", "5"))
+    ASSEMBLYAI_READ_TIMEOUT = float(os.getenv("ASSEMBLYAI_READ_TIMEOUT", "60"))
+    ASSEMBLYAI_MAX_RETRIES = int(os.getenv("ASSEMBLYAI_MAX_RETRIES", "3"))
+    ASSEMBLYAI_POOL_MAXSIZE = int(os.getenv("ASSEMBLYAI_POOL_MAXSIZE", "10"))
+    # Public URL of /webhooks/assemblyai; when set, workers don't wait for transcripts
+    ASSEMBLYAI_WEBHOOK_URL = os.getenv("ASSEMBLYAI_WEBHOOK_URL", "")
+    ASSEMBLYAI_WEBHOOK_SECRET = os.getenv("ASSEMBLYAI_WEBHOOK_SECRET", "")
+    # Poll AssemblyAI for meetings whose webhook has not arrived after this long
+    ASSEMBLYAI_WEBHOOK_TIMEOUT = float(os.getenv("ASSEMBLYAI_WEBHOOK_TIMEOUT", "900"))
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
     GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+    # Transcripts longer than the threshold are summarized map-reduce style
+    SUMMARY_CHUNK_THRESHOLD_TOKENS = int(os.getenv("SUMMARY_CHUNK_THRESHOLD_TOKENS", "8000"))
+    SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "4000"))
+    SUMMARY_CHUNK_OVERLAP_TOKENS = int(os.getenv("SUMMARY_CHUNK_OVERLAP_TOKENS", "200"))
+    SUMMARY_MAX_WORKERS = int(os.getenv("SUMMARY_MAX_WORKERS", "4"))
+    # "fused" asks Gemini for summary + action items in one call; "separate" uses two
+    # sequential calls; "concurrent" runs the two calls at once on the transcript alone
+    MINUTES_MODE = os.getenv("MINUTES_MODE", "separate")
+    # Persistent cache of Gemini summaries / action items keyed by transcript hash
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "llm_cache.db")
+    LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
     ENABLE_BACKGROUND_JOBS = os.getenv("ENABLE_BACKGROUND_JOBS", "true").lower() == "true"
+    # Durable job queue (jobs table): worker threads, lease length and retry policy
+    BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", "2"))
+    JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+    JOB_VISIBILITY_TIMEOUT = float(os.getenv("JOB_VISIBILITY_TIMEOUT", "900"))
+    JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+    JOB_RETRY_BACKOFF = float(os.getenv("JOB_RETRY_BACKOFF", "30"))
+    # Waiting jobs allowed per priority lane before POST /meetings answers 429
+    JOB_QUEUE_MAX_DEPTH = int(os.getenv("JOB_QUEUE_MAX_DEPTH", "100"))
+    # Done jobs older than this are deleted by the workers; failed jobs are kept
+    JOB_RETENTION_HOURS = float(os.getenv("JOB_RETENTION_HOURS", "168"))
+    # GET /meetings page size when no limit is given, and the largest allowed limit
+    MEETINGS_PAGE_DEFAULT_LIMIT = int(os.getenv("MEETINGS_PAGE_DEFAULT_LIMIT", "50"))
+    MEETINGS_PAGE_MAX_LIMIT = int(os.getenv("MEETINGS_PAGE_MAX_LIMIT", "200"))
+    # POST /meetings/batch: meetings per INSERT/enqueue chunk, and per request
+    MEETINGS_BATCH_CHUNK_SIZE = int(os.getenv("MEETINGS_BATCH_CHUNK_SIZE", "500"))
+    MEETINGS_BATCH_MAX_ITEMS = int(os.getenv("MEETINGS_BATCH_MAX_ITEMS", "10000"))
+    # Upper bound for GET /meetings/<id>?wait= long-polls
+    MEETING_LONG_POLL_MAX_SECONDS = float(os.getenv("MEETING_LONG_POLL_MAX_SECONDS", "30"))
+    # GET /meetings/<id>/events: keep-alive comments, cross-process re-read interval, stream lifetime
+    SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+    SSE_RECHECK_SECONDS = float(os.getenv("SSE_RECHECK_SECONDS", "5"))
+    SSE_MAX_STREAM_SECONDS = float(os.getenv("SSE_MAX_STREAM_SECONDS", "300"))
+    # Threads serving ordinary (non-streaming) requests per ASGI worker process
+    WSGI_THREADS = int(os.getenv("WSGI_THREADS", "32"))
     STORAGE_DIR = Path(os.getenv("STORAGE_DIR", "backend/uploads"))
     TESTING = False
     MAX_CONTENT_LENGTH = 100 * 1024 * 1024  # 100 MB uploads
@@ -22,3 +84,4 @@ class DefaultConfig:
     # Supervisor Integration Agent settings
     SUPERVISOR_TIMEOUT = int(os.getenv("SUPERVISOR_TIMEOUT", "30000"))  # 30 seconds in ms
     SUPERVISOR_AGENT_NAME = os.getenv("SUPERVISOR_AGENT_NAME", "meeting_followup_agent")
+    SUPERVISOR_MINUTES_MODE = os.getenv("SUPERVISOR_MINUTES_MODE", "concurrent")
@@ -1,14 +1,42 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import scoped_session, sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
 
 Base = declarative_base()
 _engine = None
 SessionLocal = scoped_session(sessionmaker(autoflush=False, autocommit=False))
 
 
-def init_engine(database_url: str, echo: bool = False, force: bool = False):
+def _sqlite_pragmas(busy_timeout_ms: int, mmap_size_mb: int, cache_size_mb: int) -> list[str]:
+    """
+    Per-connection settings for a file database shared by request threads and
+    background writers. WAL lets readers run while a writer commits, and
+    NORMAL sync is durable in WAL except for the last commits on power loss.
+    """
+    return [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={busy_timeout_ms}",
+        f"PRAGMA mmap_size={mmap_size_mb * 1024 * 1024}",
+        f"PRAGMA cache_size=-{cache_size_mb * 1024}",  # negative = KiB
+    ]
+
+
+def init_engine(
+    database_url: str,
+    echo: bool = False,
+    force: bool = False,
+    pool_size: int = 10,
+    max_overflow: int = 20,
+    pool_timeout: float = 30.0,
+    pool_recycle: int = 1800,
+    sqlite_busy_timeout_ms: int = 5000,
+    sqlite_mmap_size_mb: int = 256,
+    sqlite_cache_size_mb: int = 64,
+):
     global _engine
 
     if _engine is not None and not force:
@@ -18,7 +46,42 @@ def init_engine(database_url: str, echo: bool = False, force: bool = False):
         SessionLocal.remove()
         _engine.dispose()
 
-    _engine = create_engine(database_url, echo=echo, future=True)
+    url = make_url(database_url)
+    if url.drivername in ("postgres", "postgresql"):
+        # Hosted Postgres URLs name no driver; use psycopg 3 (see requirements.txt)
+        url = url.set(drivername="postgresql+psycopg")
+    options = {"echo": echo, "future": True}
+    pragmas = []
+    if url.get_backend_name() == "sqlite":
+        if url.database and url.database != ":memory:" and "mode=memory" not in str(url):
+            # Connections are shared across worker threads through the pool
+            options.update(
+                poolclass=QueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                connect_args={"check_same_thread": False, "timeout": sqlite_busy_timeout_ms / 1000},
+            )
+            pragmas = _sqlite_pragmas(sqlite_busy_timeout_ms, sqlite_mmap_size_mb, sqlite_cache_size_mb)
+    else:
+        options.update(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=True,
+        )
+
+    _engine = create_engine(url, **options)
+    if pragmas:
+
+        @event.listens_for(_engine, "connect")
+        def _apply_pragmas(dbapi_connection, connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
     SessionLocal.configure(bind=_engine)
     return _engine
 
@@ -1,14 +1,64 @@
 """
-Simple database migration utilities.
-Safely adds missing columns to existing tables.
+Versioned database migrations.
+
+Each migration is a numbered step in ``MIGRATIONS``. Applied versions are
+recorded in the ``schema_migrations`` table, so startup only runs steps a
+database has not seen yet. The steps stay idempotent (they inspect the live
+schema first) because databases created before the table existed already
+have some of them, and ``init_db`` creates new databases at the latest
+schema. DDL is compiled for the connected dialect, SQLite or PostgreSQL.
 """
 import logging
-from sqlalchemy import text
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Union
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    insert,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.types import TypeEngine
+
+try:
+    from backend.models import MeetingContent
+    from backend.services.search import ensure_search_index, rebuild_search_index, search_index_exists
+except ModuleNotFoundError:
+    from models import MeetingContent
+    from services.search import ensure_search_index, rebuild_search_index, search_index_exists
 
 logger = logging.getLogger(__name__)
 
+# Arbitrary key for the PostgreSQL advisory lock that serializes concurrent startups
+MIGRATION_LOCK_KEY = 73125
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
 
-def add_column_if_not_exists(session, table_name: str, column_name: str, column_definition: str) -> bool:
+
+def column_exists(session, table_name: str, column_name: str) -> bool:
+    """Whether ``table_name`` has ``column_name``."""
+    columns = inspect(session.connection()).get_columns(table_name)
+    return any(column["name"] == column_name for column in columns)
+
+
+def add_column_if_not_exists(
+    session, table_name: str, column_name: str, column_type: Union[TypeEngine, str], constraints: str = ""
+) -> bool:
     """
     Add a column to a table if it doesn't exist.
 
@@ -16,25 +66,22 @@ def add_column_if_not_exists(session, table_name: str, column_name: str, column_
         session: SQLAlchemy session
         table_name: Name of the table
         column_name: Name of the column to add
-        column_definition: SQL column definition (e.g., "TEXT", "INTEGER NOT NULL DEFAULT 0")
+        column_type: SQLAlchemy type (compiled for the connected dialect) or SQL type name
+        constraints: Trailing column constraints (e.g., "NOT NULL DEFAULT 0")
 
     Returns:
         True if column was added, False if it already existed
     """
     try:
-        # Check if column exists (SQLite specific)
-        result = session.execute(
-            text(f"SELECT COUNT(*) FROM pragma_table_info('{table_name}') WHERE name='{column_name}'")
-        )
-        exists = result.scalar() > 0
-
-        if exists:
+        if column_exists(session, table_name, column_name):
             logger.debug(f"Column {table_name}.{column_name} already exists")
             return False
 
-        # Add the column
+        if isinstance(column_type, TypeEngine):
+            column_type = column_type.compile(dialect=session.get_bind().dialect)
+        definition = f"{column_type} {constraints}".strip()
         logger.info(f"Adding column {table_name}.{column_name}...")
-        session.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_definition}"))
+        session.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {definition}"))
         session.commit()
         logger.info(f"✓ Added column {table_name}.{column_name}")
         return True
@@ -45,16 +92,195 @@ def add_column_if_not_exists(session, table_name: str, column_name: str, column_
         raise
 
 
-def run_migrations(session):
+def create_index_if_not_exists(session, index_name: str, table_name: str, columns: str) -> None:
     """
-    Run all database migrations.
-    This function is safe to call multiple times - it only applies changes that haven't been applied yet.
+    Create an index if it doesn't exist.
+
+    Args:
+        session: SQLAlchemy session
+        index_name: Name of the index
+        table_name: Name of the table
+        columns: Comma-separated column list (e.g., "status, created_at")
     """
-    migrations_applied = 0
+    try:
+        session.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({columns})"))
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Failed to create index {index_name}: {e}")
+        raise
+
+
+def move_meeting_text_out_of_row(session, batch_size: int = 500) -> bool:
+    """
+    Move inline ``meetings.transcript``/``summary`` into compressed ``meeting_contents`` rows.
+
+    Runs in one transaction, then drops the old columns (SQLite 3.35+; older
+    versions just clear them). The freed pages are reused by new rows; run
+    ``VACUUM`` to shrink the file.
+
+    Returns:
+        True if the old columns were present and have been moved
+    """
+    columns = [name for name in ("transcript", "summary") if column_exists(session, "meetings", name)]
+    if not columns:
+        return False
+
+    selected = ", ".join(name if name in columns else f"NULL AS {name}" for name in ("transcript", "summary"))
+    present = " OR ".join(f"{name} IS NOT NULL" for name in columns)
+    moved = 0
+    last_id = 0
+    try:
+        while True:
+            rows = session.execute(
+                text(
+                    f"SELECT id, {selected} FROM meetings WHERE id > :last_id AND ({present}) "
+                    f"ORDER BY id LIMIT :batch_size"
+                ),
+                {"last_id": last_id, "batch_size": batch_size},
+            ).all()
+            if not rows:
+                break
+            session.execute(
+                insert(MeetingContent.__table__),
+                [{"meeting_id": row.id, "transcript": row.transcript, "summary": row.summary} for row in rows],
+            )
+            moved += len(rows)
+            last_id = rows[-1].id
+
+        for name in columns:
+            try:
+                with session.begin_nested():
+                    session.execute(text(f"ALTER TABLE meetings DROP COLUMN {name}"))
+            except OperationalError:
+                logger.info("Cannot drop meetings.%s on this database version; clearing it instead", name)
+                session.execute(text(f"UPDATE meetings SET {name} = NULL"))
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Failed to move meeting transcripts to meeting_contents: {e}")
+        raise
+
+    logger.info(f"✓ Moved {moved} meeting transcript(s)/summaries to meeting_contents")
+    return True
+
+
+def _add_error_message(session) -> None:
+    add_column_if_not_exists(session, "meetings", "error_message", Text())
+
+
+def _add_transcription_id(session) -> None:
+    add_column_if_not_exists(session, "meetings", "transcription_id", String(255))
+    create_index_if_not_exists(session, "ix_meetings_transcription_id", "meetings", "transcription_id")
+
+
+def _add_audio_sha256(session) -> None:
+    add_column_if_not_exists(session, "meetings", "audio_sha256", String(64))
+    create_index_if_not_exists(session, "ix_meetings_audio_sha256", "meetings", "audio_sha256")
+
+
+def _add_job_priority_and_timings(session) -> None:
+    add_column_if_not_exists(session, "jobs", "priority", Integer(), "NOT NULL DEFAULT 1")
+    add_column_if_not_exists(session, "jobs", "started_at", DateTime())
+    add_column_if_not_exists(session, "jobs", "finished_at", DateTime())
+    create_index_if_not_exists(
+        session, "ix_jobs_status_priority_available_at", "jobs", "status, priority, available_at"
+    )
+
+
+def _add_listing_indexes(session) -> None:
+    create_index_if_not_exists(session, "ix_meetings_created_at_id", "meetings", "created_at, id")
+    create_index_if_not_exists(session, "ix_meetings_status_created_at", "meetings", "status, created_at, id")
+    create_index_if_not_exists(
+        session, "ix_meetings_source_agent_created_at", "meetings", "source_agent, created_at, id"
+    )
+    create_index_if_not_exists(session, "ix_jobs_status_locked_until", "jobs", "status, locked_until")
+    create_index_if_not_exists(session, "ix_jobs_status_finished_at", "jobs", "status, finished_at")
+
+
+def _add_meeting_version(session) -> None:
+    add_column_if_not_exists(session, "meetings", "version", Integer(), "NOT NULL DEFAULT 1")
+
+
+def _move_meeting_text(session) -> None:
+    # An index built by migration 7 from the old columns is rebuilt from the new table
+    if move_meeting_text_out_of_row(session) and search_index_exists(session):
+        rebuild_search_index(session)
 
-    # Migration 1: Add error_message column to meetings table
-    if add_column_if_not_exists(session, "meetings", "error_message", "TEXT"):
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable
+
+
+MIGRATIONS = [
+    Migration(1, "Add meetings.error_message", _add_error_message),
+    Migration(2, "Track AssemblyAI jobs completed through the webhook", _add_transcription_id),
+    Migration(3, "Content hash of uploaded audio for transcript reuse", _add_audio_sha256),
+    Migration(4, "Priority lanes and timings for the job queue", _add_job_priority_and_timings),
+    Migration(
+        5,
+        "Composite indexes for listing meetings by recency, status and source agent, "
+        "and for the job queue's lease and timing lookups",
+        _add_listing_indexes,
+    ),
+    Migration(6, "Per-meeting version counter for ETags and long-polling", _add_meeting_version),
+    Migration(7, "FTS5 full-text index over meeting titles, transcripts and summaries (SQLite)", ensure_search_index),
+    Migration(8, "Transcripts and summaries stored compressed in meeting_contents", _move_meeting_text),
+]
+
+
+def applied_versions(session) -> set:
+    schema_migrations.create(session.connection(), checkfirst=True)
+    session.commit()
+    return set(session.execute(select(schema_migrations.c.version)).scalars())
+
+
+def _apply_pending(session) -> int:
+    applied = applied_versions(session)
+    migrations_applied = 0
+    for migration in MIGRATIONS:
+        if migration.version in applied:
+            continue
+        logger.info(f"Applying migration {migration.version}: {migration.description}")
+        migration.apply(session)
+        try:
+            session.execute(
+                insert(schema_migrations).values(
+                    version=migration.version,
+                    description=migration.description[:255],
+                    applied_at=datetime.utcnow(),
+                )
+            )
+            session.commit()
+        except IntegrityError:
+            # Another process starting at the same time recorded it first
+            session.rollback()
         migrations_applied += 1
+    return migrations_applied
+
+
+def run_migrations(session):
+    """
+    Apply every migration this database has not recorded yet.
+    This function is safe to call multiple times; once a database is current it only reads ``schema_migrations``.
+    """
+    bind = session.get_bind()
+    if bind.dialect.name == "postgresql":
+        # Hold an advisory lock on a dedicated connection while other processes wait
+        with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as lock:
+            lock.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            try:
+                migrations_applied = _apply_pending(session)
+            finally:
+                lock.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+    else:
+        migrations_applied = _apply_pending(session)
+
+    # Also registers an existing search index with this engine on startups that apply nothing
+    ensure_search_index(session)
 
     if migrations_applied > 0:
         logger.info(f"Applied {migrations_applied} database migration(s)")
@@ -1,10 +1,24 @@
 from __future__ import annotations
 
+import zlib
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    TypeDecorator,
+    UniqueConstraint,
+    event,
+)
+from sqlalchemy.orm import Session, relationship
 
 try:
     from backend.database import Base
@@ -12,23 +26,98 @@ except ModuleNotFoundError:
     from database import Base
 
 
+def compress_text(value: str | None) -> bytes | None:
+    return zlib.compress(value.encode("utf-8"), 6) if value is not None else None
+
+
+def decompress_text(value: bytes | None) -> str | None:
+    return zlib.decompress(value).decode("utf-8") if value is not None else None
+
+
+class CompressedText(TypeDecorator):
+    """Text stored zlib-compressed in a BLOB column."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return compress_text(value)
+
+    def process_result_value(self, value, dialect):
+        return decompress_text(value)
+
+
 class Meeting(Base):
     __tablename__ = "meetings"
     __allow_unmapped__ = True
+    # Access paths: newest-first listing (keyset on created_at, id), optionally
+    # filtered by status or source_agent. Mirrored in migrations.py.
+    __table_args__ = (
+        Index("ix_meetings_created_at_id", "created_at", "id"),
+        Index("ix_meetings_status_created_at", "status", "created_at", "id"),
+        Index("ix_meetings_source_agent_created_at", "source_agent", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     audio_url = Column(String(1024), nullable=True)
-    transcript = Column(Text, nullable=True)
-    summary = Column(Text, nullable=True)
     status = Column(String(50), default="pending", nullable=False)
     source_agent = Column(String(255), nullable=True)
     error_message = Column(Text, nullable=True)
+    transcription_id = Column(String(255), nullable=True, index=True)
+    audio_sha256 = Column(String(64), nullable=True, index=True)
+    # Bumped on every change to the meeting, its action items or its stages (ETags, long-polls)
+    version = Column(Integer, default=1, nullable=False)
 
     action_items: List["ActionItem"] = relationship(
         "ActionItem", back_populates="meeting", cascade="all, delete-orphan"
     )
+    stages: List["MeetingStage"] = relationship(
+        "MeetingStage", back_populates="meeting", cascade="all, delete-orphan", order_by="MeetingStage.id"
+    )
+    # Transcript and summary live out of row, compressed, and load on first access
+    content: "MeetingContent" = relationship(
+        "MeetingContent", back_populates="meeting", uselist=False, cascade="all, delete-orphan"
+    )
+
+    def _content_for_write(self, value) -> "MeetingContent | None":
+        if self.content is None and value is not None:
+            self.content = MeetingContent()
+        return self.content
+
+    @property
+    def transcript(self) -> str | None:
+        return self.content.transcript if self.content is not None else None
+
+    @transcript.setter
+    def transcript(self, value: str | None) -> None:
+        content = self._content_for_write(value)
+        if content is not None:
+            content.transcript = value
+
+    @property
+    def summary(self) -> str | None:
+        return self.content.summary if self.content is not None else None
+
+    @summary.setter
+    def summary(self, value: str | None) -> None:
+        content = self._content_for_write(value)
+        if content is not None:
+            content.summary = value
+
+
+class MeetingContent(Base):
+    """A meeting's transcript and summary, kept out of the ``meetings`` row."""
+
+    __tablename__ = "meeting_contents"
+    __allow_unmapped__ = True
+
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), primary_key=True)
+    transcript = Column(CompressedText, nullable=True)
+    summary = Column(CompressedText, nullable=True)
+
+    meeting = relationship("Meeting", back_populates="content")
 
 
 class ActionItem(Base):
@@ -43,3 +132,85 @@ class ActionItem(Base):
     status = Column(String(50), default="pending", nullable=False)
 
     meeting = relationship("Meeting", back_populates="action_items")
+
+
+class MeetingStage(Base):
+    """Checkpoint of one pipeline stage (transcribe, summarize, extract) for a meeting."""
+
+    __tablename__ = "meeting_stages"
+    __allow_unmapped__ = True
+    __table_args__ = (UniqueConstraint("meeting_id", "name", name="uq_meeting_stages_meeting_name"),)
+
+    id = Column(Integer, primary_key=True)
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), nullable=False, index=True)
+    name = Column(String(50), nullable=False)
+    status = Column(String(50), default="pending", nullable=False)
+    model = Column(String(255), nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    duration_ms = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+
+    meeting = relationship("Meeting", back_populates="stages")
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_meeting_versions(session: Session, flush_context, instances) -> None:
+    """Increment ``Meeting.version`` once per flush for every meeting whose data changed."""
+    changed = session.info.setdefault("changed_meeting_ids", set())
+    bumped = set()
+    for obj in list(session.dirty) + list(session.new) + list(session.deleted):
+        if isinstance(obj, Meeting):
+            meeting = obj
+            if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+                continue
+        elif isinstance(obj, (ActionItem, MeetingStage, MeetingContent)):
+            meeting = obj.meeting or (session.get(Meeting, obj.meeting_id) if obj.meeting_id else None)
+        else:
+            continue
+        if meeting is None or meeting.id is None or meeting.id in bumped or meeting in session.deleted:
+            continue
+        bumped.add(meeting.id)
+        # SQL-side increment so concurrent writers never lose a bump
+        meeting.version = Meeting.version + 1
+    changed.update(bumped)
+
+
+class AudioTranscript(Base):
+    __tablename__ = "audio_transcripts"
+    __table_args__ = (UniqueConstraint("audio_sha256", "provider", "model", name="uq_audio_transcripts_audio"),)
+
+    id = Column(Integer, primary_key=True)
+    audio_sha256 = Column(String(64), nullable=False)
+    provider = Column(String(50), nullable=False)
+    model = Column(String(255), nullable=False)
+    transcript = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class Job(Base):
+    """Durable background job; see services/background.py."""
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_priority_available_at", "status", "priority", "available_at"),
+        Index("ix_jobs_status_locked_until", "status", "locked_until"),
+        Index("ix_jobs_status_finished_at", "status", "finished_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    task = Column(String(255), nullable=False)
+    payload = Column(Text, nullable=False, default="{}")
+    dedupe_key = Column(String(255), nullable=True, index=True)
+    status = Column(String(50), default="queued", nullable=False)
+    priority = Column(Integer, default=1, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, default=3, nullable=False)
+    available_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_until = Column(DateTime, nullable=True)
+    locked_by = Column(String(255), nullable=True)
+    last_error = Column(Text, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
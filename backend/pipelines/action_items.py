@@ -4,10 +4,28 @@ import json
 import os
 import re
 from dataclasses import asdict, dataclass
-from typing import List
-
-from langchain.prompts import ChatPromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
+from typing import List, Optional
+
+try:
+    from backend.services.llm import get_chat_model, get_prompt
+    from backend.services.llm_cache import get_llm_cache, make_cache_key
+except ModuleNotFoundError:
+    from services.llm import get_chat_model, get_prompt
+    from services.llm_cache import get_llm_cache, make_cache_key
+
+# Bump whenever the extraction prompt changes so cached results are not reused.
+PROMPT_VERSION = "action-items-v1"
+
+ACTION_ITEMS_PROMPT = (
+    (
+        "system",
+        "Extract actionable tasks from the meeting transcript. Return valid JSON array where each entry has description, owner, due_date (ISO8601 or null), and status.",
+    ),
+    (
+        "human",
+        "Transcript:\n{transcript}\n\nDo not add commentary. Return only JSON.",
+    ),
+)
 
 
 class ActionExtractionError(Exception):
@@ -22,6 +40,26 @@ class ActionItemRecord:
     status: str = "pending"
 
 
+def records_from_payload(payload: List[dict]) -> List[ActionItemRecord]:
+    """Convert a Gemini JSON array into records, dropping malformed entries."""
+    items: List[ActionItemRecord] = []
+    for entry in payload:
+        if not isinstance(entry, dict):
+            continue
+        description = (entry.get("description") or "").strip()
+        if not description:
+            continue
+        items.append(
+            ActionItemRecord(
+                description=description,
+                owner=(entry.get("owner") or None),
+                due_date=(entry.get("due_date") or None),
+                status=(entry.get("status") or "pending") or "pending",
+            )
+        )
+    return items
+
+
 def _rule_based_items(text: str) -> List[ActionItemRecord]:
     candidates: List[ActionItemRecord] = []
     pattern = re.compile(
@@ -48,43 +86,22 @@ def _gemini_items(text: str) -> List[ActionItemRecord]:  # pragma: no cover - ne
     api_key = os.getenv("GEMINI_API_KEY", "").strip()
     if not api_key:
         raise ActionExtractionError("GEMINI_API_KEY is required for action extraction")
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "Extract actionable tasks from the meeting transcript. Return valid JSON array where each entry has description, owner, due_date (ISO8601 or null), and status.",
-            ),
-            (
-                "human",
-                "Transcript:\n{transcript}\n\nDo not add commentary. Return only JSON.",
-            ),
-        ]
-    )
-    llm = ChatGoogleGenerativeAI(
-        model=os.getenv("GEMINI_MODEL", "gemini-2.5-flash"),
-        temperature=0,
-        google_api_key=api_key,
-        convert_system_message_to_human=True,
-    )
-    messages = prompt.format_messages(transcript=text)
+    model = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+    cache = get_llm_cache()
+    cache_key = make_cache_key("action_items", text, model, PROMPT_VERSION)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return [ActionItemRecord(**entry) for entry in cached]
+    llm = get_chat_model(model, temperature=0, api_key=api_key)
+    messages = get_prompt(ACTION_ITEMS_PROMPT).format_messages(transcript=text)
     response = llm.invoke(messages)
     raw_text = getattr(response, "content", "") or ""
     payload = _parse_json_array(raw_text)
-    items: List[ActionItemRecord] = []
-    for entry in payload:
-        if not isinstance(entry, dict):
-            continue
-        description = (entry.get("description") or "").strip()
-        if not description:
-            continue
-        items.append(
-            ActionItemRecord(
-                description=description,
-                owner=(entry.get("owner") or None),
-                due_date=(entry.get("due_date") or None),
-                status=(entry.get("status") or "pending") or "pending",
-            )
-        )
+    items = records_from_payload(payload or [])
+    # An unparseable reply is a transient failure, not "no action items"
+    if cache is not None and payload is not None:
+        cache.set(cache_key, [asdict(item) for item in items])
     return items
 
 
@@ -105,16 +122,17 @@ def extract_action_items(transcript: str, summary: str | None = None) -> List[di
     return [asdict(item) for item in items]
 
 
-def _parse_json_array(value: str) -> List[dict]:
+def _parse_json_array(value: str) -> Optional[List[dict]]:
+    """The JSON array in a model reply, or None when the reply is not one."""
     stripped = value.strip()
     if not stripped:
-        return []
+        return None
     if stripped.startswith("```"):
         stripped = re.sub(r"```(?:json)?", "", stripped).strip("`\n ")
     try:
         data = json.loads(stripped)
     except json.JSONDecodeError:
-        return []
+        return None
     if isinstance(data, dict) and "items" in data:
-        return data.get("items") or []
-    return data if isinstance(data, list) else []
+        data = data.get("items") or []
+    return data if isinstance(data, list) else None
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable
+
+try:
+    from backend.pipelines.action_items import extract_action_items, records_from_payload
+    from backend.pipelines.summarization import summarize_transcript
+    from backend.services.llm import get_chat_model, get_prompt, get_structured_model
+    from backend.services.llm_cache import get_llm_cache, make_cache_key
+except ModuleNotFoundError:
+    from pipelines.action_items import extract_action_items, records_from_payload
+    from pipelines.summarization import summarize_transcript
+    from services.llm import get_chat_model, get_prompt, get_structured_model
+    from services.llm_cache import get_llm_cache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the fused prompt changes so cached minutes are not reused.
+PROMPT_VERSION = "minutes-v1"
+
+MINUTES_PROMPT = (
+    (
+        "system",
+        "You are a meeting assistant. Read the meeting transcript and return a single JSON object with exactly two keys: "
+        '"summary": a summary of the meeting in {max_sentences} sentences or less, focused on key discussion points, '
+        "decisions made, and important topics covered; "
+        '"action_items": a JSON array where each entry has description, owner, due_date (ISO8601 or null), and status.',
+    ),
+    (
+        "human",
+        "Meeting Transcript:\n\n{transcript}\n\nDo not add commentary. Return only JSON.",
+    ),
+)
+
+# Response schema for the fused call; Gemini is constrained to it when the
+# integration supports structured output, and the prompt asks for the same shape.
+MINUTES_SCHEMA = {
+    "title": "MeetingMinutes",
+    "description": "Summary and action items of one meeting.",
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string", "description": "Summary of the meeting."},
+        "action_items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "description": {"type": "string"},
+                    "owner": {"type": "string", "nullable": True},
+                    "due_date": {"type": "string", "nullable": True, "description": "ISO8601 date or null"},
+                    "status": {"type": "string"},
+                },
+                "required": ["description"],
+            },
+        },
+    },
+    "required": ["summary", "action_items"],
+}
+
+
+def minutes_mode() -> str:
+    return os.getenv("MINUTES_MODE", "separate").lower()
+
+
+def fused_minutes_enabled() -> bool:
+    return minutes_mode() == "fused"
+
+
+@dataclass
+class StageOutcome:
+    """Result of one stage run off-thread, with its timing, for later checkpointing."""
+
+    started_at: datetime
+    duration_ms: int
+    value: Any = None
+    error: Exception | None = None
+
+    def result(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def _timed(func: Callable[..., Any], *args, **kwargs) -> StageOutcome:
+    started_at = datetime.utcnow()
+    start = time.perf_counter()
+    try:
+        value, error = func(*args, **kwargs), None
+    except Exception as exc:
+        value, error = None, exc
+    return StageOutcome(
+        started_at=started_at,
+        duration_ms=int((time.perf_counter() - start) * 1000),
+        value=value,
+        error=error,
+    )
+
+
+def run_stages_concurrently(transcript: str, max_sentences: int = 5) -> dict[str, StageOutcome]:
+    """
+    Summarize and extract action items at the same time from the transcript alone.
+
+    Wall-clock time becomes the slower of the two LLM round trips rather than
+    their sum. Both outcomes are returned once both finish; errors are captured
+    on the outcome instead of raised.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="minutes") as executor:
+        summary = executor.submit(_timed, summarize_transcript, transcript, max_sentences=max_sentences)
+        items = executor.submit(_timed, extract_action_items, transcript=transcript)
+        outcomes = {"summarize": summary.result(), "extract": items.result()}
+    logger.info(
+        "Concurrent minutes: summarize %d ms, extract %d ms, wall %d ms",
+        outcomes["summarize"].duration_ms,
+        outcomes["extract"].duration_ms,
+        int((time.perf_counter() - start) * 1000),
+    )
+    return outcomes
+
+
+def generate_fused_minutes(transcript: str, max_sentences: int = 5) -> dict | None:
+    """
+    Produce the summary and action items with a single Gemini call.
+
+    Returns None when the fused call is unavailable (mock mode, no API key)
+    or its response cannot be parsed, so callers can fall back to the
+    separate summarization and extraction stages.
+    """
+    cleaned = transcript.strip()
+    if not cleaned or os.getenv("MOCK_SUMMARY", "0") == "1":
+        return None
+    api_key = os.getenv("GEMINI_API_KEY", "").strip()
+    if not api_key:
+        return None
+
+    model = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+    cache = get_llm_cache()
+    cache_key = make_cache_key("minutes", cleaned, model, PROMPT_VERSION, max_sentences=max_sentences)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("Minutes served from LLM cache")
+            return cached
+
+    structured = get_structured_model(model, temperature=0, api_key=api_key, schema=MINUTES_SCHEMA)
+    llm = structured or get_chat_model(model, temperature=0, api_key=api_key)
+    messages = get_prompt(MINUTES_PROMPT).format_messages(transcript=cleaned, max_sentences=max_sentences)
+    logger.debug("Invoking Gemini for fused minutes (structured=%s)", structured is not None)
+    try:
+        response = llm.invoke(messages)
+    except Exception:
+        logger.exception("Fused minutes call failed; falling back to separate stages")
+        return None
+
+    if structured is not None:
+        result = _minutes_from_payload(response)
+    else:
+        result = _parse_minutes(getattr(response, "content", "") or "")
+    if result is None:
+        logger.warning("Unable to parse fused minutes response; falling back to separate stages")
+        return None
+    logger.info("Fused minutes generated (%d action items)", len(result["action_items"]))
+    if cache is not None:
+        cache.set(cache_key, result)
+    return result
+
+
+def generate_minutes(transcript: str, max_sentences: int = 5, mode: str | None = None) -> dict:
+    """
+    Return ``{"summary", "action_items"}``.
+
+    ``mode`` (default: MINUTES_MODE) is "separate" (summary, then extraction
+    using it), "concurrent" (both at once from the transcript) or "fused"
+    (one call, falling back to "separate").
+    """
+    mode = (mode or minutes_mode()).lower()
+    if mode == "fused":
+        result = generate_fused_minutes(transcript, max_sentences=max_sentences)
+        if result is not None:
+            return result
+    elif mode == "concurrent":
+        outcomes = run_stages_concurrently(transcript, max_sentences=max_sentences)
+        return {"summary": outcomes["summarize"].result(), "action_items": outcomes["extract"].result()}
+    summary = summarize_transcript(transcript, max_sentences=max_sentences)
+    action_items = extract_action_items(transcript=transcript, summary=summary)
+    return {"summary": summary, "action_items": action_items}
+
+
+def _parse_minutes(value: str) -> dict | None:
+    stripped = value.strip()
+    if stripped.startswith("```"):
+        stripped = re.sub(r"```(?:json)?", "", stripped).strip("`\n ")
+    try:
+        data = json.loads(stripped)
+    except json.JSONDecodeError:
+        return None
+    return _minutes_from_payload(data)
+
+
+def _minutes_from_payload(data: Any) -> dict | None:
+    if not isinstance(data, dict):
+        return None
+    summary = data.get("summary")
+    items = data.get("action_items")
+    if not isinstance(summary, str) or not summary.strip() or not isinstance(items, list):
+        return None
+    return {
+        "summary": summary.strip(),
+        "action_items": [asdict(item) for item in records_from_payload(items)],
+    }
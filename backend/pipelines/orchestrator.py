@@ -1,113 +1,390 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from typing import Callable
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Iterator
 
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 try:
     from backend.database import SessionLocal
-    from backend.models import ActionItem, Meeting
+    from backend.models import ActionItem, Meeting, MeetingStage
     from backend.pipelines.action_items import extract_action_items
+    from backend.pipelines.minutes import (
+        StageOutcome,
+        fused_minutes_enabled,
+        generate_fused_minutes,
+        minutes_mode,
+        run_stages_concurrently,
+    )
     from backend.pipelines.summarization import summarize_transcript
-    from backend.pipelines.transcription import transcribe_audio
+    from backend.pipelines.transcription import (
+        assemblyai_transcription_status,
+        assemblyai_webhook_enabled,
+        assemblyai_webhook_timeout,
+        fetch_assemblyai_transcription,
+        start_assemblyai_transcription,
+        transcribe_audio,
+        transcription_profile,
+    )
+    from backend.services.background import PermanentJobError, current_runner
+    from backend.services.events import get_event_broker
+    from backend.services.transcript_store import find_transcript, forget_transcript, store_transcript
 except ModuleNotFoundError:
     from database import SessionLocal
-    from models import ActionItem, Meeting
+    from models import ActionItem, Meeting, MeetingStage
     from pipelines.action_items import extract_action_items
+    from pipelines.minutes import (
+        StageOutcome,
+        fused_minutes_enabled,
+        generate_fused_minutes,
+        minutes_mode,
+        run_stages_concurrently,
+    )
     from pipelines.summarization import summarize_transcript
-    from pipelines.transcription import transcribe_audio
+    from pipelines.transcription import (
+        assemblyai_transcription_status,
+        assemblyai_webhook_enabled,
+        assemblyai_webhook_timeout,
+        fetch_assemblyai_transcription,
+        start_assemblyai_transcription,
+        transcribe_audio,
+        transcription_profile,
+    )
+    from services.background import PermanentJobError, current_runner
+    from services.events import get_event_broker
+    from services.transcript_store import find_transcript, forget_transcript, store_transcript
 
 logger = logging.getLogger(__name__)
 
 
 def _ensure_session(session_factory: Callable[[], Session] | None = None) -> Session:
-    factory = session_factory or SessionLocal
+    # Use a dedicated session rather than the thread-local one: when jobs run
+    # synchronously inside a request, closing it must not detach the request's objects.
+    factory = session_factory or SessionLocal.session_factory
     if factory is None:
         raise RuntimeError("Session factory is not configured")
     return factory()
 
 
+# Pipeline stages in execution order; each is checkpointed in meeting_stages
+STAGES = ("transcribe", "summarize", "extract")
+
+
+def _get_stage(meeting: Meeting, name: str) -> MeetingStage:
+    for stage in meeting.stages:
+        if stage.name == name:
+            return stage
+    stage = MeetingStage(meeting_id=meeting.id, name=name, status="pending")
+    meeting.stages.append(stage)
+    return stage
+
+
+def _stage_done(meeting: Meeting, name: str) -> bool:
+    return any(stage.name == name and stage.status == "done" for stage in meeting.stages)
+
+
+# Event published when a stage starts (see services/events.py and GET /meetings/<id>/events)
+STAGE_EVENTS = {"transcribe": "transcribing", "summarize": "summarizing", "extract": "extracting"}
+
+
+def _stage_timings(meeting: Meeting) -> dict:
+    return {
+        stage.name: {"status": stage.status, "model": stage.model, "duration_ms": stage.duration_ms}
+        for stage in meeting.stages
+    }
+
+
+def meeting_event(meeting: Meeting, name: str, **extra) -> dict:
+    data = {
+        "meeting_id": meeting.id,
+        "status": name,
+        "at": datetime.utcnow().isoformat(),
+        "stages": _stage_timings(meeting),
+    }
+    data.update(extra)
+    return data
+
+
+def publish_meeting_event(meeting: Meeting, name: str, **extra) -> None:
+    """Publish a pipeline transition for subscribers of this meeting's event stream."""
+    get_event_broker().publish(meeting.id, name, meeting_event(meeting, name, **extra))
+
+
+def _start_stage(
+    session: Session,
+    meeting: Meeting,
+    name: str,
+    model: str | None,
+    publish: bool = True,
+) -> MeetingStage:
+    stage = _get_stage(meeting, name)
+    stage.status = "running"
+    stage.model = model
+    stage.error = None
+    stage.started_at = datetime.utcnow()
+    stage.finished_at = None
+    stage.duration_ms = None
+    if publish:
+        publish_meeting_event(meeting, STAGE_EVENTS[name], stage=name, model=model)
+    return stage
+
+
+def _finish_stage(stage: MeetingStage, error: str | None = None, outcome: StageOutcome | None = None) -> None:
+    stage.status = "failed" if error else "done"
+    stage.error = error
+    if outcome is not None:
+        # The work already ran off-thread; keep its own timing
+        stage.started_at = outcome.started_at
+        stage.finished_at = outcome.started_at + timedelta(milliseconds=outcome.duration_ms)
+        stage.duration_ms = outcome.duration_ms
+        return
+    stage.finished_at = datetime.utcnow()
+    stage.duration_ms = int((stage.finished_at - stage.started_at).total_seconds() * 1000)
+
+
+@contextmanager
+def _checkpoint(
+    session: Session,
+    meeting: Meeting,
+    name: str,
+    model: str | None,
+    outcome: StageOutcome | None = None,
+) -> Iterator[MeetingStage]:
+    """
+    Record a stage as running, then done or failed, with its model and duration.
+
+    Nothing is committed here: ``process_meeting`` writes checkpoints in the
+    same transaction as the stage results, or with the failure if it stops.
+    """
+    # Concurrent stages announced themselves before they ran
+    stage = _start_stage(session, meeting, name, model, publish=outcome is None)
+    try:
+        yield stage
+    except Exception as e:
+        _finish_stage(stage, error=str(e), outcome=outcome)
+        raise
+    _finish_stage(stage, outcome=outcome)
+    logger.info("Meeting %s stage %s done in %d ms (model=%s)", meeting.id, name, stage.duration_ms, model)
+
+
+def _set_status(session: Session, meeting_id: int, status: str, **values) -> None:
+    """
+    Commit a status transition as one UPDATE of the meeting row.
+
+    Nothing else may be pending in the session. The version is bumped in the
+    same statement so long-polls and ETags see the transition.
+    """
+    session.execute(
+        update(Meeting)
+        .where(Meeting.id == meeting_id)
+        .values(status=status, version=Meeting.version + 1, **values)
+        .execution_options(synchronize_session=False)
+    )
+    session.info.setdefault("changed_meeting_ids", set()).add(meeting_id)
+    session.commit()
+
+
+def _action_item_rows(meeting_id: int, items: list[dict]) -> list[dict]:
+    rows = []
+    for item in items:
+        due = item.get("due_date")
+        due_date_obj = None
+        if due:
+            try:
+                due_date_obj = datetime.fromisoformat(due).date()
+            except ValueError:
+                logger.warning("Unable to parse due date '%s' for meeting %s", due, meeting_id)
+        rows.append({
+            "meeting_id": meeting_id,
+            "description": item.get("description", "").strip(),
+            "owner": item.get("owner"),
+            "due_date": due_date_obj,
+            "status": item.get("status", "pending"),
+        })
+    return rows
+
+
+def _replace_action_items(session: Session, meeting_id: int, items: list[dict]) -> None:
+    """Swap the meeting's action items with one DELETE and one multi-row INSERT."""
+    session.query(ActionItem).filter(ActionItem.meeting_id == meeting_id).delete(synchronize_session=False)
+    rows = _action_item_rows(meeting_id, items)
+    if rows:
+        # render_nulls keeps rows with and without optional fields in one statement
+        session.execute(insert(ActionItem).execution_options(render_nulls=True), rows)
+
+
+def _llm_model_name(mock_env: str, fallback: str) -> str:
+    if os.getenv(mock_env, "0") == "1":
+        return "mock"
+    if not os.getenv("GEMINI_API_KEY", "").strip():
+        return fallback
+    return os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+
+
+def reset_stages(session: Session, meeting: Meeting, from_stage: str) -> None:
+    """
+    Mark ``from_stage`` and every later stage incomplete so the next run repeats them.
+
+    Repeating ``transcribe`` also drops the transcript stored for this audio,
+    otherwise the run would just reuse it.
+    """
+    index = STAGES.index(from_stage)
+    for stage in meeting.stages:
+        if stage.name in STAGES[index:]:
+            stage.status = "pending"
+    if from_stage == "transcribe" and meeting.audio_url:
+        meeting.transcript = None
+        provider, model = transcription_profile()
+        forget_transcript(session, meeting.audio_sha256, provider, model)
+
+
 def process_meeting(meeting_id: int, session_factory: Callable[[], Session] | None = None) -> int:
+    """
+    Run the pipeline for a meeting, resuming at the first incomplete stage.
+
+    Completed stages are checkpointed in ``meeting.stages`` so a retry after
+    a summarization failure does not transcribe the audio again.
+    """
     session = _ensure_session(session_factory)
     meeting = None
     try:
         meeting = session.get(Meeting, meeting_id)
         if meeting is None:
-            raise ValueError(f"Meeting {meeting_id} not found")
+            raise PermanentJobError(f"Meeting {meeting_id} not found")
 
-        meeting.status = "processing"
-        meeting.error_message = None
-        session.commit()
+        _set_status(session, meeting_id, "processing", error_message=None)
 
         # Get or transcribe the transcript
         transcript = (meeting.transcript or "").strip()
+        if transcript and not _stage_done(meeting, "transcribe"):
+            # Transcript supplied by the client rather than produced by a provider
+            _finish_stage(_start_stage(session, meeting, "transcribe", "provided", publish=False))
         if not transcript and meeting.audio_url:
-            logger.info("Transcribing audio for meeting %s from %s", meeting.id, meeting.audio_url)
-            try:
-                transcript = transcribe_audio(meeting.audio_url)
-                if not transcript or len(transcript.strip()) == 0:
-                    raise ValueError("Transcription returned empty content")
-                meeting.transcript = transcript
+            # Identical audio transcribed before with the same provider/model is reused
+            provider, model = transcription_profile()
+            transcript = find_transcript(session, meeting.audio_sha256, provider, model) or ""
+            if transcript:
+                with _checkpoint(session, meeting, "transcribe", f"{provider}/{model}"):
+                    meeting.transcript = transcript
+                session.commit()
+                logger.info("Reused stored transcript for meeting %s (%d chars)", meeting.id, len(transcript))
+            elif assemblyai_webhook_enabled():
+                # Hand off to AssemblyAI; the webhook resumes this meeting when done,
+                # so the stage stays "running" until complete_assemblyai_transcription
+                stage = _start_stage(session, meeting, "transcribe", f"{provider}/{model}")
+                try:
+                    meeting.transcription_id = start_assemblyai_transcription(meeting.audio_url)
+                except Exception as e:
+                    _finish_stage(stage, error=str(e))
+                    raise ValueError(f"Transcription failed: {str(e)}") from e
+                meeting.status = "transcribing"
+                session.commit()
+                logger.info("Meeting %s awaiting AssemblyAI webhook for %s", meeting.id, meeting.transcription_id)
+                # Poll instead if the webhook is lost (wrong public URL, secret mismatch, dropped delivery)
+                schedule_transcription_reconcile(meeting.id)
+                return meeting.id
+            else:
+                logger.info("Transcribing audio for meeting %s from %s", meeting.id, meeting.audio_url)
+                try:
+                    with _checkpoint(session, meeting, "transcribe", f"{provider}/{model}"):
+                        transcript = transcribe_audio(meeting.audio_url)
+                        if not transcript or len(transcript.strip()) == 0:
+                            raise ValueError("Transcription returned empty content")
+                        meeting.transcript = transcript
+                except Exception as e:
+                    error_msg = f"Transcription failed: {str(e)}"
+                    logger.error(error_msg)
+                    raise ValueError(error_msg) from e
+                # Transcripts are committed as soon as they exist: a retry must not pay for them again
                 session.commit()
                 logger.info("Transcription completed for meeting %s (%d chars)", meeting.id, len(transcript))
-            except Exception as e:
-                error_msg = f"Transcription failed: {str(e)}"
-                logger.error(error_msg)
-                raise ValueError(error_msg) from e
+                store_transcript(session, meeting.audio_sha256, provider, model, transcript)
 
         # Validate transcript
         if not transcript or len(transcript.strip()) < 10:
-            raise ValueError("Transcript is too short or empty. Need at least 10 characters of meaningful content.")
+            raise PermanentJobError("Transcript is too short or empty. Need at least 10 characters of meaningful content.")
 
         logger.info("Processing meeting %s with transcript length: %d", meeting.id, len(transcript))
 
+        summary_done = _stage_done(meeting, "summarize") and bool(meeting.summary)
+        extract_done = _stage_done(meeting, "extract")
+        summary_model = _llm_model_name("MOCK_SUMMARY", "none")
+        extract_model = _llm_model_name("MOCK_ACTION_ITEMS", "rules")
+
+        # Fused mode: summary and action items from a single Gemini call
+        fused = None
+        if fused_minutes_enabled() and not summary_done and not extract_done:
+            fused = generate_fused_minutes(transcript)
+            if fused:
+                summary_model = extract_model = f"{summary_model} (fused)"
+
+        # Concurrent mode: summary and action items from the transcript at the same
+        # time; both are joined here before anything is written
+        outcomes = None
+        if not fused and not summary_done and not extract_done and minutes_mode() == "concurrent":
+            publish_meeting_event(meeting, "summarizing", stage="summarize", model=summary_model)
+            publish_meeting_event(meeting, "extracting", stage="extract", model=extract_model)
+            outcomes = run_stages_concurrently(transcript)
+
         # Generate summary
-        try:
-            summary = summarize_transcript(transcript)
-            if not summary or len(summary.strip()) == 0:
-                raise ValueError("Summarization returned empty content")
-            meeting.summary = summary
-            session.commit()
-            logger.info("Summary generated for meeting %s", meeting.id)
-        except Exception as e:
-            error_msg = f"Summarization failed: {str(e)}"
-            logger.error(error_msg)
-            raise ValueError(error_msg) from e
+        summary_failure = None
+        if summary_done:
+            summary = meeting.summary
+            logger.info("Meeting %s: summary already checkpointed, skipping", meeting.id)
+        else:
+            outcome = outcomes["summarize"] if outcomes else None
+            try:
+                with _checkpoint(session, meeting, "summarize", summary_model, outcome):
+                    if outcome is not None:
+                        summary = outcome.result()
+                    else:
+                        summary = fused["summary"] if fused else summarize_transcript(transcript)
+                    if not summary or len(summary.strip()) == 0:
+                        raise ValueError("Summarization returned empty content")
+                    meeting.summary = summary
+                logger.info("Summary generated for meeting %s", meeting.id)
+            except Exception as e:
+                error_msg = f"Summarization failed: {str(e)}"
+                logger.error(error_msg)
+                if outcomes is None:
+                    raise ValueError(error_msg) from e
+                # Still checkpoint the concurrently extracted action items before failing
+                summary_failure = ValueError(error_msg)
+                summary_failure.__cause__ = e
 
         # Extract action items
-        try:
-            items = extract_action_items(transcript=transcript, summary=summary)
-            (
-                session.query(ActionItem)
-                .filter(ActionItem.meeting_id == meeting.id)
-                .delete(synchronize_session=False)
-            )
-            for item in items:
-                due = item.get("due_date")
-                due_date_obj = None
-                if due:
-                    try:
-                        due_date_obj = datetime.fromisoformat(due).date()
-                    except ValueError:
-                        logger.warning("Unable to parse due date '%s' for meeting %s", due, meeting.id)
-                session.add(
-                    ActionItem(
-                        meeting_id=meeting.id,
-                        description=item.get("description", "").strip(),
-                        owner=item.get("owner"),
-                        due_date=due_date_obj,
-                        status=item.get("status", "pending"),
-                    )
-                )
-            logger.info("Extracted %d action items for meeting %s", len(items), meeting.id)
-        except Exception as e:
-            # Don't fail the entire process if action item extraction fails
-            logger.warning("Action item extraction failed for meeting %s: %s", meeting.id, str(e))
+        if extract_done:
+            logger.info("Meeting %s: action items already checkpointed, skipping", meeting.id)
+        else:
+            try:
+                outcome = outcomes["extract"] if outcomes else None
+                with _checkpoint(session, meeting, "extract", extract_model, outcome):
+                    if outcome is not None:
+                        items = outcome.result()
+                    elif fused:
+                        items = fused["action_items"]
+                    else:
+                        items = extract_action_items(transcript=transcript, summary=summary)
+                    _replace_action_items(session, meeting.id, items)
+                logger.info("Extracted %d action items for meeting %s", len(items), meeting.id)
+            except Exception as e:
+                # Don't fail the entire process if action item extraction fails;
+                # the failed checkpoint lets a retry run just this stage.
+                logger.warning("Action item extraction failed for meeting %s: %s", meeting.id, str(e))
 
-        meeting.status = "done"
+        if summary_failure is not None:
+            raise summary_failure
+
+        # Summary, action items and stage checkpoints in one transaction
         session.commit()
+        _set_status(session, meeting_id, "done")
+        publish_meeting_event(
+            meeting, "done", total_ms=sum(stage.duration_ms or 0 for stage in meeting.stages)
+        )
         logger.info("Successfully processed meeting %s", meeting.id)
         return meeting.id
     except Exception as e:
@@ -117,6 +394,150 @@ def process_meeting(meeting_id: int, session_factory: Callable[[], Session] | No
             meeting.status = "failed"
             meeting.error_message = error_message
             session.commit()
+            publish_meeting_event(meeting, "failed", error=error_message)
         raise
     finally:
         session.close()
+
+
+def complete_assemblyai_transcription(
+    transcript_id: str, session_factory: Callable[[], Session] | None = None
+) -> int:
+    """Store a webhook-delivered AssemblyAI transcript and resume the meeting's pipeline."""
+    session = _ensure_session(session_factory)
+    try:
+        meeting = session.query(Meeting).filter(Meeting.transcription_id == transcript_id).first()
+        if meeting is None:
+            raise PermanentJobError(f"No meeting is waiting for transcription {transcript_id}")
+        meeting_id = meeting.id
+        if meeting.status != "transcribing":
+            # The webhook and the reconcile poll can both deliver the same transcript
+            logger.info("Meeting %s already collected transcription %s", meeting_id, transcript_id)
+            return meeting_id
+        stage = _get_stage(meeting, "transcribe")
+        if stage.started_at is None:
+            stage.started_at = datetime.utcnow()
+        try:
+            transcript = fetch_assemblyai_transcription(transcript_id)
+        except Exception as e:
+            error_message = f"Transcription failed: {str(e)}"
+            logger.error("Meeting %s: %s", meeting_id, error_message)
+            _finish_stage(stage, error=error_message)
+            meeting.status = "failed"
+            meeting.error_message = error_message
+            session.commit()
+            publish_meeting_event(meeting, "failed", error=error_message)
+            raise
+        meeting.transcript = transcript
+        # Duration covers the whole hand-off, including AssemblyAI's processing time
+        _finish_stage(stage)
+        session.commit()
+        logger.info("Transcription completed for meeting %s (%d chars)", meeting_id, len(transcript))
+        provider, model = transcription_profile()
+        store_transcript(session, meeting.audio_sha256, provider, model, transcript)
+    finally:
+        session.close()
+    return process_meeting(meeting_id, session_factory)
+
+
+# Polls after the webhook timeout before the meeting is failed; intervals double from RECONCILE_FIRST_INTERVAL
+RECONCILE_MAX_POLLS = 8
+RECONCILE_FIRST_INTERVAL = 30.0
+
+
+def transcription_overdue(meeting: Meeting, now: datetime | None = None) -> bool:
+    """True for a meeting that has waited longer than the webhook timeout for its transcript."""
+    if meeting.status != "transcribing":
+        return False
+    stage = next((stage for stage in meeting.stages if stage.name == "transcribe"), None)
+    started_at = stage.started_at if stage is not None else None
+    if started_at is None:
+        return True
+    return (now or datetime.utcnow()) - started_at > timedelta(seconds=assemblyai_webhook_timeout())
+
+
+def schedule_transcription_reconcile(meeting_id: int, poll: int = 0) -> bool:
+    """
+    Queue a check of the meeting's AssemblyAI job: the first after the webhook
+    timeout, then at doubling intervals. Only possible from a queue worker;
+    synchronous runs rely on recovery and ``POST /meetings/<id>/retry``.
+    """
+    runner = current_runner()
+    if runner is None:
+        return False
+    delay = assemblyai_webhook_timeout() if poll == 0 else RECONCILE_FIRST_INTERVAL * 2 ** (poll - 1)
+    runner.enqueue(
+        reconcile_assemblyai_transcription, args=(meeting_id, poll), lane="high", enforce_depth=False, delay=delay
+    )
+    return True
+
+
+def reconcile_assemblyai_transcription(
+    meeting_id: int, poll: int = 0, session_factory: Callable[[], Session] | None = None
+) -> int | None:
+    """
+    Collect a transcript whose webhook never arrived by polling AssemblyAI.
+
+    Does nothing once the webhook has delivered (or the meeting was retried).
+    While AssemblyAI is still working, the next poll is scheduled; after
+    RECONCILE_MAX_POLLS the meeting is failed so it can be retried.
+    """
+    session = _ensure_session(session_factory)
+    try:
+        meeting = session.get(Meeting, meeting_id)
+        if meeting is None or meeting.status != "transcribing" or not meeting.transcription_id:
+            return None
+        transcript_id = meeting.transcription_id
+        status = assemblyai_transcription_status(transcript_id)
+        if status not in ("completed", "error"):
+            if poll + 1 < RECONCILE_MAX_POLLS and schedule_transcription_reconcile(meeting_id, poll + 1):
+                logger.info("Meeting %s: AssemblyAI job %s still %s", meeting_id, transcript_id, status)
+                return None
+            error_message = f"Transcription failed: AssemblyAI job {transcript_id} did not finish ({status})"
+            stage = _get_stage(meeting, "transcribe")
+            stage.started_at = stage.started_at or datetime.utcnow()
+            _finish_stage(stage, error=error_message)
+            meeting.status = "failed"
+            meeting.error_message = error_message
+            session.commit()
+            publish_meeting_event(meeting, "failed", error=error_message)
+            return None
+    finally:
+        session.close()
+    logger.warning("Meeting %s: no webhook for %s, collected by polling", meeting_id, transcript_id)
+    return complete_assemblyai_transcription(transcript_id, session_factory)
+
+
+def recover_orphaned_meetings(runner, session_factory: Callable[[], Session] | None = None) -> int:
+    """
+    Re-enqueue meetings left pending/processing by a previous process, and
+    poll AssemblyAI for meetings whose webhook is overdue.
+
+    Meetings that already have a queued or running job are skipped by the
+    queue's de-duplication, so this is safe to call from every worker process.
+    """
+    session = _ensure_session(session_factory)
+    try:
+        meeting_ids = [
+            meeting_id
+            for (meeting_id,) in session.query(Meeting.id).filter(Meeting.status.in_(("pending", "processing")))
+        ]
+        stale_ids = [
+            meeting.id
+            for meeting in session.query(Meeting).filter(Meeting.status == "transcribing")
+            if transcription_overdue(meeting)
+        ]
+    finally:
+        session.close()
+    # Already admitted once, so recovery is not subject to the depth limit
+    recovered = sum(
+        1 for meeting_id in meeting_ids if runner.enqueue(process_meeting, args=(meeting_id,), enforce_depth=False)
+    )
+    recovered += sum(
+        1
+        for meeting_id in stale_ids
+        if runner.enqueue(reconcile_assemblyai_transcription, args=(meeting_id,), lane="high", enforce_depth=False)
+    )
+    if recovered:
+        logger.info("Re-enqueued %d orphaned meeting(s)", recovered)
+    return recovered
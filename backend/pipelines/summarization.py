@@ -3,9 +3,57 @@ from __future__ import annotations
 import logging
 import os
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
-from langchain.prompts import ChatPromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
+try:
+    from backend.services.llm import get_chat_model, get_prompt
+    from backend.services.llm_cache import get_llm_cache, make_cache_key
+except ModuleNotFoundError:
+    from services.llm import get_chat_model, get_prompt
+    from services.llm_cache import get_llm_cache, make_cache_key
+
+# Bump whenever the prompts below change so cached summaries are not reused.
+PROMPT_VERSION = "summary-v1"
+
+SUMMARY_PROMPT = (
+    (
+        "system",
+        "You are a meeting assistant. Summarize the provided meeting transcript in {max_sentences} sentences or less. "
+        "Focus on key discussion points, decisions made, and important topics covered. "
+        "Return ONLY the summary text, nothing else.",
+    ),
+    (
+        "human",
+        "Meeting Transcript:\n\n{transcript}\n\nProvide a concise summary:",
+    ),
+)
+
+CHUNK_SUMMARY_PROMPT = (
+    (
+        "system",
+        "You are a meeting assistant. The text is section {index} of {total} of a longer meeting transcript. "
+        "Summarize this section in {max_sentences} sentences or less, keeping decisions, owners and deadlines. "
+        "Return ONLY the summary text, nothing else.",
+    ),
+    (
+        "human",
+        "Transcript Section:\n\n{transcript}\n\nProvide a concise summary:",
+    ),
+)
+
+REDUCE_SUMMARY_PROMPT = (
+    (
+        "system",
+        "You are a meeting assistant. Combine the summaries of consecutive sections of one meeting into a single "
+        "summary of {max_sentences} sentences or less. Focus on key discussion points, decisions made, and "
+        "important topics covered. Return ONLY the summary text, nothing else.",
+    ),
+    (
+        "human",
+        "Section Summaries:\n\n{summaries}\n\nProvide a concise summary:",
+    ),
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,34 +75,100 @@ def summarize_transcript(transcript: str, max_sentences: int = 5) -> str:
     if not api_key:
         raise SummarizationError("GEMINI_API_KEY is required for summarization")
 
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                "You are a meeting assistant. Summarize the provided meeting transcript in {max_sentences} sentences or less. "
-                "Focus on key discussion points, decisions made, and important topics covered. "
-                "Return ONLY the summary text, nothing else.",
-            ),
-            (
-                "human",
-                "Meeting Transcript:\n\n{transcript}\n\nProvide a concise summary:",
-            ),
-        ]
-    )
-    llm = ChatGoogleGenerativeAI(
-        model=os.getenv("GEMINI_MODEL", "gemini-2.5-flash"),
-        temperature=0.2,
-        google_api_key=api_key,
-        convert_system_message_to_human=True,
-    )
+    model = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+    cache = get_llm_cache()
+    cache_key = make_cache_key("summary", cleaned, model, PROMPT_VERSION, max_sentences=max_sentences)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached:
+            logger.info("Summary served from LLM cache")
+            return cached
+
+    summary = _summarize(cleaned, model, api_key, max_sentences)
+    if cache is not None:
+        cache.set(cache_key, summary)
+    return summary
 
-    messages = prompt.format_messages(
+
+def _summarize(cleaned: str, model: str, api_key: str, max_sentences: int) -> str:
+    llm = get_chat_model(model, temperature=0.2, api_key=api_key)
+
+    threshold = int(os.getenv("SUMMARY_CHUNK_THRESHOLD_TOKENS", "8000"))
+    if _estimate_tokens(cleaned) > threshold:
+        return _summarize_chunked(llm, cleaned, max_sentences)
+
+    messages = get_prompt(SUMMARY_PROMPT).format_messages(
         transcript=cleaned, max_sentences=max_sentences
     )
     logger.debug("Invoking Gemini for summarization")
+    return _invoke(llm, messages)
+
+
+def _invoke(llm, messages) -> str:
     response = llm.invoke(messages)
     content = getattr(response, "content", None) or ""
     logger.info("Received summary response (%d characters)", len(content))
     if not content:
         raise SummarizationError("Gemini returned an empty summary")
     return content.strip()
+
+
+# Chunked (map-reduce) mode ------------------------------------------------
+# Token counts are approximated by whitespace-delimited words, which is close
+# enough to keep each window well inside the model's context budget.
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text.split())
+
+
+def _split_into_windows(text: str, window_tokens: int, overlap_tokens: int) -> List[str]:
+    words = text.split()
+    if window_tokens <= 0:
+        raise SummarizationError("Chunk window size must be positive")
+    overlap_tokens = max(0, min(overlap_tokens, window_tokens - 1))
+    step = window_tokens - overlap_tokens
+    windows: List[str] = []
+    for start in range(0, len(words), step):
+        windows.append(" ".join(words[start:start + window_tokens]))
+        if start + window_tokens >= len(words):
+            break
+    return windows
+
+
+def _summarize_chunked(llm, transcript: str, max_sentences: int) -> str:
+    windows = _split_into_windows(
+        transcript,
+        window_tokens=int(os.getenv("SUMMARY_CHUNK_TOKENS", "4000")),
+        overlap_tokens=int(os.getenv("SUMMARY_CHUNK_OVERLAP_TOKENS", "200")),
+    )
+    max_workers = max(1, int(os.getenv("SUMMARY_MAX_WORKERS", "4")))
+    logger.info(
+        "Summarizing transcript in %d chunks (max %d concurrent requests)",
+        len(windows),
+        max_workers,
+    )
+
+    def _summarize_window(index: int) -> str:
+        messages = get_prompt(CHUNK_SUMMARY_PROMPT).format_messages(
+            transcript=windows[index],
+            index=index + 1,
+            total=len(windows),
+            max_sentences=max_sentences,
+        )
+        return _invoke(llm, messages)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(windows))) as executor:
+        partials = list(executor.map(_summarize_window, range(len(windows))))
+
+    combined = "\n\n".join(
+        f"Section {index + 1}: {partial}" for index, partial in enumerate(partials)
+    )
+    threshold = int(os.getenv("SUMMARY_CHUNK_THRESHOLD_TOKENS", "8000"))
+    if len(partials) > 1 and _estimate_tokens(combined) > threshold:
+        # Very long meetings: reduce the partial summaries hierarchically.
+        return _summarize_chunked(llm, combined, max_sentences)
+
+    messages = get_prompt(REDUCE_SUMMARY_PROMPT).format_messages(summaries=combined, max_sentences=max_sentences)
+    logger.debug("Invoking Gemini to reduce %d partial summaries", len(partials))
+    return _invoke(llm, messages)
@@ -6,9 +6,15 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 try:
-    from backend.services.assembly import AssemblyAIClient, AssemblyAIError
+    from backend.services.assembly import AssemblyAIClient, AssemblyAIError, get_assemblyai_client
+    from backend.services.whisper_models import (
+        WhisperModelError,
+        get_whisper_registry,
+        transcribe_segments,
+    )
 except ModuleNotFoundError:
-    from services.assembly import AssemblyAIClient, AssemblyAIError
+    from services.assembly import AssemblyAIClient, AssemblyAIError, get_assemblyai_client
+    from services.whisper_models import WhisperModelError, get_whisper_registry, transcribe_segments
 
 logger = logging.getLogger(__name__)
 
@@ -37,24 +43,90 @@ def transcribe_audio(file_path: str, model_name: str | None = None) -> str:
     raise TranscriptionError(f"Unsupported transcription provider: {provider}")
 
 
-def _transcribe_with_assemblyai(file_path: str, model_name: str | None = None) -> str:
+def transcription_profile(model_name: str | None = None) -> tuple[str, str]:
+    """Return the (provider, model) pair a transcription would use right now."""
+    if os.getenv("MOCK_TRANSCRIPTION", "0") == "1":
+        return "mock", "mock"
+    provider = os.getenv("TRANSCRIPTION_PROVIDER", "assemblyai").lower()
+    if provider == "whisper":
+        return provider, model_name or os.getenv("WHISPER_MODEL", "base")
+    return provider, model_name or os.getenv("ASSEMBLYAI_MODEL") or "default"
+
+
+def assemblyai_webhook_enabled() -> bool:
+    return (
+        os.getenv("MOCK_TRANSCRIPTION", "0") != "1"
+        and os.getenv("TRANSCRIPTION_PROVIDER", "assemblyai").lower() == "assemblyai"
+        and bool(os.getenv("ASSEMBLYAI_WEBHOOK_URL", "").strip())
+    )
+
+
+def start_assemblyai_transcription(file_path: str, model_name: str | None = None) -> str:
+    """
+    Submit audio to AssemblyAI with a completion webhook and return the job id.
+
+    The caller does not wait; AssemblyAI calls ASSEMBLYAI_WEBHOOK_URL when the
+    transcript is ready and ``fetch_assemblyai_transcription`` collects it.
+    """
+    client = _assemblyai_client()
+    audio_source = _assemblyai_audio_source(client, file_path)
+    try:
+        transcript_id = client.request_transcription(
+            audio_source,
+            model=model_name or os.getenv("ASSEMBLYAI_MODEL"),
+            webhook_url=os.getenv("ASSEMBLYAI_WEBHOOK_URL", "").strip(),
+            webhook_secret=os.getenv("ASSEMBLYAI_WEBHOOK_SECRET", "").strip() or None,
+        )
+    except AssemblyAIError as exc:
+        raise TranscriptionError(str(exc)) from exc
+    logger.info("Submitted AssemblyAI transcription %s with webhook", transcript_id)
+    return transcript_id
+
+
+def fetch_assemblyai_transcription(transcript_id: str) -> str:
+    client = _assemblyai_client()
+    try:
+        return client.transcript_text(client.get_transcription(transcript_id))
+    except AssemblyAIError as exc:
+        raise TranscriptionError(str(exc)) from exc
+
+
+def assemblyai_transcription_status(transcript_id: str) -> str:
+    """AssemblyAI's status for a submitted job: queued, processing, completed or error."""
+    client = _assemblyai_client()
+    try:
+        return client.get_transcription(transcript_id).get("status") or "queued"
+    except AssemblyAIError as exc:
+        raise TranscriptionError(str(exc)) from exc
+
+
+def assemblyai_webhook_timeout() -> float:
+    """Seconds to wait for the completion webhook before polling AssemblyAI instead."""
+    return float(os.getenv("ASSEMBLYAI_WEBHOOK_TIMEOUT", "900"))
+
+
+def _assemblyai_client() -> AssemblyAIClient:
     api_key = os.getenv("ASSEMBLYAI_API_KEY", "").strip()
     if not api_key:
         raise TranscriptionError("ASSEMBLYAI_API_KEY is required for transcription")
-    client = AssemblyAIClient(
+    return get_assemblyai_client(
         api_key=api_key,
         base_url=os.getenv("ASSEMBLYAI_BASE_URL", "https://api.assemblyai.com/v2"),
-        poll_interval=float(os.getenv("ASSEMBLYAI_POLL_INTERVAL", "3")),
-        poll_timeout=float(os.getenv("ASSEMBLYAI_POLL_TIMEOUT", "600")),
     )
 
+
+def _assemblyai_audio_source(client: AssemblyAIClient, file_path: str) -> str:
     if _looks_like_url(file_path):
-        audio_source = file_path
-    else:
-        path = Path(file_path)
-        if not path.exists():
-            raise TranscriptionError(f"Audio file not found: {file_path}")
-        audio_source = client.upload_file(path)
+        return file_path
+    path = Path(file_path)
+    if not path.exists():
+        raise TranscriptionError(f"Audio file not found: {file_path}")
+    return client.upload_file(path)
+
+
+def _transcribe_with_assemblyai(file_path: str, model_name: str | None = None) -> str:
+    client = _assemblyai_client()
+    audio_source = _assemblyai_audio_source(client, file_path)
 
     model = model_name or os.getenv("ASSEMBLYAI_MODEL")
     try:
@@ -68,19 +140,87 @@ def _transcribe_with_whisper(file_path: str, model_name: str | None = None) -> s
     if not path.exists():
         raise TranscriptionError(f"Audio file not found: {file_path}")
 
-    try:
-        import whisper  # type: ignore
-    except ImportError as exc:  # pragma: no cover - depends on optional dependency
-        raise TranscriptionError("OpenAI Whisper is not installed") from exc
+    name = model_name or os.getenv("WHISPER_MODEL", "base")
+    source = str(path)
+    if os.getenv("WHISPER_SEGMENTED", "false").lower() == "true":
+        audio, sample_rate = _load_whisper_audio(path)
+        segment_seconds = float(os.getenv("WHISPER_SEGMENT_SECONDS", "120"))
+        if len(audio) >= 2 * segment_seconds * sample_rate:
+            transcript = _transcribe_with_whisper_segmented(audio, sample_rate, segment_seconds, name)
+            if not transcript:
+                raise TranscriptionError("Whisper returned an empty transcript")
+            return transcript
+        # Short audio: pass the decoded samples on rather than decoding the file again
+        source = audio
 
-    model = whisper.load_model(model_name or os.getenv("WHISPER_MODEL", "base"))
-    result = model.transcribe(str(path))
+    try:
+        with get_whisper_registry().use(name) as model:
+            result = model.transcribe(source)
+    except WhisperModelError as exc:
+        raise TranscriptionError(str(exc)) from exc
     transcript = result.get("text", "").strip()
     if not transcript:
         raise TranscriptionError("Whisper returned an empty transcript")
     return transcript
 
 
+def _load_whisper_audio(path: Path) -> tuple:
+    """Decode the file once (ffmpeg, 16 kHz mono float32); returns (samples, sample rate)."""
+    try:
+        import whisper  # type: ignore
+    except ImportError as exc:  # pragma: no cover - depends on optional dependency
+        raise TranscriptionError("OpenAI Whisper is not installed") from exc
+    return whisper.load_audio(str(path)), whisper.audio.SAMPLE_RATE
+
+
+def _transcribe_with_whisper_segmented(audio, sample_rate: int, segment_seconds: float, model_name: str) -> str:
+    """Split long audio at silences and transcribe the segments in worker processes."""
+    bounds = _split_on_silence(audio, sample_rate, target_seconds=segment_seconds)
+    logger.info(
+        "Transcribing %.0fs of audio in %d segments with Whisper '%s'",
+        len(audio) / sample_rate,
+        len(bounds),
+        model_name,
+    )
+    texts = transcribe_segments(model_name, [audio[start:end] for start, end in bounds])
+    return " ".join(text for text in texts if text).strip()
+
+
+def _split_on_silence(
+    audio,
+    sample_rate: int,
+    target_seconds: float,
+    search_seconds: float = 5.0,
+    frame_ms: int = 30,
+) -> list[tuple[int, int]]:
+    """
+    Return (start, end) sample bounds of roughly ``target_seconds`` each, cutting
+    at the quietest frame within ``search_seconds`` of every target boundary.
+    """
+    import numpy as np
+
+    frame = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = len(audio) // frame
+    target = max(1, int(target_seconds * 1000 / frame_ms))
+    search = min(int(search_seconds * 1000 / frame_ms), target - 1)
+    if n_frames <= target + search:
+        return [(0, len(audio))]
+
+    frames = np.asarray(audio[: n_frames * frame], dtype=np.float32).reshape(n_frames, frame)
+    energy = np.sqrt(np.mean(frames ** 2, axis=1))
+
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    while n_frames - start > target + search:
+        low = start + target - search
+        high = start + target + search
+        cut = low + int(np.argmin(energy[low:high]))
+        bounds.append((start * frame, cut * frame))
+        start = cut
+    bounds.append((start * frame, len(audio)))
+    return bounds
+
+
 def _looks_like_url(value: str) -> bool:
     parsed = urlparse(value or "")
     return parsed.scheme in {"http", "https"}
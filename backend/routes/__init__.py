@@ -8,11 +8,13 @@ try:
     from backend.routes.health import health_bp
     from backend.routes.meetings import meetings_bp
     from backend.routes.supervisor_adapter import supervisor_bp
+    from backend.routes.webhooks import webhooks_bp
 except ModuleNotFoundError:
     from routes.agents import agents_bp
     from routes.health import health_bp
     from routes.meetings import meetings_bp
     from routes.supervisor_adapter import supervisor_bp
+    from routes.webhooks import webhooks_bp
 
 
 def register_blueprints(app: Flask) -> None:
@@ -20,3 +22,4 @@ def register_blueprints(app: Flask) -> None:
     app.register_blueprint(meetings_bp)
     app.register_blueprint(agents_bp)
     app.register_blueprint(supervisor_bp)
+    app.register_blueprint(webhooks_bp)
@@ -3,11 +3,9 @@ from __future__ import annotations
 from flask import Blueprint, jsonify, request
 
 try:
-    from backend.pipelines.action_items import extract_action_items
-    from backend.pipelines.summarization import summarize_transcript
+    from backend.pipelines.minutes import generate_minutes
 except ModuleNotFoundError:
-    from pipelines.action_items import extract_action_items
-    from pipelines.summarization import summarize_transcript
+    from pipelines.minutes import generate_minutes
 
 agents_bp = Blueprint("agents", __name__)
 
@@ -19,13 +17,12 @@ def meeting_followup():
     if not transcript:
         return jsonify({"error": "transcript is required"}), 400
 
-    summary = summarize_transcript(transcript)
-    action_items = extract_action_items(transcript=transcript, summary=summary)
+    minutes = generate_minutes(transcript)
     return (
         jsonify(
             {
-                "summary": summary,
-                "action_items": action_items,
+                "summary": minutes["summary"],
+                "action_items": minutes["action_items"],
                 "metadata": payload.get("metadata", {}),
             }
         ),
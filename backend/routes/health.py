@@ -2,7 +2,18 @@ from __future__ import annotations
 
 import logging
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
+
+try:
+    from backend.services.assembly import assemblyai_pool_stats
+    from backend.services.events import get_event_broker
+    from backend.services.llm_cache import get_llm_cache
+    from backend.services.whisper_models import get_whisper_registry
+except ModuleNotFoundError:
+    from services.assembly import assemblyai_pool_stats
+    from services.events import get_event_broker
+    from services.llm_cache import get_llm_cache
+    from services.whisper_models import get_whisper_registry
 
 health_bp = Blueprint("health", __name__)
 logger = logging.getLogger("meeting_agent.health")
@@ -12,3 +23,36 @@ logger = logging.getLogger("meeting_agent.health")
 def health() -> tuple[dict, int]:
     logger.info("Responding to /health")
     return jsonify({"status": "ok"}), 200
+
+
+@health_bp.route("/health/stats", methods=["GET"])
+def health_stats() -> tuple[dict, int]:
+    """Per-process counters for monitoring: HTTP pools, LLM cache, Whisper models, jobs and event streams."""
+    cache = get_llm_cache()
+    runner = current_app.extensions.get("background_runner")
+    return (
+        jsonify(
+            {
+                "assemblyai": assemblyai_pool_stats(),
+                "llm_cache": cache.stats() if cache is not None else None,
+                "whisper": get_whisper_registry().stats(),
+                "jobs": runner.stats() if runner is not None else None,
+                "events": get_event_broker().stats(),
+            }
+        ),
+        200,
+    )
+
+
+@health_bp.route("/health/queue", methods=["GET"])
+def health_queue() -> tuple[dict, int]:
+    """
+    Job queue depth and estimated wait per lane. Responds 503 while the
+    normal lane is saturated so load balancers can route around this instance.
+    """
+    runner = current_app.extensions.get("background_runner")
+    if runner is None or not runner.enabled:
+        return jsonify({"enabled": False}), 200
+    status = runner.queue_status()
+    status["enabled"] = True
+    return jsonify(status), 503 if status["lanes"]["normal"]["saturated"] else 200
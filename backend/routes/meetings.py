@@ -1,61 +1,233 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import io
+import json
 import logging
+import time
+from datetime import datetime
+from typing import AsyncIterator, Iterator
+from urllib.parse import urlencode
 
-from flask import Blueprint, current_app, jsonify, request
+from flask import Blueprint, Response, current_app, jsonify, request
+from sqlalchemy import insert, tuple_
+from sqlalchemy.orm import load_only, selectinload
 
 try:
     from backend.database import SessionLocal
-    from backend.models import Meeting
-    from backend.pipelines.orchestrator import process_meeting
+    from backend.models import ActionItem, Meeting, MeetingContent, MeetingStage
+    from backend.pipelines.orchestrator import (
+        STAGE_EVENTS,
+        STAGES,
+        meeting_event,
+        process_meeting,
+        publish_meeting_event,
+        reset_stages,
+        transcription_overdue,
+    )
+    from backend.services.background import LANES, QueueFullError
+    from backend.services.events import get_event_broker
+    from backend.services.notifier import get_meeting_notifier
+    from backend.services.search import SearchUnavailableError, index_meetings, search_meetings
     from backend.services.storage import save_audio_file
 except ModuleNotFoundError:
     from database import SessionLocal
-    from models import Meeting
-    from pipelines.orchestrator import process_meeting
+    from models import ActionItem, Meeting, MeetingContent, MeetingStage
+    from pipelines.orchestrator import (
+        STAGE_EVENTS,
+        STAGES,
+        meeting_event,
+        process_meeting,
+        publish_meeting_event,
+        reset_stages,
+        transcription_overdue,
+    )
+    from services.background import LANES, QueueFullError
+    from services.events import get_event_broker
+    from services.notifier import get_meeting_notifier
+    from services.search import SearchUnavailableError, index_meetings, search_meetings
     from services.storage import save_audio_file
 
 meetings_bp = Blueprint("meetings", __name__)
 logger = logging.getLogger(__name__)
 
+# Long-polls re-read the version at least this often to see other processes' commits
+LONG_POLL_RECHECK_SECONDS = 1.0
+NDJSON_READ_BUFFER = 64 * 1024
 
-def _meeting_payload(meeting: Meeting) -> dict:
+
+def _queue_full_response(error: QueueFullError, **extra):
+    logger.warning("Rejecting meeting: %s", str(error))
+    response = jsonify({
+        "error": "Processing queue is full",
+        "lane": error.lane,
+        "retry_after": error.retry_after,
+        **extra,
+    })
+    response.headers["Retry-After"] = str(error.retry_after)
+    return response, 429
+
+
+def _action_item_payload(item: ActionItem) -> dict:
     return {
-        "id": meeting.id,
-        "title": meeting.title,
-        "status": meeting.status,
-        "created_at": meeting.created_at.isoformat(),
-        "audio_url": meeting.audio_url,
-        "transcript": meeting.transcript,
-        "summary": meeting.summary,
-        "source_agent": meeting.source_agent,
-        "error_message": meeting.error_message,
-        "action_items": [
-            {
-                "id": item.id,
-                "description": item.description,
-                "owner": item.owner,
-                "due_date": item.due_date.isoformat() if item.due_date else None,
-                "status": item.status,
-            }
-            for item in meeting.action_items
-        ],
+        "id": item.id,
+        "description": item.description,
+        "owner": item.owner,
+        "due_date": item.due_date.isoformat() if item.due_date else None,
+        "status": item.status,
+    }
+
+
+def _stage_payload(stage: MeetingStage) -> dict:
+    return {
+        "name": stage.name,
+        "status": stage.status,
+        "model": stage.model,
+        "started_at": stage.started_at.isoformat() if stage.started_at else None,
+        "finished_at": stage.finished_at.isoformat() if stage.finished_at else None,
+        "duration_ms": stage.duration_ms,
+        "error": stage.error,
     }
 
 
+# Serializers for every field a meeting payload can contain, in response order
+MEETING_FIELDS = {
+    "id": lambda meeting: meeting.id,
+    "title": lambda meeting: meeting.title,
+    "status": lambda meeting: meeting.status,
+    "created_at": lambda meeting: meeting.created_at.isoformat(),
+    "audio_url": lambda meeting: meeting.audio_url,
+    "transcript": lambda meeting: meeting.transcript,
+    "summary": lambda meeting: meeting.summary,
+    "source_agent": lambda meeting: meeting.source_agent,
+    "error_message": lambda meeting: meeting.error_message,
+    "action_items": lambda meeting: [_action_item_payload(item) for item in meeting.action_items],
+    "stages": lambda meeting: [_stage_payload(stage) for stage in meeting.stages],
+}
+RELATIONSHIP_FIELDS = {"action_items": Meeting.action_items, "stages": Meeting.stages}
+# Fields read from the compressed meeting_contents row
+CONTENT_FIELDS = ("transcript", "summary")
+
+
+def _meeting_payload(meeting: Meeting, fields: list[str] | None = None) -> dict:
+    return {name: MEETING_FIELDS[name](meeting) for name in (fields or MEETING_FIELDS)}
+
+
+def _parse_fields(value: str | None) -> list[str] | None:
+    """Parse ``fields=a,b``; ``id`` is always included. Raises ValueError on unknown names."""
+    if not value:
+        return None
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = requested - set(MEETING_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return [name for name in MEETING_FIELDS if name in requested]
+
+
+def _encode_cursor(meeting: Meeting) -> str:
+    raw = json.dumps([meeting.created_at.isoformat(), meeting.id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, meeting_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(meeting_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
 @meetings_bp.route("/meetings", methods=["GET"])
 def list_meetings():
+    """
+    Newest-first page of meetings, keyset-paginated on (created_at, id).
+
+    The body stays a JSON array; the cursor for the next page is returned in
+    the ``X-Next-Cursor`` header (and a ``Link: rel="next"`` header).
+    """
+    try:
+        fields = _parse_fields(request.args.get("fields"))
+        cursor = request.args.get("cursor")
+        after = _decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    max_limit = current_app.config.get("MEETINGS_PAGE_MAX_LIMIT", 200)
+    limit = request.args.get("limit", type=int) or current_app.config.get("MEETINGS_PAGE_DEFAULT_LIMIT", 50)
+    limit = max(1, min(limit, max_limit))
+
+    session = SessionLocal()
+    try:
+        query = session.query(Meeting).order_by(Meeting.created_at.desc(), Meeting.id.desc())
+        if after is not None:
+            query = query.filter(tuple_(Meeting.created_at, Meeting.id) < tuple_(*after))
+        if request.args.get("status"):
+            query = query.filter(Meeting.status == request.args["status"])
+        if request.args.get("source_agent"):
+            query = query.filter(Meeting.source_agent == request.args["source_agent"])
+
+        selected = fields or list(MEETING_FIELDS)
+        columns = [
+            getattr(Meeting, name)
+            for name in selected
+            if name not in RELATIONSHIP_FIELDS and name not in CONTENT_FIELDS and name not in ("id", "created_at")
+        ]
+        # Only load the requested columns; transcripts and summaries are large
+        query = query.options(load_only(Meeting.id, Meeting.created_at, *columns))
+        if any(name in selected for name in CONTENT_FIELDS):
+            query = query.options(selectinload(Meeting.content))
+        for name, relationship_attr in RELATIONSHIP_FIELDS.items():
+            if name in selected:
+                # One IN query for the whole page instead of one per meeting
+                query = query.options(selectinload(relationship_attr))
+
+        meetings = query.limit(limit + 1).all()
+        has_more = len(meetings) > limit
+        meetings = meetings[:limit]
+
+        response = jsonify([_meeting_payload(meeting, fields) for meeting in meetings])
+        if has_more:
+            next_cursor = _encode_cursor(meetings[-1])
+            args = request.args.to_dict()
+            args.update({"cursor": next_cursor, "limit": str(limit)})
+            response.headers["X-Next-Cursor"] = next_cursor
+            response.headers["Link"] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+        return response, 200
+    finally:
+        session.close()
+
+
+@meetings_bp.route("/meetings/search", methods=["GET"])
+def search():
+    """
+    Full-text search over titles, transcripts and summaries, best match first.
+
+    ``q`` is plain text; every word must appear (stemmed, case-insensitive).
+    Each result carries a ``snippet`` with the matches wrapped in ``**``.
+    """
+    query = (request.args.get("q") or "").strip()
+    if not query:
+        return jsonify({"error": "q is required"}), 400
+
+    max_limit = current_app.config.get("MEETINGS_PAGE_MAX_LIMIT", 200)
+    limit = request.args.get("limit", type=int) or 20
+    limit = max(1, min(limit, max_limit))
+
     session = SessionLocal()
     try:
-        query = session.query(Meeting).order_by(Meeting.created_at.desc())
-        limit = request.args.get("limit", type=int)
-        if limit:
-            query = query.limit(limit)
-        meetings = query.all()
-        return jsonify([_meeting_payload(meeting) for meeting in meetings]), 200
+        results = search_meetings(session, query, limit)
+    except SearchUnavailableError as e:
+        return jsonify({"error": str(e)}), 501
     finally:
         session.close()
 
+    for result in results:
+        result["created_at"] = result["created_at"].isoformat()
+    return jsonify(results), 200
+
 
 @meetings_bp.route("/meetings", methods=["POST"])
 def create_meeting():
@@ -70,14 +242,27 @@ def create_meeting():
         payload = payload or {}
         logger.debug("Payload keys: %s", list(payload.keys()))
 
+        lane = (payload.get("priority") or "normal").lower()
+        if lane not in LANES:
+            return jsonify({"error": f"priority must be one of: {', '.join(LANES)}"}), 400
+
+        # Reject before saving uploads when the queue cannot take more work
+        runner = current_app.extensions.get("background_runner")
+        if runner:
+            try:
+                runner.check_capacity(lane)
+            except QueueFullError as e:
+                return _queue_full_response(e)
+
         # Handle audio file upload
         audio_file = request.files.get("audio") if request.files else None
         audio_path = None
+        audio_sha256 = None
         if audio_file:
             logger.info("Audio file uploaded: %s (size: %s bytes)", audio_file.filename, audio_file.content_length)
             try:
-                audio_path = save_audio_file(audio_file, current_app.config["STORAGE_DIR"])
-                logger.info("Audio saved to: %s", audio_path)
+                audio_path, audio_sha256 = save_audio_file(audio_file, current_app.config["STORAGE_DIR"])
+                logger.info("Audio saved to: %s (sha256 %s)", audio_path, audio_sha256)
             except Exception as e:
                 logger.error("Failed to save audio file: %s", str(e))
                 return jsonify({"error": f"Failed to save audio file: {str(e)}"}), 500
@@ -102,6 +287,7 @@ def create_meeting():
         meeting = Meeting(
             title=payload.get("title") or "Untitled Meeting",
             audio_url=str(audio_path) if audio_path else None,
+            audio_sha256=audio_sha256,
             transcript=transcript,
             source_agent=payload.get("source_agent"),
             status="pending",
@@ -111,10 +297,23 @@ def create_meeting():
         logger.info("Created meeting ID: %s", meeting.id)
 
         # Submit for background processing
-        runner = current_app.extensions.get("background_runner")
         if runner:
-            runner.submit(process_meeting, meeting.id)
-            logger.info("Submitted meeting %s for processing", meeting.id)
+            try:
+                # "queued" only once the lane has taken the job, and before a worker can start it
+                runner.submit(
+                    process_meeting,
+                    meeting.id,
+                    lane=lane,
+                    on_admitted=lambda: publish_meeting_event(meeting, "queued", lane=lane),
+                )
+            except QueueFullError as e:
+                # Lost a race for the last slot; don't leave an orphaned meeting behind
+                session.delete(meeting)
+                session.commit()
+                if audio_file and audio_path:
+                    audio_path.unlink(missing_ok=True)
+                return _queue_full_response(e)
+            logger.info("Submitted meeting %s for processing (%s lane)", meeting.id, lane)
         else:
             logger.warning("Background runner not available")
 
@@ -131,13 +330,484 @@ def create_meeting():
         session.close()
 
 
+class BatchTooLargeError(Exception):
+    pass
+
+
+def _batch_items():
+    """
+    Yield the request's meetings: a JSON array, or one JSON object per line
+    (NDJSON). An NDJSON line that does not parse is yielded as a ValueError
+    naming the line, so it is reported as that item's error.
+    """
+    if request.mimetype in ("application/x-ndjson", "application/jsonl"):
+        # request.stream is unbuffered; without a buffer lines are read byte by byte
+        for number, line in enumerate(io.BufferedReader(request.stream, NDJSON_READ_BUFFER), start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                yield ValueError(f"line {number}: invalid JSON: {e.msg} at column {e.colno}")
+            except UnicodeDecodeError:
+                yield ValueError(f"line {number}: invalid JSON: not UTF-8")
+        return
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, list):
+        raise ValueError("Send a JSON array of meetings, or NDJSON with Content-Type: application/x-ndjson")
+    yield from payload
+
+
+def _batch_row(item) -> dict:
+    """Validate one batch item; raises ValueError with a message for the client."""
+    if isinstance(item, ValueError):
+        raise item
+    if not isinstance(item, dict):
+        raise ValueError("must be a JSON object")
+    transcript = item.get("transcript")
+    if not isinstance(transcript, str) or not transcript.strip():
+        raise ValueError("transcript is required")
+    created_at = item.get("created_at")
+    try:
+        # Backfills keep the meeting's original date
+        created_at = datetime.fromisoformat(created_at) if created_at else datetime.utcnow()
+    except (TypeError, ValueError):
+        raise ValueError("created_at must be an ISO 8601 timestamp")
+    return {
+        "title": str(item.get("title") or "Untitled Meeting")[:255],
+        "source_agent": str(item["source_agent"])[:255] if item.get("source_agent") else None,
+        "created_at": created_at,
+        "transcript": transcript,
+    }
+
+
+def _insert_batch_chunk(session, rows: list[dict], lane: str) -> list[int]:
+    """
+    One INSERT for the meetings and one for their transcripts, then enqueue
+    the group. Raises QueueFullError, before anything is stored, when the
+    lane has no room for every meeting in the chunk.
+    """
+    runner = current_app.extensions.get("background_runner")
+    if runner:
+        runner.check_capacity(lane, count=len(rows))
+    meeting_ids = list(session.scalars(
+        insert(Meeting).returning(Meeting.id, sort_by_parameter_order=True),
+        [
+            {
+                "title": row["title"],
+                "source_agent": row["source_agent"],
+                "created_at": row["created_at"],
+                "status": "pending",
+            }
+            for row in rows
+        ],
+    ))
+    session.execute(
+        insert(MeetingContent),
+        [{"meeting_id": meeting_id, "transcript": row["transcript"]} for meeting_id, row in zip(meeting_ids, rows)],
+    )
+    index_meetings(session, meeting_ids)
+    session.commit()
+
+    # Admission was checked for the whole chunk above. Meetings committed
+    # without a job (e.g. a crash here) are re-enqueued on startup. No
+    # "queued" events: nobody can be subscribed to meetings this new.
+    if runner:
+        jobs = [(meeting_id,) for meeting_id in meeting_ids]
+        runner.submit_many(process_meeting, jobs, lane=lane, enforce_depth=False)
+    return meeting_ids
+
+
+@meetings_bp.route("/meetings/batch", methods=["POST"])
+def create_meetings_batch():
+    """
+    Create many transcript meetings in one request.
+
+    Accepts a JSON array of ``{"title", "transcript", "source_agent",
+    "created_at"}`` objects, or the same objects as NDJSON (streamed and
+    inserted chunk by chunk). ``ids`` is aligned with the input: items that
+    were not stored get ``null`` and are listed in ``errors``. Jobs go to the
+    ``priority`` query-param lane (default ``low``, so backfills don't delay
+    live uploads); each chunk must fit in the lane, otherwise the request
+    stops with 429 and reports the chunks already stored.
+    """
+    lane = (request.args.get("priority") or "low").lower()
+    if lane not in LANES:
+        return jsonify({"error": f"priority must be one of: {', '.join(LANES)}"}), 400
+
+    runner = current_app.extensions.get("background_runner")
+    if runner:
+        try:
+            runner.check_capacity(lane)
+        except QueueFullError as e:
+            return _queue_full_response(e)
+
+    chunk_size = current_app.config.get("MEETINGS_BATCH_CHUNK_SIZE", 500)
+    max_items = current_app.config.get("MEETINGS_BATCH_MAX_ITEMS", 10000)
+    ids: list[int | None] = []
+    errors: list[dict] = []
+    chunk: list[tuple[int, dict]] = []
+
+    def flush() -> None:
+        meeting_ids = _insert_batch_chunk(session, [row for _, row in chunk], lane)
+        for (index, _), meeting_id in zip(chunk, meeting_ids):
+            ids[index] = meeting_id
+        chunk.clear()
+
+    def drop_pending(reason: str) -> None:
+        # Parsed but never stored: still listed, so every null id has an error
+        errors.extend({"index": index, "error": reason} for index, _ in chunk)
+        errors.sort(key=lambda error: error["index"])
+        chunk.clear()
+
+    session = SessionLocal()
+    try:
+        for index, item in enumerate(_batch_items()):
+            if index >= max_items:
+                raise BatchTooLargeError(f"A batch may contain at most {max_items} meetings")
+            ids.append(None)
+            try:
+                chunk.append((index, _batch_row(item)))
+            except ValueError as e:
+                errors.append({"index": index, "error": str(e)})
+            if len(chunk) >= chunk_size:
+                flush()
+        if chunk:
+            flush()
+    except BatchTooLargeError as e:
+        # Chunks already inserted stay; report them alongside the error
+        drop_pending("not stored: batch limit exceeded")
+        return jsonify({"error": str(e), "ids": ids, "errors": errors}), 413
+    except QueueFullError as e:
+        drop_pending("not stored: processing queue is full")
+        return _queue_full_response(e, ids=ids, errors=errors)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    finally:
+        session.close()
+
+    created = sum(1 for meeting_id in ids if meeting_id is not None)
+    logger.info("Created %d meeting(s) from a batch of %d (%s lane)", created, len(ids), lane)
+    body = {"ids": ids, "created": created, "errors": errors}
+    return jsonify(body), 201 if created else 400
+
+
+def _meeting_etag(meeting_id: int, version: int) -> str:
+    return f"{meeting_id}-{version}"
+
+
+def _current_version(session, meeting_id: int) -> int | None:
+    # End any open transaction so the read sees other sessions' commits
+    session.rollback()
+    return session.query(Meeting.version).filter(Meeting.id == meeting_id).scalar()
+
+
+def _not_modified(etag: str):
+    response = current_app.response_class(status=304)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
 @meetings_bp.route("/meetings/<int:meeting_id>", methods=["GET"])
 def get_meeting(meeting_id: int):
+    """
+    Meeting detail with a strong ETag from its version counter.
+
+    ``If-None-Match`` with the current ETag returns 304 without serializing
+    the meeting. Adding ``?wait=<seconds>`` holds such a request until the
+    meeting changes (then 200) or the wait expires (then 304).
+    """
+    session = SessionLocal()
+    try:
+        version = _current_version(session, meeting_id)
+        if version is None:
+            return jsonify({"error": "Meeting not found"}), 404
+
+        etag = _meeting_etag(meeting_id, version)
+        if request.if_none_match.contains(etag):
+            wait = min(
+                max(request.args.get("wait", 0.0, type=float), 0.0),
+                current_app.config.get("MEETING_LONG_POLL_MAX_SECONDS", 30.0),
+            )
+            deadline = time.monotonic() + wait
+            notifier = get_meeting_notifier()
+            while version is not None and request.if_none_match.contains(etag):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return _not_modified(etag)
+                # Woken by in-process commits; the periodic re-check covers other processes
+                notifier.wait(meeting_id, min(remaining, LONG_POLL_RECHECK_SECONDS))
+                version = _current_version(session, meeting_id)
+                etag = _meeting_etag(meeting_id, version) if version is not None else etag
+            if version is None:
+                return jsonify({"error": "Meeting not found"}), 404
+
+        meeting = session.get(Meeting, meeting_id)
+        response = jsonify(_meeting_payload(meeting))
+        # The payload may include commits after the version read; tag it with what was loaded
+        response.set_etag(_meeting_etag(meeting_id, meeting.version))
+        response.headers["Cache-Control"] = "no-cache"
+        return response, 200
+    finally:
+        session.close()
+
+
+@meetings_bp.route("/meetings/<int:meeting_id>/retry", methods=["POST"])
+def retry_meeting(meeting_id: int):
+    """
+    Re-run a meeting's pipeline from its first incomplete stage.
+
+    Pass ``{"from_stage": "summarize"}`` to also repeat a completed stage and
+    everything after it.
+    """
+    payload = request.get_json(silent=True) or {}
+    from_stage = payload.get("from_stage")
+    if from_stage is not None and from_stage not in STAGES:
+        return jsonify({"error": f"from_stage must be one of: {', '.join(STAGES)}"}), 400
+
     session = SessionLocal()
     try:
         meeting = session.get(Meeting, meeting_id)
         if meeting is None:
             return jsonify({"error": "Meeting not found"}), 404
-        return jsonify(_meeting_payload(meeting)), 200
+        # A meeting still waiting for its AssemblyAI webhook past the timeout can be retried
+        if meeting.status == "processing" or (
+            meeting.status == "transcribing" and not transcription_overdue(meeting)
+        ):
+            return jsonify({"error": "Meeting is already being processed", "status": meeting.status}), 409
+
+        runner = current_app.extensions.get("background_runner")
+        if runner:
+            try:
+                runner.check_capacity("normal")
+            except QueueFullError as e:
+                return _queue_full_response(e)
+
+        if from_stage:
+            reset_stages(session, meeting, from_stage)
+        if meeting.status == "transcribing":
+            # Submit the audio again; a late webhook for the old job then matches no meeting
+            meeting.transcription_id = None
+        meeting.status = "pending"
+        meeting.error_message = None
+        session.commit()
+        logger.info("Retrying meeting %s (from_stage=%s)", meeting.id, from_stage or "first incomplete")
+
+        if runner:
+            try:
+                runner.submit(
+                    process_meeting,
+                    meeting.id,
+                    on_admitted=lambda: publish_meeting_event(meeting, "queued", lane="normal"),
+                )
+            except Exception as e:
+                # Synchronous mode: the failure is already recorded on the meeting
+                logger.error("Retry of meeting %s failed: %s", meeting.id, str(e))
+        else:
+            logger.warning("Background runner not available")
+
+        session.refresh(meeting)
+        return jsonify(_meeting_payload(meeting)), 202
     finally:
         session.close()
+
+
+TERMINAL_EVENTS = ("done", "failed")
+
+
+def _status_event_name(meeting: Meeting) -> str:
+    """Map a meeting's stored state onto the pipeline event names."""
+    if meeting.status in TERMINAL_EVENTS or meeting.status == "transcribing":
+        return meeting.status
+    if meeting.status == "processing":
+        running = [stage.name for stage in meeting.stages if stage.status == "running"]
+        if running:
+            return STAGE_EVENTS[running[-1]]
+        return "processing"
+    return "queued"
+
+
+def _load_status_event(meeting_id: int) -> tuple[str, dict, int] | None:
+    session = SessionLocal.session_factory()
+    try:
+        meeting = session.get(Meeting, meeting_id)
+        if meeting is None:
+            return None
+        name = _status_event_name(meeting)
+        return name, meeting_event(meeting, name), meeting.version
+    finally:
+        session.close()
+
+
+def _sse(name: str, data: dict, event_id: int | None = None) -> str:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {name}", f"data: {json.dumps(data)}"]
+    return "\n".join(lines) + "\n\n"
+
+
+def _open_event_stream(meeting_id: int, last_event_id: int | None):
+    """Subscribe, then read the current state; None (and no subscription) for unknown meetings."""
+    # Subscribe before reading the current state so no transition is lost in between
+    subscription = get_event_broker().subscribe(meeting_id)
+    if last_event_id is not None:
+        subscription.replay_after(last_event_id)
+    current = _load_status_event(meeting_id)
+    if current is None:
+        subscription.close()
+        return None
+    return subscription, current
+
+
+async def _event_stream(subscription, meeting_id: int, current: tuple, config) -> AsyncIterator[str]:
+    """
+    The SSE body: the current state, then published events, cross-process
+    re-reads every ``SSE_RECHECK_SECONDS`` and keep-alives, until a terminal
+    event or ``SSE_MAX_STREAM_SECONDS``. Waiting happens on the event loop.
+    """
+    heartbeat = config.get("SSE_HEARTBEAT_SECONDS", 15.0)
+    recheck = config.get("SSE_RECHECK_SECONDS", 5.0)
+    max_seconds = config.get("SSE_MAX_STREAM_SECONDS", 300.0)
+    with subscription:
+        name, data, version = current
+        yield "retry: 3000\n\n"
+        yield _sse(name, data)
+        if name in TERMINAL_EVENTS:
+            return
+        now = time.monotonic()
+        deadline = now + max_seconds
+        last_sent = last_checked = now
+        while now < deadline:
+            events = await subscription.wait_events(timeout=min(heartbeat, recheck, deadline - now))
+            for event_id, event_name, event_data in events:
+                yield _sse(event_name, event_data, event_id)
+                if event_name in TERMINAL_EVENTS:
+                    return
+            now = time.monotonic()
+            if events:
+                last_sent = last_checked = now
+                version = None  # re-baseline at the next check instead of re-sending state
+            elif now - last_checked >= recheck:
+                last_checked = now
+                latest = await asyncio.to_thread(_load_status_event, meeting_id)
+                if latest is None:
+                    return
+                if version is not None and latest[2] != version:
+                    yield _sse(latest[0], latest[1])
+                    last_sent = now
+                    if latest[0] in TERMINAL_EVENTS:
+                        return
+                version = latest[2]
+            if now - last_sent >= heartbeat:
+                yield ": keep-alive\n\n"
+                last_sent = now
+
+
+def _iterate_blocking(stream: AsyncIterator[str]) -> Iterator[str]:
+    """Drive an async stream from a WSGI thread on a private event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(stream.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(stream.aclose())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
+@meetings_bp.route("/meetings/<int:meeting_id>/events", methods=["GET"])
+def meeting_events(meeting_id: int):
+    """
+    Server-Sent Events stream of pipeline transitions for one meeting.
+
+    Starts with the meeting's current state, then relays events published by
+    the orchestrator in this process. Commits made by other processes are
+    picked up by re-reading the meeting every ``SSE_RECHECK_SECONDS``. The
+    stream ends after ``done``/``failed`` or ``SSE_MAX_STREAM_SECONDS``;
+    browsers reconnect with ``Last-Event-ID``.
+
+    This WSGI route holds its thread for the life of the stream; deployments
+    serve ``asgi:app``, where ``meeting_events_asgi`` answers this path on
+    the event loop instead.
+    """
+    opened = _open_event_stream(meeting_id, request.headers.get("Last-Event-ID", type=int))
+    if opened is None:
+        return jsonify({"error": "Meeting not found"}), 404
+    subscription, current = opened
+    response = Response(
+        _iterate_blocking(_event_stream(subscription, meeting_id, current, current_app.config)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # Unsubscribes even if the client goes away before the stream starts
+    response.call_on_close(subscription.close)
+    return response
+
+
+async def meeting_events_asgi(app, meeting_id: int, scope: dict, receive, send) -> None:
+    """
+    ASGI handler for ``GET /meetings/<id>/events``: the same stream as
+    ``meeting_events``, but every open stream is a coroutine on the server's
+    event loop, so idle subscribers hold no thread. Database reads run in the
+    loop's default executor.
+    """
+    headers = dict(scope.get("headers") or [])
+    try:
+        last_event_id = int(headers[b"last-event-id"]) if b"last-event-id" in headers else None
+    except ValueError:
+        last_event_id = None
+    # Same CORS policy as the Flask app (all origins)
+    cors = [(b"access-control-allow-origin", b"*")]
+    opened = await asyncio.to_thread(_open_event_stream, meeting_id, last_event_id)
+    if opened is None:
+        await send({
+            "type": "http.response.start",
+            "status": 404,
+            "headers": [(b"content-type", b"application/json"), *cors],
+        })
+        await send({"type": "http.response.body", "body": json.dumps({"error": "Meeting not found"}).encode()})
+        return
+
+    subscription, current = opened
+    stream = _event_stream(subscription, meeting_id, current, app.config)
+
+    async def _client_gone() -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    disconnected = asyncio.ensure_future(_client_gone())
+    try:
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/event-stream; charset=utf-8"),
+                (b"cache-control", b"no-cache"),
+                (b"x-accel-buffering", b"no"),
+                *cors,
+            ],
+        })
+        while True:
+            chunk = asyncio.ensure_future(stream.__anext__())
+            # A client that leaves mid-wait is noticed now, not at the next keep-alive
+            await asyncio.wait((chunk, disconnected), return_when=asyncio.FIRST_COMPLETED)
+            if not chunk.done():
+                chunk.cancel()
+                await asyncio.gather(chunk, return_exceptions=True)
+                return
+            try:
+                body = chunk.result()
+            except StopAsyncIteration:
+                break
+            await send({"type": "http.response.body", "body": body.encode(), "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    except OSError:
+        logger.debug("Event stream client for meeting %s went away", meeting_id)
+    finally:
+        disconnected.cancel()
+        await stream.aclose()
+        subscription.close()
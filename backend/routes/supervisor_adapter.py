@@ -5,34 +5,44 @@ This blueprint provides endpoints compatible with the Supervisor Integration Age
 from __future__ import annotations
 
 import base64
+import json
 import logging
 import os
 import tempfile
 from pathlib import Path
+from typing import Iterator
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
 from pydantic import ValidationError
 
 try:
+    from backend.database import SessionLocal
     from backend.models.supervisor import (
         ErrorModel,
         OutputModel,
         SupervisorAgentRequest,
         SupervisorAgentResponse,
     )
-    from backend.pipelines.action_items import ActionExtractionError, extract_action_items
-    from backend.pipelines.summarization import SummarizationError, summarize_transcript
-    from backend.pipelines.transcription import transcribe_audio
+    from backend.pipelines.action_items import ActionExtractionError
+    from backend.pipelines.minutes import generate_minutes
+    from backend.pipelines.summarization import SummarizationError
+    from backend.pipelines.transcription import transcribe_audio, transcription_profile
+    from backend.services.storage import save_audio_file, write_audio_chunks
+    from backend.services.transcript_store import find_transcript, store_transcript
 except ModuleNotFoundError:
+    from database import SessionLocal
     from models.supervisor import (
         ErrorModel,
         OutputModel,
         SupervisorAgentRequest,
         SupervisorAgentResponse,
     )
-    from pipelines.action_items import ActionExtractionError, extract_action_items
-    from pipelines.summarization import SummarizationError, summarize_transcript
-    from pipelines.transcription import transcribe_audio
+    from pipelines.action_items import ActionExtractionError
+    from pipelines.minutes import generate_minutes
+    from pipelines.summarization import SummarizationError
+    from pipelines.transcription import transcribe_audio, transcription_profile
+    from services.storage import save_audio_file, write_audio_chunks
+    from services.transcript_store import find_transcript, store_transcript
 
 supervisor_bp = Blueprint("supervisor", __name__)
 logger = logging.getLogger(__name__)
@@ -108,6 +118,146 @@ def format_meeting_result_as_markdown(summary: str, action_items: list, metadata
     return "\n".join(lines)
 
 
+def _decode_base64_chunks(value: str, chunk_chars: int = 4 * 1024 * 1024) -> Iterator[bytes]:
+    """Decode base64 text incrementally (chunk size is a multiple of 4 characters)."""
+    if any(ch in value for ch in "\r\n "):
+        # Line-wrapped base64: drop whitespace so chunks stay 4-character aligned
+        value = "".join(value.split())
+    for start in range(0, len(value), chunk_chars):
+        yield base64.b64decode(value[start:start + chunk_chars])
+
+
+def _transcribe_supervisor_audio(audio_path: Path, audio_sha256: str) -> str:
+    """Transcribe saved audio, reusing the stored transcript for identical recordings."""
+    provider, model = transcription_profile()
+    session = SessionLocal()
+    try:
+        transcript = find_transcript(session, audio_sha256, provider, model) or ""
+    finally:
+        session.close()
+    if transcript:
+        logger.info(f"Reusing stored transcript for audio {audio_sha256[:12]}: {len(transcript)} characters")
+        return transcript
+
+    transcript = transcribe_audio(str(audio_path))
+    logger.info(f"Transcription successful: {len(transcript)} characters")
+    session = SessionLocal()
+    try:
+        store_transcript(session, audio_sha256, provider, model, transcript)
+    finally:
+        session.close()
+    return transcript
+
+
+def _followup_response(supervisor_request: SupervisorAgentRequest, transcript: str):
+    """Validate the transcript, generate minutes and build the Supervisor response."""
+    # Validate we have a transcript
+    if not transcript:
+        logger.warning("No transcript available (neither text nor audio file provided)")
+        response = SupervisorAgentResponse(
+            request_id=supervisor_request.request_id,
+            agent_name=supervisor_request.agent_name,
+            status="error",
+            output=None,
+            error=ErrorModel(
+                type="validation_error",
+                message="Transcript text is required in input.text field, or provide an audio file in metadata"
+            )
+        )
+        return jsonify(response.dict()), 400
+
+    # Validate transcript length
+    MIN_TRANSCRIPT_LENGTH = 50
+    if len(transcript) < MIN_TRANSCRIPT_LENGTH:
+        logger.warning(f"Transcript is too short ({len(transcript)} chars, minimum: {MIN_TRANSCRIPT_LENGTH})")
+        logger.warning(f"Received transcript: '{transcript}'")
+        response = SupervisorAgentResponse(
+            request_id=supervisor_request.request_id,
+            agent_name=supervisor_request.agent_name,
+            status="error",
+            output=None,
+            error=ErrorModel(
+                type="validation_error",
+                message=f"Transcript is too short ({len(transcript)} characters). Need at least {MIN_TRANSCRIPT_LENGTH} characters. Received: '{transcript}'"
+            )
+        )
+        return jsonify(response.dict()), 400
+
+    logger.info(f"Processing meeting with transcript: {len(transcript)} characters")
+
+    # Process the meeting transcript
+    try:
+        # The Supervisor has a fixed latency budget, so summary and action items
+        # are generated concurrently unless SUPERVISOR_MINUTES_MODE says otherwise
+        mode = current_app.config.get("SUPERVISOR_MINUTES_MODE", "concurrent")
+        minutes = generate_minutes(transcript, mode=mode)
+        summary = minutes["summary"]
+        action_items = minutes["action_items"]
+
+        # Build successful response
+        # Clean metadata - remove large base64 data before returning
+        clean_metadata = {k: v for k, v in supervisor_request.input.metadata.items() if k != "file_base64"}
+        if "filename" in supervisor_request.input.metadata:
+            clean_metadata["filename"] = supervisor_request.input.metadata["filename"]
+        if "mime_type" in supervisor_request.input.metadata:
+            clean_metadata["mime_type"] = supervisor_request.input.metadata["mime_type"]
+        if "language" in supervisor_request.input.metadata:
+            clean_metadata["language"] = supervisor_request.input.metadata["language"]
+
+        # Format as nice markdown
+        markdown_result = format_meeting_result_as_markdown(summary, action_items, clean_metadata)
+
+        result = {
+            "summary": summary,
+            "action_items": action_items,
+            "metadata": clean_metadata,
+            "markdown": markdown_result  # Include formatted markdown version
+        }
+
+        response = SupervisorAgentResponse(
+            request_id=supervisor_request.request_id,
+            agent_name=supervisor_request.agent_name,
+            status="success",
+            output=OutputModel(
+                result=markdown_result,  # Return markdown as main result for display
+                confidence=0.9,
+                details=f"Generated summary and {len(action_items)} action items from meeting transcript"
+            ),
+            error=None
+        )
+
+        logger.info(f"Successfully processed request {supervisor_request.request_id}")
+        return jsonify(response.dict()), 200
+
+    except SummarizationError as e:
+        logger.error(f"Summarization error: {e}")
+        response = SupervisorAgentResponse(
+            request_id=supervisor_request.request_id,
+            agent_name=supervisor_request.agent_name,
+            status="error",
+            output=None,
+            error=ErrorModel(
+                type="summarization_error",
+                message=str(e)
+            )
+        )
+        return jsonify(response.dict()), 500
+
+    except ActionExtractionError as e:
+        logger.error(f"Action extraction error: {e}")
+        response = SupervisorAgentResponse(
+            request_id=supervisor_request.request_id,
+            agent_name=supervisor_request.agent_name,
+            status="error",
+            output=None,
+            error=ErrorModel(
+                type="action_extraction_error",
+                message=str(e)
+            )
+        )
+        return jsonify(response.dict()), 500
+
+
 @supervisor_bp.route("/agents/supervisor/meeting-followup", methods=["POST"])
 def supervisor_meeting_followup():
     """
@@ -171,24 +321,18 @@ def supervisor_meeting_followup():
             # The text field typically contains the user's query like "summarize this meeting"
             # We need to transcribe the audio to get the actual transcript
             try:
-                # Decode base64 audio file
+                # Decode base64 audio to disk in chunks, hashing as we go
                 audio_base64 = metadata.get("file_base64", "")
-                audio_bytes = base64.b64decode(audio_base64)
-
-                # Save to temporary file
                 filename = metadata.get("filename", "audio.mp3")
                 file_ext = Path(filename).suffix or ".mp3"
-
-                with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
-                    tmp_file.write(audio_bytes)
-                    temp_path = tmp_file.name
-
-                logger.info(f"Saved audio to temp file: {temp_path} ({len(audio_bytes)} bytes)")
+                temp_path, audio_sha256 = write_audio_chunks(
+                    _decode_base64_chunks(audio_base64), Path(tempfile.gettempdir()), file_ext
+                )
+                logger.info(f"Saved audio to temp file: {temp_path}")
 
                 # Transcribe the audio
                 try:
-                    transcript = transcribe_audio(temp_path)
-                    logger.info(f"Transcription successful: {len(transcript)} characters")
+                    transcript = _transcribe_supervisor_audio(temp_path, audio_sha256)
                 finally:
                     # Clean up temp file
                     try:
@@ -210,126 +354,93 @@ def supervisor_meeting_followup():
                 )
                 return jsonify(response.dict()), 500
 
-        # Validate we have a transcript
-        if not transcript:
-            logger.warning("No transcript available (neither text nor audio file provided)")
-            response = SupervisorAgentResponse(
-                request_id=supervisor_request.request_id,
-                agent_name=supervisor_request.agent_name,
-                status="error",
-                output=None,
-                error=ErrorModel(
-                    type="validation_error",
-                    message="Transcript text is required in input.text field, or provide an audio file in metadata"
-                )
-            )
-            return jsonify(response.dict()), 400
-
-        # Validate transcript length
-        MIN_TRANSCRIPT_LENGTH = 50
-        if len(transcript) < MIN_TRANSCRIPT_LENGTH:
-            logger.warning(f"Transcript is too short ({len(transcript)} chars, minimum: {MIN_TRANSCRIPT_LENGTH})")
-            logger.warning(f"Received transcript: '{transcript}'")
-            response = SupervisorAgentResponse(
-                request_id=supervisor_request.request_id,
-                agent_name=supervisor_request.agent_name,
-                status="error",
-                output=None,
-                error=ErrorModel(
-                    type="validation_error",
-                    message=f"Transcript is too short ({len(transcript)} characters). Need at least {MIN_TRANSCRIPT_LENGTH} characters. Received: '{transcript}'"
-                )
-            )
-            return jsonify(response.dict()), 400
+        return _followup_response(supervisor_request, transcript)
 
-        logger.info(f"Processing meeting with transcript: {len(transcript)} characters")
+    except Exception as e:
+        logger.exception(f"Unexpected error in supervisor endpoint: {e}")
+        return jsonify({
+            "request_id": payload.get("request_id", "unknown") if payload else "unknown",
+            "agent_name": "meeting_followup_agent",
+            "status": "error",
+            "output": None,
+            "error": {
+                "type": "internal_error",
+                "message": f"Internal server error: {str(e)}"
+            }
+        }), 500
 
-        # Process the meeting transcript
-        try:
-            # Generate summary
-            summary = summarize_transcript(transcript)
 
-            # Extract action items
-            action_items = extract_action_items(
-                transcript=transcript,
-                summary=summary
-            )
+@supervisor_bp.route("/agents/supervisor/meeting-followup/upload", methods=["POST"])
+def supervisor_meeting_followup_upload():
+    """
+    Multipart variant of the meeting follow-up endpoint for large recordings.
 
-            # Build successful response
-            # Clean metadata - remove large base64 data before returning
-            clean_metadata = {k: v for k, v in supervisor_request.input.metadata.items() if k != "file_base64"}
-            if "filename" in supervisor_request.input.metadata:
-                clean_metadata["filename"] = supervisor_request.input.metadata["filename"]
-            if "mime_type" in supervisor_request.input.metadata:
-                clean_metadata["mime_type"] = supervisor_request.input.metadata["mime_type"]
-            if "language" in supervisor_request.input.metadata:
-                clean_metadata["language"] = supervisor_request.input.metadata["language"]
-
-            # Format as nice markdown
-            markdown_result = format_meeting_result_as_markdown(summary, action_items, clean_metadata)
-
-            result = {
-                "summary": summary,
-                "action_items": action_items,
-                "metadata": clean_metadata,
-                "markdown": markdown_result  # Include formatted markdown version
+    The ``request`` form field carries the SupervisorAgentRequest JSON and the
+    ``audio`` part carries the recording. The audio is streamed to disk in
+    chunks instead of travelling base64-encoded inside JSON, so memory use per
+    request stays bounded regardless of the file size.
+    """
+    logger.info("Received multipart meeting-followup request")
+    raw_request = request.form.get("request", "")
+    audio_file = request.files.get("audio")
+    try:
+        payload = json.loads(raw_request) if raw_request else None
+    except json.JSONDecodeError as e:
+        payload = None
+        logger.error(f"Invalid request JSON: {e}")
+    if not payload:
+        return jsonify({
+            "error": {
+                "type": "validation_error",
+                "message": "A 'request' form field with the Supervisor request JSON is required"
             }
+        }), 400
 
-            response = SupervisorAgentResponse(
-                request_id=supervisor_request.request_id,
-                agent_name=supervisor_request.agent_name,
-                status="success",
-                output=OutputModel(
-                    result=markdown_result,  # Return markdown as main result for display
-                    confidence=0.9,
-                    details=f"Generated summary and {len(action_items)} action items from meeting transcript"
-                ),
-                error=None
-            )
-
-            logger.info(f"Successfully processed request {supervisor_request.request_id}")
-            return jsonify(response.dict()), 200
-
-        except SummarizationError as e:
-            logger.error(f"Summarization error: {e}")
-            response = SupervisorAgentResponse(
-                request_id=supervisor_request.request_id,
-                agent_name=supervisor_request.agent_name,
-                status="error",
-                output=None,
-                error=ErrorModel(
-                    type="summarization_error",
-                    message=str(e)
-                )
-            )
-            return jsonify(response.dict()), 500
+    try:
+        supervisor_request = SupervisorAgentRequest(**payload)
+    except ValidationError as e:
+        logger.error(f"Validation error: {e}")
+        return jsonify({
+            "request_id": payload.get("request_id", "unknown"),
+            "agent_name": payload.get("agent_name", "meeting_followup_agent"),
+            "status": "error",
+            "output": None,
+            "error": {
+                "type": "validation_error",
+                "message": f"Invalid request format: {str(e)}"
+            }
+        }), 400
 
-        except ActionExtractionError as e:
-            logger.error(f"Action extraction error: {e}")
+    transcript = supervisor_request.input.text.strip()
+    if audio_file:
+        metadata = supervisor_request.input.metadata
+        metadata.setdefault("filename", audio_file.filename or "audio.mp3")
+        metadata.setdefault("mime_type", audio_file.mimetype or "audio/mpeg")
+        try:
+            temp_path, audio_sha256 = save_audio_file(audio_file, Path(tempfile.gettempdir()))
+            logger.info(f"Streamed audio to temp file: {temp_path}")
+            try:
+                transcript = _transcribe_supervisor_audio(temp_path, audio_sha256)
+            finally:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+        except Exception as e:
+            logger.exception(f"Failed to process audio file: {e}")
             response = SupervisorAgentResponse(
                 request_id=supervisor_request.request_id,
                 agent_name=supervisor_request.agent_name,
                 status="error",
                 output=None,
                 error=ErrorModel(
-                    type="action_extraction_error",
-                    message=str(e)
+                    type="transcription_error",
+                    message=f"Failed to process audio file: {str(e)}"
                 )
             )
             return jsonify(response.dict()), 500
 
-    except Exception as e:
-        logger.exception(f"Unexpected error in supervisor endpoint: {e}")
-        return jsonify({
-            "request_id": payload.get("request_id", "unknown") if payload else "unknown",
-            "agent_name": "meeting_followup_agent",
-            "status": "error",
-            "output": None,
-            "error": {
-                "type": "internal_error",
-                "message": f"Internal server error: {str(e)}"
-            }
-        }), 500
+    return _followup_response(supervisor_request, transcript)
 
 
 @supervisor_bp.route("/agents/supervisor/health", methods=["GET"])
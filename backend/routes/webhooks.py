@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hmac
+import logging
+
+from flask import Blueprint, current_app, jsonify, request
+
+try:
+    from backend.database import SessionLocal
+    from backend.models import Meeting
+    from backend.pipelines.orchestrator import complete_assemblyai_transcription
+    from backend.services.assembly import WEBHOOK_AUTH_HEADER
+    from backend.services.background import QueueFullError
+except ModuleNotFoundError:
+    from database import SessionLocal
+    from models import Meeting
+    from pipelines.orchestrator import complete_assemblyai_transcription
+    from services.assembly import WEBHOOK_AUTH_HEADER
+    from services.background import QueueFullError
+
+webhooks_bp = Blueprint("webhooks", __name__)
+logger = logging.getLogger(__name__)
+
+
+@webhooks_bp.route("/webhooks/assemblyai", methods=["POST"])
+def assemblyai_webhook():
+    """AssemblyAI completion callback; resumes the meeting's pipeline in the background."""
+    secret = current_app.config.get("ASSEMBLYAI_WEBHOOK_SECRET") or ""
+    if secret and not hmac.compare_digest(request.headers.get(WEBHOOK_AUTH_HEADER, ""), secret):
+        logger.warning("Rejected AssemblyAI webhook with invalid secret")
+        return jsonify({"error": "Invalid webhook secret"}), 401
+
+    payload = request.get_json(silent=True) or {}
+    transcript_id = payload.get("transcript_id")
+    if not transcript_id:
+        return jsonify({"error": "transcript_id is required"}), 400
+    logger.info("AssemblyAI webhook for %s (status=%s)", transcript_id, payload.get("status"))
+
+    session = SessionLocal()
+    try:
+        meeting = session.query(Meeting).filter(Meeting.transcription_id == transcript_id).first()
+        if meeting is None:
+            return jsonify({"error": "No meeting is waiting for this transcript"}), 404
+        meeting_id = meeting.id
+    finally:
+        session.close()
+
+    runner = current_app.extensions.get("background_runner")
+    if runner:
+        try:
+            # Audio already paid for transcription, so finishing it jumps the queue
+            runner.submit(complete_assemblyai_transcription, transcript_id, lane="high")
+        except QueueFullError as e:
+            # Non-2xx makes AssemblyAI redeliver the webhook later
+            logger.warning("Deferring webhook for meeting %s: %s", meeting_id, str(e))
+            response = jsonify({"error": "Job queue is full", "retry_after": e.retry_after})
+            response.headers["Retry-After"] = str(e.retry_after)
+            return response, 429
+        except Exception as e:
+            # Synchronous mode: the failure is already recorded on the meeting
+            logger.error("Failed to resume meeting %s: %s", meeting_id, str(e))
+    else:
+        logger.warning("Background runner not available")
+    return jsonify({"meeting_id": meeting_id, "status": "accepted"}), 200
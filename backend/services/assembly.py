@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+import logging
+import os
+import random
+import threading
 import time
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Dict, Iterable, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: rate limiting and transient server errors.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# For requests that must not run twice, only statuses that say the request was not processed.
+NON_IDEMPOTENT_RETRY_STATUSES = {429}
+
+
+# Header AssemblyAI echoes back on webhook deliveries so we can authenticate them.
+WEBHOOK_AUTH_HEADER = "X-Webhook-Secret"
 
 
 class AssemblyAIError(Exception):
@@ -18,8 +35,16 @@ class AssemblyAIClient:
         base_url: str = "https://api.assemblyai.com/v2",
         poll_interval: float = 3.0,
         poll_timeout: float = 600.0,
+        max_poll_interval: float = 30.0,
+        poll_backoff: float = 1.5,
         chunk_size: int = 5 * 1024 * 1024,
         session: requests.Session | None = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        retry_backoff_max: float = 10.0,
+        pool_maxsize: int = 10,
     ) -> None:
         if not api_key:
             raise AssemblyAIError("AssemblyAI API key is required")
@@ -27,13 +52,114 @@ class AssemblyAIClient:
         self.base_url = base_url.rstrip("/")
         self.poll_interval = poll_interval
         self.poll_timeout = poll_timeout
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
+        self.poll_backoff = max(poll_backoff, 1.0)
         self.chunk_size = chunk_size
-        self.session = session or requests.Session()
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.requests_sent = 0
+        self.retries = 0
+        self.failures = 0
+        if session is None:
+            session = requests.Session()
+            # Retries are handled in _request so upload bodies can be replayed.
+            self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=0)
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+        else:
+            self._adapter = None
+        self.session = session
 
     # Internal helpers -----------------------------------------------------
     def _auth_headers(self) -> dict:
         return {"authorization": self.api_key}
 
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter" keeps concurrent workers from retrying in lockstep
+        return random.uniform(0, min(self.retry_backoff_max, self.retry_backoff * (2 ** attempt)))
+
+    def _retry_after(self, response: requests.Response) -> float | None:
+        value = response.headers.get("Retry-After")
+        try:
+            return min(float(value), self.retry_backoff_max) if value else None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _connect_failed(exc: Exception) -> bool:
+        """True when the connection was never established, so the request was not sent."""
+        if isinstance(exc, requests.ConnectTimeout):
+            return True
+        reason = getattr(exc.args[0], "reason", None) if exc.args else None
+        return isinstance(exc, requests.ConnectionError) and isinstance(reason, NewConnectionError)
+
+    def _request(self, method: str, url: str, idempotent: bool = True, **kwargs: Any) -> requests.Response:
+        """
+        Send a request with timeouts, retrying 429/5xx and connection errors.
+
+        With ``idempotent=False`` (requests that create something server-side)
+        only connect failures and 429 are retried: after a 5xx or a read
+        timeout the request may already have been processed.
+        """
+        data_factory: Callable[[], Any] | None = kwargs.pop("data_factory", None)
+        retry_statuses = RETRY_STATUSES if idempotent else NON_IDEMPOTENT_RETRY_STATUSES
+        attempts = self.max_retries + 1
+        for attempt in range(attempts):
+            if data_factory is not None:
+                kwargs["data"] = data_factory()
+            self.requests_sent += 1
+            try:
+                response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt + 1 >= attempts or not (idempotent or self._connect_failed(exc)):
+                    self.failures += 1
+                    raise AssemblyAIError(f"Request to AssemblyAI failed: {exc}") from exc
+                delay = self._backoff(attempt)
+                reason = type(exc).__name__
+            else:
+                if response.status_code not in retry_statuses or attempt + 1 >= attempts:
+                    if response.status_code >= 400:
+                        self.failures += 1
+                    return response
+                delay = self._retry_after(response) or self._backoff(attempt)
+                reason = f"HTTP {response.status_code}"
+            self.retries += 1
+            logger.warning(
+                "AssemblyAI %s %s failed (%s); retry %d/%d in %.2fs",
+                method,
+                url,
+                reason,
+                attempt + 1,
+                self.max_retries,
+                delay,
+            )
+            time.sleep(delay)
+        raise AssemblyAIError("Request to AssemblyAI failed")  # pragma: no cover - loop always returns
+
+    def pool_stats(self) -> dict:
+        pools = []
+        if self._adapter is not None:
+            for key in list(self._adapter.poolmanager.pools.keys()):
+                pool = self._adapter.poolmanager.pools.get(key)
+                if pool is None:
+                    continue
+                pools.append(
+                    {
+                        "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                        "connections_opened": pool.num_connections,
+                        "requests": pool.num_requests,
+                        "idle_connections": pool.pool.qsize() if pool.pool is not None else 0,
+                    }
+                )
+        return {
+            "requests": self.requests_sent,
+            "retries": self.retries,
+            "failures": self.failures,
+            "pools": pools,
+        }
+
     def _read_file(self, path: Path) -> Iterable[bytes]:
         with path.open("rb") as file_obj:
             while True:
@@ -47,7 +173,12 @@ class AssemblyAIClient:
         if not file_path.exists():
             raise AssemblyAIError(f"File not found: {file_path}")
         url = f"{self.base_url}/upload"
-        response = self.session.post(url, headers=self._auth_headers(), data=self._read_file(file_path))
+        response = self._request(
+            "POST",
+            url,
+            headers=self._auth_headers(),
+            data_factory=lambda: self._read_file(file_path),
+        )
         if response.status_code >= 400:
             raise AssemblyAIError(f"Upload failed: {response.text}")
         upload_url = response.json().get("upload_url")
@@ -55,12 +186,26 @@ class AssemblyAIClient:
             raise AssemblyAIError("Upload response missing 'upload_url'")
         return upload_url
 
-    def request_transcription(self, audio_url: str, model: str | None = None) -> str:
+    def request_transcription(
+        self,
+        audio_url: str,
+        model: str | None = None,
+        webhook_url: str | None = None,
+        webhook_secret: str | None = None,
+    ) -> str:
         payload = {"audio_url": audio_url}
         if model:
             payload["model"] = model
-        response = self.session.post(
+        if webhook_url:
+            payload["webhook_url"] = webhook_url
+            if webhook_secret:
+                payload["webhook_auth_header_name"] = WEBHOOK_AUTH_HEADER
+                payload["webhook_auth_header_value"] = webhook_secret
+        response = self._request(
+            "POST",
             f"{self.base_url}/transcript",
+            # Each accepted POST starts (and bills) a new transcription job
+            idempotent=False,
             headers={**self._auth_headers(), "content-type": "application/json"},
             json=payload,
         )
@@ -71,14 +216,17 @@ class AssemblyAIClient:
             raise AssemblyAIError("Transcription response missing 'id'")
         return transcript_id
 
+    def get_transcription(self, transcript_id: str) -> dict:
+        response = self._request("GET", f"{self.base_url}/transcript/{transcript_id}", headers=self._auth_headers())
+        if response.status_code >= 400:
+            raise AssemblyAIError(f"Polling failed: {response.text}")
+        return response.json()
+
     def poll_transcription(self, transcript_id: str) -> dict:
         start_time = time.time()
-        url = f"{self.base_url}/transcript/{transcript_id}"
+        interval = self.poll_interval
         while True:
-            response = self.session.get(url, headers=self._auth_headers())
-            if response.status_code >= 400:
-                raise AssemblyAIError(f"Polling failed: {response.text}")
-            data = response.json()
+            data = self.get_transcription(transcript_id)
             status = data.get("status")
             if status == "completed":
                 return data
@@ -86,12 +234,50 @@ class AssemblyAIClient:
                 raise AssemblyAIError(data.get("error", "AssemblyAI reported an error"))
             if (time.time() - start_time) > self.poll_timeout:
                 raise AssemblyAIError("Polling timed out")
-            time.sleep(self.poll_interval)
+            time.sleep(interval)
+            interval = min(interval * self.poll_backoff, self.max_poll_interval)
 
-    def transcribe(self, audio_source: str, model: str | None = None) -> str:
-        transcript_id = self.request_transcription(audio_source, model=model)
-        result = self.poll_transcription(transcript_id)
+    @staticmethod
+    def transcript_text(result: dict) -> str:
+        if result.get("status") == "error":
+            raise AssemblyAIError(result.get("error", "AssemblyAI reported an error"))
         text = (result.get("text") or "").strip()
         if not text:
             raise AssemblyAIError("AssemblyAI returned an empty transcript")
         return text
+
+    def transcribe(self, audio_source: str, model: str | None = None) -> str:
+        transcript_id = self.request_transcription(audio_source, model=model)
+        return self.transcript_text(self.poll_transcription(transcript_id))
+
+
+_clients: Dict[Tuple[str, str], AssemblyAIClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_assemblyai_client(api_key: str, base_url: str) -> AssemblyAIClient:
+    """Return the process-wide client (and connection pool) for this account."""
+    key = (api_key, base_url.rstrip("/"))
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = AssemblyAIClient(
+                api_key=api_key,
+                base_url=base_url,
+                poll_interval=float(os.getenv("ASSEMBLYAI_POLL_INTERVAL", "3")),
+                poll_timeout=float(os.getenv("ASSEMBLYAI_POLL_TIMEOUT", "600")),
+                max_poll_interval=float(os.getenv("ASSEMBLYAI_POLL_MAX_INTERVAL", "30")),
+                connect_timeout=float(os.getenv("ASSEMBLYAI_CONNECT_TIMEOUT", "5")),
+                read_timeout=float(os.getenv("ASSEMBLYAI_READ_TIMEOUT", "60")),
+                max_retries=int(os.getenv("ASSEMBLYAI_MAX_RETRIES", "3")),
+                pool_maxsize=int(os.getenv("ASSEMBLYAI_POOL_MAXSIZE", "10")),
+            )
+            _clients[key] = client
+            logger.info("Created shared AssemblyAI client for %s", client.base_url)
+    return client
+
+
+def assemblyai_pool_stats() -> list[dict]:
+    with _clients_lock:
+        clients = list(_clients.values())
+    return [{"base_url": client.base_url, **client.pool_stats()} for client in clients]
@@ -1,20 +1,515 @@
+"""
+Durable background job queue backed by the ``jobs`` table.
+
+Submitted work is written to the database before it runs, so queued and
+in-flight jobs survive a restart. Worker threads claim jobs with a lease
+(``locked_until``); a job whose worker died becomes visible again once the
+lease expires, which gives at-least-once delivery. Failed jobs are retried
+with exponential backoff until ``max_attempts`` is reached. Workers delete
+``done`` jobs once they are ``retention_hours`` old; failed jobs are kept.
+
+Jobs are queued in priority lanes (``LANES``); each lane holds at most
+``max_depth`` waiting jobs, and ``enqueue`` raises ``QueueFullError`` beyond
+that so callers can push back instead of growing an unbounded backlog.
+"""
 from __future__ import annotations
 
-from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any, Callable
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict
+
+from sqlalchemy import and_, delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+try:
+    from backend.database import SessionLocal
+    from backend.models import Job
+except ModuleNotFoundError:
+    from database import SessionLocal
+    from models import Job
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+# Lane name -> priority; lower priorities are claimed first
+LANES = {"high": 0, "normal": 1, "low": 2}
+# Assumed job duration until enough jobs have completed to measure it
+DEFAULT_JOB_SECONDS = 30.0
+# How often an idle worker sweeps expired done jobs, and how many rows one DELETE removes
+PURGE_INTERVAL_SECONDS = 3600.0
+PURGE_BATCH_SIZE = 1000
+
+
+# Runner executing the current thread's job, so handlers can schedule follow-ups
+_running = threading.local()
+
+
+def current_runner() -> "BackgroundTaskRunner | None":
+    """The runner whose worker is running the calling job, or None outside a job."""
+    return getattr(_running, "runner", None)
+
+
+class PermanentJobError(ValueError):
+    """Raised by a task for a failure every attempt would repeat (e.g. invalid input); the job fails without retrying."""
+
+
+class QueueFullError(Exception):
+    def __init__(self, lane: str, depth: int, retry_after: int) -> None:
+        super().__init__(f"Job queue lane '{lane}' is full ({depth} waiting)")
+        self.lane = lane
+        self.depth = depth
+        self.retry_after = retry_after
 
 
 class BackgroundTaskRunner:
-    def __init__(self, max_workers: int = 2, enabled: bool = True) -> None:
+    def __init__(
+        self,
+        max_workers: int = 2,
+        enabled: bool = True,
+        session_factory: Callable[[], Session] | None = None,
+        poll_interval: float = 1.0,
+        visibility_timeout: float = 900.0,
+        max_attempts: int = 3,
+        retry_backoff: float = 30.0,
+        retry_backoff_max: float = 900.0,
+        max_depth: int = 100,
+        retention_hours: float = 168.0,
+    ) -> None:
         self.enabled = enabled
-        self._executor = ThreadPoolExecutor(max_workers=max_workers) if enabled else None
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+        self.poll_interval = poll_interval
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.retention_hours = retention_hours
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._session_factory = session_factory
+        self._tasks: Dict[str, Callable[..., Any]] = {}
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._purge_lock = threading.Lock()
+        self._next_purge = 0.0
+
+    # Registration / submission -------------------------------------------------
 
-    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Any:
-        if not self.enabled or self._executor is None:
+    def register(self, func: Callable[..., Any], name: str | None = None) -> Callable[..., Any]:
+        """Make ``func`` runnable from the queue; jobs store only its name and JSON arguments."""
+        self._tasks[name or func.__name__] = func
+        return func
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args,
+        lane: str = "normal",
+        on_admitted: Callable[[], None] | None = None,
+        **kwargs,
+    ) -> Any:
+        if not self.enabled:
+            if on_admitted is not None:
+                on_admitted()
             return func(*args, **kwargs)
-        future: Future = self._executor.submit(func, *args, **kwargs)
-        return future
+        return self.enqueue(func, args=args, kwargs=kwargs, lane=lane, on_admitted=on_admitted)
+
+    def enqueue(
+        self,
+        func: Callable[..., Any],
+        args: tuple | list = (),
+        kwargs: dict | None = None,
+        dedupe_key: str | None = None,
+        lane: str = "normal",
+        enforce_depth: bool = True,
+        delay: float = 0.0,
+        on_admitted: Callable[[], None] | None = None,
+    ) -> int | None:
+        """
+        Persist a job and wake a worker. Returns the job id, or None when an
+        identical job (same task and arguments) is already queued or running.
+        With ``delay`` the job becomes claimable only after that many seconds.
+        ``on_admitted`` runs once the job has passed the depth check, before
+        it is committed and so before any worker can start it.
+
+        Raises QueueFullError when ``lane`` already holds ``max_depth`` waiting
+        jobs, unless ``enforce_depth`` is False (used for recovery and retries
+        of work that was already admitted).
+        """
+        if lane not in LANES:
+            raise ValueError(f"Unknown job lane {lane!r}; expected one of {', '.join(LANES)}")
+        task = self._task_name(func)
+        payload = json.dumps({"args": list(args), "kwargs": kwargs or {}}, sort_keys=True)
+        dedupe_key = dedupe_key or f"{task}:{payload}"[:255]
+        session = self._session()
+        try:
+            existing = (
+                session.query(Job.id)
+                .filter(Job.dedupe_key == dedupe_key, Job.status.in_(ACTIVE_STATUSES))
+                .first()
+            )
+            if existing is not None:
+                logger.info("Job %s already active for %s; not enqueuing again", existing[0], dedupe_key)
+                return None
+            if enforce_depth:
+                self._admit(session, lane)
+            job = Job(
+                task=task,
+                payload=payload,
+                dedupe_key=dedupe_key,
+                status="queued",
+                priority=LANES[lane],
+                max_attempts=self.max_attempts,
+                available_at=datetime.utcnow() + timedelta(seconds=delay),
+            )
+            session.add(job)
+            if on_admitted is not None:
+                on_admitted()
+            session.commit()
+            job_id = job.id
+        finally:
+            session.close()
+        self._wakeup.set()
+        return job_id
+
+    def submit_many(
+        self, func: Callable[..., Any], args_list: list, lane: str = "normal", enforce_depth: bool = True
+    ) -> list:
+        if not self.enabled:
+            return [func(*args) for args in args_list]
+        return self.enqueue_many(func, args_list, lane=lane, enforce_depth=enforce_depth)
+
+    def enqueue_many(
+        self, func: Callable[..., Any], args_list: list, lane: str = "normal", enforce_depth: bool = True
+    ) -> list[int]:
+        """
+        Persist one job per argument tuple with a single INSERT and wake the
+        workers; returns the job ids in order. Unlike ``enqueue`` there is no
+        duplicate check, so use it for new work only (e.g. freshly created
+        meetings). With ``enforce_depth`` the whole group is admitted or
+        rejected with QueueFullError.
+        """
+        if lane not in LANES:
+            raise ValueError(f"Unknown job lane {lane!r}; expected one of {', '.join(LANES)}")
+        if not args_list:
+            return []
+        task = self._task_name(func)
+        now = datetime.utcnow()
+        rows = []
+        for args in args_list:
+            payload = json.dumps({"args": list(args), "kwargs": {}}, sort_keys=True)
+            rows.append({
+                "task": task,
+                "payload": payload,
+                "dedupe_key": f"{task}:{payload}"[:255],
+                "status": "queued",
+                "priority": LANES[lane],
+                "max_attempts": self.max_attempts,
+                "available_at": now,
+            })
+        session = self._session()
+        try:
+            if enforce_depth:
+                self._admit(session, lane, count=len(rows))
+            job_ids = list(session.scalars(insert(Job).returning(Job.id, sort_by_parameter_order=True), rows))
+            session.commit()
+        finally:
+            session.close()
+        self._wakeup.set()
+        return job_ids
+
+    def _admit(self, session: Session, lane: str, count: int = 1) -> None:
+        depth = (
+            session.query(func.count(Job.id))
+            .filter(Job.status == "queued", Job.priority == LANES[lane])
+            .scalar()
+        )
+        if depth + count > self.max_depth:
+            raise QueueFullError(lane, depth, self._retry_after(session))
+
+    def check_capacity(self, lane: str = "normal", count: int = 1) -> None:
+        """Raise QueueFullError if ``count`` jobs submitted to ``lane`` now would be rejected."""
+        if not self.enabled:
+            return
+        session = self._session()
+        try:
+            self._admit(session, lane, count=count)
+        finally:
+            session.close()
+
+    def _average_job_seconds(self, session: Session, sample: int = 50) -> float:
+        rows = (
+            session.query(Job.started_at, Job.finished_at)
+            .filter(Job.status == "done", Job.started_at.isnot(None), Job.finished_at.isnot(None))
+            .order_by(Job.finished_at.desc())
+            .limit(sample)
+            .all()
+        )
+        if not rows:
+            return DEFAULT_JOB_SECONDS
+        return sum((finished - started).total_seconds() for started, finished in rows) / len(rows)
+
+    def _retry_after(self, session: Session) -> int:
+        # A slot opens roughly every (average job time / workers) seconds
+        return max(1, math.ceil(self._average_job_seconds(session) / max(self.max_workers, 1)))
+
+    def queue_status(self) -> dict:
+        """Depth, estimated wait and saturation per lane, for load balancers and monitoring."""
+        session = self._session()
+        try:
+            now = datetime.utcnow()
+            lane_names = {priority: lane for lane, priority in LANES.items()}
+            depths = {lane: 0 for lane in LANES}
+            for priority, count in (
+                session.query(Job.priority, func.count(Job.id))
+                .filter(Job.status == "queued")
+                .group_by(Job.priority)
+            ):
+                if priority in lane_names:
+                    depths[lane_names[priority]] = count
+            running = session.query(func.count(Job.id)).filter(Job.status == "running").scalar()
+            oldest = session.query(func.min(Job.created_at)).filter(Job.status == "queued").scalar()
+            average = self._average_job_seconds(session)
+            workers = max(self.max_workers, 1)
+            lanes = {}
+            for lane, priority in LANES.items():
+                # Jobs in this lane and in higher-priority lanes run first
+                ahead = running + sum(depths[other] for other, p in LANES.items() if p <= priority)
+                lanes[lane] = {
+                    "depth": depths[lane],
+                    "max_depth": self.max_depth,
+                    "saturated": depths[lane] >= self.max_depth,
+                    "estimated_wait_seconds": round(ahead * average / workers, 1),
+                }
+            return {
+                "workers": self.max_workers,
+                "running": running,
+                "average_job_seconds": round(average, 2),
+                "oldest_queued_seconds": round((now - oldest).total_seconds(), 1) if oldest else 0.0,
+                "lanes": lanes,
+            }
+        finally:
+            session.close()
+
+    def _task_name(self, func: Callable[..., Any]) -> str:
+        for name, registered in self._tasks.items():
+            if registered is func:
+                return name
+        raise ValueError(f"Task {getattr(func, '__name__', func)!r} is not registered with the job queue")
+
+    def _session(self) -> Session:
+        factory = self._session_factory or SessionLocal.session_factory
+        return factory()
+
+    # Workers -------------------------------------------------------------------
+
+    def start(self) -> None:
+        if not self.enabled or self._threads:
+            return
+        self._stop.clear()
+        for index in range(self.max_workers):
+            thread = threading.Thread(target=self._work, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        heartbeat = threading.Thread(target=self._heartbeat, name="job-heartbeat", daemon=True)
+        heartbeat.start()
+        self._threads.append(heartbeat)
+        logger.info("Started %d job workers (%s)", self.max_workers, self.worker_id)
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = self.run_next()
+            except Exception:
+                logger.exception("Job worker loop failed; backing off")
+                ran = False
+            if not ran:
+                self._maybe_purge()
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+    def _maybe_purge(self) -> None:
+        # One idle worker per interval; the others skip straight to waiting
+        now = time.monotonic()
+        if now < self._next_purge or not self._purge_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_purge = now + PURGE_INTERVAL_SECONDS
+            self.purge_finished()
+        except Exception:
+            logger.exception("Failed to purge finished jobs")
+        finally:
+            self._purge_lock.release()
+
+    def purge_finished(self, older_than: timedelta | None = None) -> int:
+        """
+        Delete ``done`` jobs that finished more than ``older_than`` ago
+        (default ``retention_hours``), in batches of PURGE_BATCH_SIZE so the
+        table is never locked for long. Returns the number deleted.
+        """
+        cutoff = datetime.utcnow() - (older_than if older_than is not None else timedelta(hours=self.retention_hours))
+        deleted = 0
+        session = self._session()
+        try:
+            while True:
+                expired = (
+                    select(Job.id)
+                    .where(Job.status == "done", Job.finished_at < cutoff)
+                    .limit(PURGE_BATCH_SIZE)
+                    .scalar_subquery()
+                )
+                count = session.execute(delete(Job).where(Job.id.in_(expired))).rowcount
+                session.commit()
+                deleted += count
+                if count < PURGE_BATCH_SIZE:
+                    break
+        finally:
+            session.close()
+        if deleted:
+            logger.info("Purged %d done job(s) finished before %s", deleted, cutoff.isoformat())
+        return deleted
+
+    def _heartbeat(self) -> None:
+        # Extend the lease of jobs this process is still running so long
+        # transcriptions are not handed to another worker mid-flight.
+        interval = max(self.visibility_timeout / 3, 0.01)
+        while not self._stop.wait(interval):
+            session = self._session()
+            try:
+                (
+                    session.query(Job)
+                    .filter(Job.status == "running", Job.locked_by == self.worker_id)
+                    .update(
+                        {Job.locked_until: datetime.utcnow() + timedelta(seconds=self.visibility_timeout)},
+                        synchronize_session=False,
+                    )
+                )
+                session.commit()
+            except Exception:
+                session.rollback()
+                logger.exception("Failed to renew job leases")
+            finally:
+                session.close()
+
+    def _claimable(self, now: datetime):
+        return or_(
+            and_(Job.status == "queued", Job.available_at <= now),
+            and_(Job.status == "running", Job.locked_until < now),
+        )
+
+    def _claim(self, session: Session) -> Job | None:
+        now = datetime.utcnow()
+        # Two index-ordered lookups rather than one OR: jobs with expired leases
+        # first (their worker died), then queued jobs by lane and due time
+        expired = (
+            session.query(Job.id)
+            .filter(Job.status == "running", Job.locked_until < now)
+            .order_by(Job.locked_until)
+            .limit(self.max_workers + 1)
+            .all()
+        )
+        queued = (
+            session.query(Job.id)
+            .filter(Job.status == "queued", Job.available_at <= now)
+            .order_by(Job.priority, Job.available_at, Job.id)
+            .limit(self.max_workers + 1)
+            .all()
+        )
+        for (job_id,) in expired + queued:
+            # Conditional update: only one worker (in any process) wins the claim
+            claimed = (
+                session.query(Job)
+                .filter(Job.id == job_id, self._claimable(now))
+                .update(
+                    {
+                        Job.status: "running",
+                        Job.attempts: Job.attempts + 1,
+                        Job.locked_by: self.worker_id,
+                        Job.locked_until: now + timedelta(seconds=self.visibility_timeout),
+                        Job.started_at: now,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            session.commit()
+            if claimed:
+                return session.get(Job, job_id)
+        return None
+
+    def run_next(self) -> bool:
+        """Claim and run one job. Returns False when nothing was available."""
+        session = self._session()
+        try:
+            job = self._claim(session)
+            if job is None:
+                return False
+            self._run(session, job)
+            return True
+        finally:
+            session.close()
+
+    def _run(self, session: Session, job: Job) -> None:
+        handler = self._tasks.get(job.task)
+        if handler is None:
+            self._finish(session, job, "failed", f"Unknown task {job.task!r}")
+            return
+        if job.attempts > job.max_attempts:
+            self._finish(session, job, "failed", job.last_error or "Lease expired too many times")
+            return
+
+        payload = json.loads(job.payload or "{}")
+        logger.info("Running job %s %s (attempt %d/%d)", job.id, job.task, job.attempts, job.max_attempts)
+        _running.runner = self
+        try:
+            handler(*payload.get("args", []), **payload.get("kwargs", {}))
+        except Exception as exc:
+            session.rollback()
+            error = f"{type(exc).__name__}: {exc}"
+            if isinstance(exc, PermanentJobError) or job.attempts >= job.max_attempts:
+                logger.error("Job %s %s failed permanently: %s", job.id, job.task, error)
+                self._finish(session, job, "failed", error)
+                return
+            delay = min(self.retry_backoff * (2 ** (job.attempts - 1)), self.retry_backoff_max)
+            logger.warning("Job %s %s failed (%s); retrying in %.1fs", job.id, job.task, error, delay)
+            job.status = "queued"
+            job.last_error = error
+            job.locked_by = None
+            job.locked_until = None
+            job.available_at = datetime.utcnow() + timedelta(seconds=delay)
+            session.commit()
+            return
+        finally:
+            _running.runner = None
+        self._finish(session, job, "done", None)
+
+    def _finish(self, session: Session, job: Job, status: str, error: str | None) -> None:
+        job.status = status
+        job.finished_at = datetime.utcnow()
+        job.last_error = error
+        job.locked_by = None
+        job.locked_until = None
+        session.commit()
+
+    def stats(self) -> dict:
+        session = self._session()
+        try:
+            counts = {status: 0 for status in ("queued", "running", "done", "failed")}
+            for status, count in session.query(Job.status, func.count(Job.id)).group_by(Job.status):
+                counts[status] = count
+            return {"enabled": self.enabled, "workers": self.max_workers, "jobs": counts}
+        finally:
+            session.close()
 
     def shutdown(self) -> None:
-        if self._executor:
-            self._executor.shutdown(wait=False)
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout=1)
+        self._threads = []
@@ -0,0 +1,166 @@
+"""
+In-process publish/subscribe of meeting pipeline events.
+
+The orchestrator publishes stage transitions (queued, transcribing,
+summarizing, extracting, done, failed) per meeting; SSE responses subscribe.
+Each meeting has its own channel with a short replay buffer (for
+``Last-Event-ID`` reconnects) and a condition variable, so publishing wakes
+only that meeting's subscribers. Subscribers wait either on the condition
+(``next_events``, blocking the calling thread) or, from an event loop, with
+``wait_events``: publishing then schedules a wake-up on each waiting loop,
+so any number of idle streams share the loop's single thread. Channels
+without subscribers are dropped least-recently-used first once
+``max_channels`` is exceeded.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Set, Tuple
+
+Event = Tuple[int, str, Dict[str, Any]]  # (event id, event name, data)
+
+
+class _Channel:
+    def __init__(self, history: int) -> None:
+        self.condition = threading.Condition()
+        self.events: Deque[Event] = deque(maxlen=history)
+        self.next_id = 1
+        self.subscribers = 0
+        # (loop, asyncio.Event) of wait_events callers, woken from any thread by publish
+        self.waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+
+class EventBroker:
+    def __init__(self, history: int = 50, max_channels: int = 1000) -> None:
+        self.history = history
+        self.max_channels = max_channels
+        self._channels: "OrderedDict[int, _Channel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def _channel(self, meeting_id: int) -> _Channel:
+        with self._lock:
+            channel = self._channels.get(meeting_id)
+            if channel is None:
+                channel = self._channels[meeting_id] = _Channel(self.history)
+                self._prune_locked()
+            self._channels.move_to_end(meeting_id)
+            return channel
+
+    def _prune_locked(self) -> None:
+        if len(self._channels) <= self.max_channels:
+            return
+        for meeting_id in list(self._channels):
+            if len(self._channels) <= self.max_channels:
+                break
+            if self._channels[meeting_id].subscribers == 0:
+                del self._channels[meeting_id]
+
+    def publish(self, meeting_id: int, name: str, data: Dict[str, Any]) -> int:
+        channel = self._channel(meeting_id)
+        with channel.condition:
+            event_id = channel.next_id
+            channel.next_id += 1
+            channel.events.append((event_id, name, data))
+            channel.condition.notify_all()
+            for loop, waiter in channel.waiters:
+                try:
+                    loop.call_soon_threadsafe(waiter.set)
+                except RuntimeError:  # loop already closed; its subscriber is gone
+                    pass
+        self.published += 1
+        return event_id
+
+    def subscribe(self, meeting_id: int) -> "Subscription":
+        return Subscription(self._channel(meeting_id))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "channels": len(self._channels),
+                "subscribers": sum(channel.subscribers for channel in self._channels.values()),
+                "published": self.published,
+            }
+
+
+class Subscription:
+    """Cursor over one meeting's channel; use as a context manager."""
+
+    def __init__(self, channel: _Channel) -> None:
+        self._channel = channel
+        self._closed = False
+        with channel.condition:
+            channel.subscribers += 1
+            # Only events published from now on, unless ``replay_after`` says otherwise
+            self.last_id = channel.next_id - 1
+
+    def replay_after(self, last_event_id: int) -> None:
+        with self._channel.condition:
+            # Ids from before a restart may be ahead of this channel; ignore those
+            if last_event_id < self._channel.next_id:
+                self.last_id = last_event_id
+
+    def _take_pending_locked(self) -> List[Event]:
+        pending = [event for event in self._channel.events if event[0] > self.last_id]
+        if pending:
+            self.last_id = pending[-1][0]
+        return pending
+
+    def next_events(self, timeout: float) -> List[Event]:
+        """Return events newer than the last one seen, waiting up to ``timeout`` for some."""
+        channel = self._channel
+        deadline = time.monotonic() + timeout
+        with channel.condition:
+            while True:
+                pending = self._take_pending_locked()
+                remaining = deadline - time.monotonic()
+                if pending or remaining <= 0:
+                    return pending
+                channel.condition.wait(remaining)
+
+    async def wait_events(self, timeout: float) -> List[Event]:
+        """``next_events`` for coroutines: waits on the running loop instead of blocking a thread."""
+        channel = self._channel
+        loop = asyncio.get_running_loop()
+        waiter = (loop, asyncio.Event())
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                with channel.condition:
+                    pending = self._take_pending_locked()
+                    remaining = deadline - time.monotonic()
+                    if pending or remaining <= 0:
+                        return pending
+                    waiter[1].clear()
+                    channel.waiters.add(waiter)
+                try:
+                    await asyncio.wait_for(waiter[1].wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with channel.condition:
+                channel.waiters.discard(waiter)
+
+    def close(self) -> None:
+        """Release the subscription; safe to call more than once."""
+        with self._channel.condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._channel.subscribers -= 1
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_broker = EventBroker()
+
+
+def get_event_broker() -> EventBroker:
+    return _broker
@@ -0,0 +1,96 @@
+"""
+Process-wide registry of Gemini chat clients and prompt templates.
+
+Building a ``ChatGoogleGenerativeAI`` configures the Google SDK and opens a
+fresh transport, so pipelines share one client per (model, temperature,
+api key) instead of constructing a new one on every call.
+
+LangChain and the Google SDK take about two seconds to import, so they are
+imported on first use rather than when the app (or a test process) boots;
+``MOCK_*`` modes and the rule-based extractor never load them.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Tuple
+
+if TYPE_CHECKING:
+    from langchain.prompts import ChatPromptTemplate
+    from langchain_core.runnables import Runnable
+    from langchain_google_genai import ChatGoogleGenerativeAI as _ChatModel
+
+logger = logging.getLogger(__name__)
+
+# Resolved on first use (tests replace it with a fake)
+ChatGoogleGenerativeAI = None
+
+_clients: Dict[Tuple[str, float, str], "_ChatModel"] = {}
+_structured: Dict[Tuple[str, float, str, str], "Runnable | None"] = {}
+_clients_lock = threading.Lock()
+
+
+def _chat_model_class():
+    global ChatGoogleGenerativeAI
+    if ChatGoogleGenerativeAI is None:
+        from langchain_google_genai import ChatGoogleGenerativeAI as chat_model_class
+
+        ChatGoogleGenerativeAI = chat_model_class
+    return ChatGoogleGenerativeAI
+
+
+def get_chat_model(model: str, temperature: float, api_key: str) -> "_ChatModel":
+    key = (model, float(temperature), api_key)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            logger.info("Creating Gemini client for model %s (temperature=%s)", model, temperature)
+            client = _chat_model_class()(
+                model=model,
+                temperature=temperature,
+                google_api_key=api_key,
+                convert_system_message_to_human=True,
+            )
+            _clients[key] = client
+    return client
+
+
+def get_structured_model(model: str, temperature: float, api_key: str, schema: dict) -> "Runnable | None":
+    """
+    The shared client bound to a JSON ``schema`` via ``with_structured_output``,
+    so Gemini is constrained to replies that match it; ``invoke`` then returns
+    a dict. Returns None when the installed integration has no structured
+    output support, in which case callers parse the text reply themselves.
+    """
+    key = (model, float(temperature), api_key, schema["title"])
+    with _clients_lock:
+        if key in _structured:
+            return _structured[key]
+    client = get_chat_model(model, temperature, api_key)
+    with_structured_output = getattr(client, "with_structured_output", None)
+    try:
+        structured = with_structured_output(schema) if with_structured_output is not None else None
+    except NotImplementedError:
+        structured = None
+    if structured is None:
+        logger.info("Structured output is not supported by %s; using text replies", type(client).__name__)
+    with _clients_lock:
+        return _structured.setdefault(key, structured)
+
+
+def clear_chat_models() -> None:
+    with _clients_lock:
+        _clients.clear()
+        _structured.clear()
+
+
+@lru_cache(maxsize=None)
+def get_prompt(messages: Tuple[Tuple[str, str], ...]) -> "ChatPromptTemplate":
+    """The ``ChatPromptTemplate`` for a tuple of (role, template) messages, built once."""
+    from langchain.prompts import ChatPromptTemplate
+
+    return ChatPromptTemplate.from_messages(list(messages))
@@ -0,0 +1,141 @@
+"""
+Persistent, content-addressed cache for LLM pipeline results.
+
+Entries are keyed by a SHA-256 of the normalized transcript, model name,
+prompt version and call parameters, so re-processing the same meeting
+(supervisor retries, re-submitted uploads) skips the Gemini round trip.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    return " ".join((text or "").split())
+
+
+def make_cache_key(namespace: str, text: str, model: str, prompt_version: str, **params: Any) -> str:
+    material = json.dumps(
+        {
+            "namespace": namespace,
+            "text": normalize_text(text),
+            "model": model,
+            "prompt_version": prompt_version,
+            "params": params,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResultCache:
+    """SQLite-backed LRU cache with a TTL and hit/miss counters."""
+
+    def __init__(self, path: str | Path, ttl_seconds: float = 7 * 24 * 3600, max_entries: int = 1000) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed_at ON llm_cache (accessed_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self.evictions += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now),
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        if self.ttl_seconds:
+            expired = conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+            self.evictions += max(expired, 0)
+        if self.max_entries:
+            overflow = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN "
+                    "(SELECT key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self.evictions += overflow
+
+    def stats(self) -> dict:
+        with self._lock, self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+        }
+
+
+_cache: LLMResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResultCache | None:
+    """Return the process-wide cache, or None when caching is disabled."""
+    global _cache
+
+    if os.getenv("LLM_CACHE_ENABLED", "true").lower() != "true":
+        return None
+    path = Path(os.getenv("LLM_CACHE_PATH", "llm_cache.db"))
+    with _cache_lock:
+        if _cache is None or _cache.path != path:
+            _cache = LLMResultCache(
+                path,
+                ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600))),
+                max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000")),
+            )
+            logger.info("LLM result cache opened at %s", path)
+    return _cache
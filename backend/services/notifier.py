@@ -0,0 +1,69 @@
+"""
+In-process change notifications for meetings.
+
+Every committed change that bumps ``Meeting.version`` wakes the requests
+long-polling that meeting. Waiters block on a per-meeting event, so a change
+wakes only the requests watching that meeting, however many are idle.
+Changes committed by other processes are not signalled here; waiters also
+re-check the database periodically.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class MeetingNotifier:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # meeting id -> (event for the next change, number of waiters)
+        self._waiters: Dict[int, Tuple[threading.Event, int]] = {}
+
+    def notify(self, meeting_ids: Iterable[int]) -> None:
+        with self._lock:
+            for meeting_id in meeting_ids:
+                entry = self._waiters.pop(meeting_id, None)
+                if entry is not None:
+                    entry[0].set()
+
+    def wait(self, meeting_id: int, timeout: float) -> bool:
+        """Block until the meeting changes or ``timeout`` passes; True if it changed."""
+        with self._lock:
+            changed, waiters = self._waiters.get(meeting_id, (threading.Event(), 0))
+            self._waiters[meeting_id] = (changed, waiters + 1)
+        try:
+            return changed.wait(timeout)
+        finally:
+            with self._lock:
+                entry = self._waiters.get(meeting_id)
+                if entry is not None and entry[0] is changed:
+                    if entry[1] <= 1:
+                        del self._waiters[meeting_id]
+                    else:
+                        self._waiters[meeting_id] = (changed, entry[1] - 1)
+
+    def waiting(self) -> int:
+        with self._lock:
+            return sum(waiters for _, waiters in self._waiters.values())
+
+
+_notifier = MeetingNotifier()
+
+
+def get_meeting_notifier() -> MeetingNotifier:
+    return _notifier
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_committed_changes(session: Session) -> None:
+    changed = session.info.pop("changed_meeting_ids", None)
+    if changed:
+        _notifier.notify(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_changes(session: Session) -> None:
+    session.info.pop("changed_meeting_ids", None)
@@ -0,0 +1,225 @@
+"""
+Full-text search over meeting titles, transcripts and summaries.
+
+Backed by an SQLite FTS5 table (``meetings_fts``, rowid = meeting id) in
+external-content mode: it stores only the index, and reads the text through
+the ``meetings_fts_source`` view, which joins ``meetings`` with the
+compressed ``meeting_contents`` and decompresses with a SQL function
+registered on every SQLite connection. Snippets therefore decompress only
+the rows returned.
+
+The index is maintained from the ORM flush, in the same transaction as the
+meeting change, so every commit the pipeline makes is searchable as soon as
+it is visible: before the flush, changed meetings' current rows are removed
+from the index (external-content deletes need the old text), and after it
+their new rows are added. Bulk inserts that bypass the ORM call
+``index_meetings`` for the new ids; other bulk statements
+(``bulk_insert_mappings``, ``query.update``) need ``rebuild_search_index``
+afterwards.
+
+Results are ranked with BM25, weighting title over summary over transcript;
+the weights are stored as the table's default ``rank`` so ``ORDER BY rank``
+is answered by FTS5 without a sort.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+import weakref
+from typing import Iterable, List
+
+from sqlalchemy import DateTime, Float, Integer, String, Text, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+try:
+    from backend.models import Meeting, MeetingContent, decompress_text
+except ModuleNotFoundError:
+    from models import Meeting, MeetingContent, decompress_text
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "meetings_fts"
+SOURCE_VIEW = "meetings_fts_source"
+INDEXED_FIELDS = ("title", "transcript", "summary")
+# BM25 column weights, in INDEXED_FIELDS order
+RANK_WEIGHTS = (10.0, 1.0, 4.0)
+SNIPPET_TOKENS = 16
+
+# Engines whose database has the FTS table; flushes elsewhere skip indexing
+_indexed_engines: "weakref.WeakSet" = weakref.WeakSet()
+
+
+class SearchUnavailableError(Exception):
+    """Raised when the database has no full-text index (not SQLite, or FTS5 missing)."""
+
+
+@event.listens_for(Engine, "connect")
+def _register_sql_functions(dbapi_connection, connection_record) -> None:
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_function("decompress_text", 1, decompress_text, deterministic=True)
+
+
+def search_index_exists(session: Session) -> bool:
+    return session.get_bind() in _indexed_engines
+
+
+def ensure_search_index(session: Session) -> bool:
+    """Create and fill the FTS table if missing or outdated. Returns True if it was (re)built."""
+    engine = session.get_bind()
+    if engine.dialect.name != "sqlite":
+        logger.info("Full-text search needs SQLite FTS5; %s has no search index", engine.dialect.name)
+        return False
+
+    existing = session.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+    ).scalar()
+    if existing and f"content='{SOURCE_VIEW}'" in existing:
+        _indexed_engines.add(engine)
+        return False
+
+    columns = ", ".join(INDEXED_FIELDS)
+    try:
+        if existing:
+            # Earlier layout kept its own copy of the text; replace it
+            session.execute(text(f"DROP TABLE {FTS_TABLE}"))
+        session.execute(text(
+            f"CREATE VIEW IF NOT EXISTS {SOURCE_VIEW} AS "
+            f"SELECT m.id AS id, m.title AS title, decompress_text(c.transcript) AS transcript, "
+            f"decompress_text(c.summary) AS summary "
+            f"FROM meetings AS m LEFT JOIN meeting_contents AS c ON c.meeting_id = m.id"
+        ))
+        session.execute(text(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({columns}, content='{SOURCE_VIEW}', "
+            f"content_rowid='id', tokenize = 'porter unicode61 remove_diacritics 2')"
+        ))
+        weights = ", ".join(str(weight) for weight in RANK_WEIGHTS)
+        session.execute(text(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rank) VALUES ('rank', 'bm25({weights})')"))
+        session.commit()
+    except OperationalError as e:
+        session.rollback()
+        logger.warning("Full-text search disabled, FTS5 is not available: %s", e)
+        return False
+
+    _indexed_engines.add(engine)
+    indexed = rebuild_search_index(session)
+    logger.info("Created %s and indexed %d meeting(s)", FTS_TABLE, indexed)
+    return True
+
+
+def rebuild_search_index(session: Session) -> int:
+    """Re-index every meeting from the source view; commits. Returns the number of meetings indexed."""
+    session.execute(text(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('rebuild')"))
+    session.commit()
+    return session.query(Meeting.id).count()
+
+
+def index_meetings(session: Session, meeting_ids: Iterable[int]) -> None:
+    """Index meetings inserted outside the ORM flush (bulk inserts), in the caller's transaction."""
+    if search_index_exists(session):
+        _copy_rows(session, meeting_ids)
+
+
+def _match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, operators are not interpreted."""
+    terms = re.findall(r"\w+", query)
+    return " ".join(f'"{term}"' for term in terms)
+
+
+def search_meetings(session: Session, query: str, limit: int = 20) -> List[dict]:
+    """Best-matching meetings first, each with a highlighted snippet (matches wrapped in ``**``)."""
+    if not search_index_exists(session):
+        raise SearchUnavailableError("Full-text search is not available on this database")
+    match = _match_expression(query)
+    if not match:
+        return []
+    rows = session.execute(
+        text(
+            f"SELECT m.id, m.title, m.status, m.created_at, "
+            f"snippet({FTS_TABLE}, -1, '**', '**', '…', {SNIPPET_TOKENS}) AS snippet, "
+            f"{FTS_TABLE}.rank AS rank "
+            f"FROM {FTS_TABLE} JOIN meetings AS m ON m.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH :match ORDER BY {FTS_TABLE}.rank LIMIT :limit"
+        ).columns(id=Integer, title=String, status=String, created_at=DateTime, snippet=Text, rank=Float),
+        {"match": match, "limit": limit},
+    ).mappings()
+    return [
+        {
+            "id": row["id"],
+            "title": row["title"],
+            "status": row["status"],
+            "created_at": row["created_at"],
+            "snippet": row["snippet"],
+            # bm25() is lower-is-better; flip it so higher scores rank first
+            "score": round(-row["rank"], 4),
+        }
+        for row in rows
+    ]
+
+
+def _has_changes(obj, fields: Iterable[str]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+def _changed_meeting_ids(session: Session) -> set:
+    """Ids of already-stored meetings whose indexed text this flush changes or deletes."""
+    ids = set()
+    for obj in list(session.dirty) + list(session.deleted) + list(session.new):
+        if isinstance(obj, Meeting):
+            if obj in session.new or (obj in session.dirty and not _has_changes(obj, ("title",))):
+                continue
+            meeting_id = obj.id
+        elif isinstance(obj, MeetingContent):
+            if obj in session.dirty and not _has_changes(obj, ("transcript", "summary")):
+                continue
+            meeting = obj.meeting
+            if meeting is not None and meeting in session.new:
+                continue
+            meeting_id = meeting.id if meeting is not None else obj.meeting_id
+        else:
+            continue
+        if meeting_id is not None:
+            ids.add(meeting_id)
+    return ids
+
+
+def _copy_rows(session: Session, ids: Iterable[int], command: str = "") -> None:
+    """Insert the source view's rows for ``ids`` into the index (or, with ``command="delete"``, remove them)."""
+    ids = sorted(ids)
+    if not ids:
+        return
+    columns = ", ".join(INDEXED_FIELDS)
+    target = f"{FTS_TABLE} ({FTS_TABLE}, rowid, {columns})" if command else f"{FTS_TABLE} (rowid, {columns})"
+    selected = f"'{command}', id, {columns}" if command else f"id, {columns}"
+    placeholders = ", ".join(f":id{index}" for index in range(len(ids)))
+    session.connection().execute(
+        text(f"INSERT INTO {target} SELECT {selected} FROM {SOURCE_VIEW} WHERE id IN ({placeholders})"),
+        {f"id{index}": meeting_id for index, meeting_id in enumerate(ids)},
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _unindex_changing_meetings(session: Session, flush_context, instances) -> None:
+    """Remove the rows this flush changes from the index while their old text is still stored."""
+    if not search_index_exists(session):
+        return
+    ids = _changed_meeting_ids(session)
+    _copy_rows(session, ids, command="delete")
+    session.info["search_reindex"] = (
+        ids,
+        [obj for obj in session.new if isinstance(obj, Meeting)],
+        {obj.id for obj in session.deleted if isinstance(obj, Meeting)},
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _index_flushed_meetings(session: Session, flush_context) -> None:
+    """Index the new text of every meeting the flush inserted or changed, in the same transaction."""
+    pending = session.info.pop("search_reindex", None)
+    if pending is None:
+        return
+    ids, new_meetings, deleted_ids = pending
+    _copy_rows(session, (ids | {meeting.id for meeting in new_meetings}) - deleted_ids)
@@ -1,15 +1,37 @@
 from __future__ import annotations
 
+import hashlib
 import secrets
 from pathlib import Path
+from typing import Iterable
 
 from werkzeug.datastructures import FileStorage
 
+CHUNK_SIZE = 1024 * 1024
 
-def save_audio_file(upload: FileStorage, storage_dir: Path) -> Path:
-    storage_dir.mkdir(parents=True, exist_ok=True)
+
+def save_audio_file(upload: FileStorage, storage_dir: Path) -> tuple[Path, str]:
+    """Persist an uploaded file, returning its path and the SHA-256 of its bytes."""
     file_ext = Path(upload.filename or "audio").suffix or ".wav"
+    return write_audio_chunks(_iter_stream(upload.stream), storage_dir, file_ext)
+
+
+def write_audio_chunks(chunks: Iterable[bytes], storage_dir: Path, file_ext: str = ".wav") -> tuple[Path, str]:
+    """Write audio chunks to a new file in ``storage_dir`` while hashing them."""
+    storage_dir.mkdir(parents=True, exist_ok=True)
     file_name = f"meeting-{secrets.token_hex(8)}{file_ext}"
     target = storage_dir / file_name
-    upload.save(target)
-    return target
+    digest = hashlib.sha256()
+    with target.open("wb") as file_obj:
+        for chunk in chunks:
+            digest.update(chunk)
+            file_obj.write(chunk)
+    return target, digest.hexdigest()
+
+
+def _iter_stream(stream) -> Iterable[bytes]:
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
@@ -0,0 +1,65 @@
+"""
+Transcript reuse keyed by the SHA-256 of the audio bytes.
+
+The same recording is often uploaded more than once (dashboard and
+Supervisor); identical audio transcribed with the same provider and model
+reuses the stored transcript instead of transcribing again.
+"""
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+try:
+    from backend.models import AudioTranscript
+except ModuleNotFoundError:
+    from models import AudioTranscript
+
+logger = logging.getLogger(__name__)
+
+
+def find_transcript(session: Session, audio_sha256: str | None, provider: str, model: str) -> str | None:
+    if not audio_sha256:
+        return None
+    record = (
+        session.query(AudioTranscript)
+        .filter(
+            AudioTranscript.audio_sha256 == audio_sha256,
+            AudioTranscript.provider == provider,
+            AudioTranscript.model == model,
+        )
+        .first()
+    )
+    if record is None:
+        return None
+    logger.info("Reusing stored %s/%s transcript for audio %s", provider, model, audio_sha256[:12])
+    return record.transcript
+
+
+def store_transcript(session: Session, audio_sha256: str | None, provider: str, model: str, transcript: str) -> None:
+    """Remember a transcript; commits, so call it after the caller's own changes are committed."""
+    if not audio_sha256 or not transcript:
+        return
+    if find_transcript(session, audio_sha256, provider, model) is not None:
+        return
+    session.add(
+        AudioTranscript(audio_sha256=audio_sha256, provider=provider, model=model, transcript=transcript)
+    )
+    try:
+        session.commit()
+    except IntegrityError:
+        # Another worker stored the same audio concurrently
+        session.rollback()
+
+
+def forget_transcript(session: Session, audio_sha256: str | None, provider: str, model: str) -> None:
+    """Drop a stored transcript so the audio is transcribed again; the caller commits."""
+    if not audio_sha256:
+        return
+    session.query(AudioTranscript).filter(
+        AudioTranscript.audio_sha256 == audio_sha256,
+        AudioTranscript.provider == provider,
+        AudioTranscript.model == model,
+    ).delete(synchronize_session=False)
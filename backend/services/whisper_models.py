@@ -0,0 +1,281 @@
+"""
+Process-wide registry of loaded Whisper models.
+
+Loading a Whisper checkpoint takes seconds and hundreds of MB, so each model
+is loaded once and shared by every transcription thread. Whisper decoding
+installs per-model hooks, so concurrent callers of the same model are
+serialized; idle models are evicted least-recently-used first once the
+configured memory budget is exceeded.
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Approximate resident size of the fp32 checkpoints, used when the model does
+# not expose its parameters (e.g. test doubles).
+_APPROX_MODEL_BYTES = {
+    "tiny": 75 * 1024 * 1024,
+    "base": 145 * 1024 * 1024,
+    "small": 480 * 1024 * 1024,
+    "medium": 1500 * 1024 * 1024,
+    "large": 2900 * 1024 * 1024,
+}
+
+
+class WhisperModelError(Exception):
+    pass
+
+
+@dataclass
+class _Entry:
+    model: Any
+    size_bytes: int
+    load_seconds: float
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    in_use: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+def _load_whisper_model(name: str) -> Any:  # pragma: no cover - depends on optional dependency
+    try:
+        import whisper  # type: ignore
+    except ImportError as exc:
+        raise WhisperModelError("OpenAI Whisper is not installed") from exc
+    return whisper.load_model(name)
+
+
+def _model_size(name: str, model: Any) -> int:
+    parameters = getattr(model, "parameters", None)
+    if callable(parameters):
+        try:
+            return sum(p.numel() * p.element_size() for p in parameters())
+        except Exception:  # pragma: no cover - defensive, size is only an estimate
+            pass
+    base_name = name.split(".")[0]
+    return _APPROX_MODEL_BYTES.get(base_name, _APPROX_MODEL_BYTES["base"])
+
+
+class WhisperModelRegistry:
+    def __init__(
+        self,
+        memory_budget_bytes: int = 0,
+        loader: Callable[[str], Any] = _load_whisper_model,
+    ) -> None:
+        self.memory_budget_bytes = memory_budget_bytes
+        self._loader = loader
+        self._entries: Dict[str, _Entry] = {}
+        self._loading: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    def _load(self, name: str) -> _Entry:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                return entry
+            load_lock = self._loading.setdefault(name, threading.Lock())
+
+        # Only one thread loads a given model; others wait and reuse it.
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(name)
+                if entry is not None:
+                    return entry
+            start = time.perf_counter()
+            model = self._loader(name)
+            elapsed = time.perf_counter() - start
+            entry = _Entry(model=model, size_bytes=_model_size(name, model), load_seconds=elapsed)
+            logger.info(
+                "Loaded Whisper model '%s' in %.2fs (~%d MB)",
+                name,
+                elapsed,
+                entry.size_bytes // (1024 * 1024),
+            )
+            with self._lock:
+                self._entries[name] = entry
+                self.loads += 1
+                self._evict_locked(keep=name)
+            return entry
+
+    def _evict_locked(self, keep: str) -> None:
+        if not self.memory_budget_bytes:
+            return
+        total = sum(entry.size_bytes for entry in self._entries.values())
+        idle = sorted(
+            (
+                (entry.last_used, name)
+                for name, entry in self._entries.items()
+                if name != keep and entry.in_use == 0
+            )
+        )
+        for _, name in idle:
+            if total <= self.memory_budget_bytes:
+                break
+            entry = self._entries.pop(name)
+            total -= entry.size_bytes
+            self.evictions += 1
+            logger.info("Evicted idle Whisper model '%s' to stay within memory budget", name)
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[Any]:
+        """Borrow a loaded model; callers of the same model are serialized."""
+        entry = self._load(name)
+        with self._lock:
+            entry.in_use += 1
+        try:
+            with entry.lock:
+                entry.last_used = time.monotonic()
+                yield entry.model
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+
+    def warm_up(self, name: str) -> None:
+        try:
+            self._load(name)
+        except Exception:
+            logger.exception("Failed to warm up Whisper model '%s'", name)
+
+    def loaded_models(self) -> list[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "models": {
+                    name: {
+                        "size_bytes": entry.size_bytes,
+                        "load_seconds": round(entry.load_seconds, 3),
+                        "in_use": entry.in_use,
+                    }
+                    for name, entry in self._entries.items()
+                },
+            }
+
+
+_registry: WhisperModelRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_whisper_registry() -> WhisperModelRegistry:
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            budget_mb = int(os.getenv("WHISPER_MEMORY_BUDGET_MB", "0"))
+            _registry = WhisperModelRegistry(memory_budget_bytes=budget_mb * 1024 * 1024)
+    return _registry
+
+
+# Multi-process pool ---------------------------------------------------------
+# Segmented transcription fans audio segments out to worker processes, each
+# holding its own copy of the model so CPU-only nodes use every core (as many
+# as WHISPER_MEMORY_BUDGET_MB has room for).
+
+_worker_model: Any = None
+_pools: Dict[str, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _init_pool_worker(name: str, threads_per_worker: int) -> None:  # pragma: no cover - runs in worker process
+    global _worker_model
+
+    try:
+        import torch  # type: ignore
+
+        torch.set_num_threads(threads_per_worker)
+    except ImportError:
+        pass
+    start = time.perf_counter()
+    _worker_model = _load_whisper_model(name)
+    logger.info(
+        "Worker %s loaded Whisper model '%s' in %.2fs",
+        os.getpid(),
+        name,
+        time.perf_counter() - start,
+    )
+
+
+def _transcribe_in_worker(audio: Any) -> str:  # pragma: no cover - runs in worker process
+    result = _worker_model.transcribe(audio, fp16=False)
+    return (result.get("text") or "").strip()
+
+
+def _pool_workers(name: str, cpu_count: int) -> int:
+    """WHISPER_WORKERS (default one per core), capped so every worker's model copy fits the memory budget."""
+    workers = max(1, int(os.getenv("WHISPER_WORKERS", "0")) or cpu_count)
+    budget = int(os.getenv("WHISPER_MEMORY_BUDGET_MB", "0")) * 1024 * 1024
+    if budget:
+        model_bytes = _model_size(name, None)
+        affordable = max(1, budget // model_bytes)
+        if workers > affordable:
+            logger.info(
+                "Limiting Whisper pool for '%s' to %d workers (%d MB budget, ~%d MB per model)",
+                name,
+                affordable,
+                budget // (1024 * 1024),
+                model_bytes // (1024 * 1024),
+            )
+            workers = affordable
+    return workers
+
+
+def get_whisper_process_pool(name: str) -> ProcessPoolExecutor:
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            cpu_count = os.cpu_count() or 1
+            workers = _pool_workers(name, cpu_count)
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_pool_worker,
+                initargs=(name, max(1, cpu_count // workers)),
+            )
+            _pools[name] = pool
+            logger.info("Started Whisper process pool for '%s' with %d workers", name, workers)
+    return pool
+
+
+def _map_on_pool(name: str, segments: list) -> list[str]:
+    pool = get_whisper_process_pool(name)
+    try:
+        return list(pool.map(_transcribe_in_worker, segments))
+    except BrokenProcessPool:
+        with _pools_lock:
+            # Another caller may already have replaced the broken pool
+            if _pools.get(name) is pool:
+                del _pools[name]
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+def transcribe_segments(name: str, segments: list) -> list[str]:
+    """
+    Transcribe audio arrays in parallel worker processes, preserving order.
+
+    A worker that dies (e.g. OOM-killed) breaks the whole pool; it is replaced
+    and the segments are retried once on the fresh pool.
+    """
+    try:
+        return _map_on_pool(name, segments)
+    except BrokenProcessPool:
+        logger.warning("Whisper process pool for '%s' broke; restarting it", name)
+    return _map_on_pool(name, segments)
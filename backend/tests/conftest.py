@@ -1,4 +1,7 @@
+import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -12,6 +15,38 @@ class TestConfig(DefaultConfig):
     ENABLE_BACKGROUND_JOBS = False
 
 
+@pytest.fixture(autouse=True)
+def _isolated_llm_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Replace the Gemini client with a recorder; set ``fake_llm.reply`` to control responses."""
+    from backend.services import llm
+
+    class _FakeLLM:
+        calls = []
+        reply = "Fake summary"
+
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+        def invoke(self, messages):
+            _FakeLLM.calls.append(messages)
+            reply = _FakeLLM.reply(messages) if callable(_FakeLLM.reply) else _FakeLLM.reply
+            return type("Response", (), {"content": reply})()
+
+    _FakeLLM.calls = []
+    llm.clear_chat_models()
+    monkeypatch.setattr(llm, "ChatGoogleGenerativeAI", _FakeLLM)
+    monkeypatch.delenv("MOCK_SUMMARY", raising=False)
+    monkeypatch.delenv("MOCK_ACTION_ITEMS", raising=False)
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    yield _FakeLLM
+    llm.clear_chat_models()
+
+
 @pytest.fixture
 def app(tmp_path, monkeypatch):
     db_file = tmp_path / "test.sqlite"
@@ -34,3 +69,89 @@ def app(tmp_path, monkeypatch):
 @pytest.fixture
 def client(app):
     return app.test_client()
+
+
+class FakeAssemblyAI:
+    """Minimal local stand-in for the AssemblyAI v2 REST API."""
+
+    def __init__(self):
+        self.requests = []
+        self.transcripts = {}
+        self.fail_next = []
+        fake = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _read_body(self):
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    chunks = []
+                    while True:
+                        size = int(self.rfile.readline().strip() or b"0", 16)
+                        if size == 0:
+                            self.rfile.readline()
+                            return b"".join(chunks)
+                        chunks.append(self.rfile.read(size))
+                        self.rfile.readline()
+                return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+            def do_POST(self):
+                body = self._read_body()
+                fake.requests.append(("POST", self.path, body))
+                if fake.fail_next:
+                    return self._reply(fake.fail_next.pop(0), {"error": "try again"})
+                if self.path.endswith("/upload"):
+                    return self._reply(200, {"upload_url": "https://cdn.fake-assemblyai/upload/1"})
+                if self.path.endswith("/transcript"):
+                    transcript_id = f"tx-{len(fake.transcripts) + 1}"
+                    fake.transcripts[transcript_id] = {"id": transcript_id, "status": "queued", "text": None}
+                    return self._reply(200, {"id": transcript_id, "status": "queued"})
+                return self._reply(404, {"error": "not found"})
+
+            def do_GET(self):
+                fake.requests.append(("GET", self.path, b""))
+                if fake.fail_next:
+                    return self._reply(fake.fail_next.pop(0), {"error": "try again"})
+                transcript_id = self.path.rsplit("/", 1)[-1]
+                transcript = fake.transcripts.get(transcript_id)
+                if transcript is None:
+                    return self._reply(404, {"error": "not found"})
+                statuses = transcript.get("script")
+                if statuses:
+                    transcript["status"] = statuses.pop(0)
+                return self._reply(200, {k: v for k, v in transcript.items() if k != "script"})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v2"
+        self._thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def complete(self, transcript_id, text):
+        self.transcripts[transcript_id].update(status="completed", text=text)
+
+    def submitted(self):
+        return [json.loads(body) for method, path, body in self.requests if path.endswith("/transcript")]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fake_assemblyai(monkeypatch):
+    fake = FakeAssemblyAI()
+    monkeypatch.setenv("MOCK_TRANSCRIPTION", "0")
+    monkeypatch.setenv("TRANSCRIPTION_PROVIDER", "assemblyai")
+    monkeypatch.setenv("ASSEMBLYAI_API_KEY", "test-key")
+    monkeypatch.setenv("ASSEMBLYAI_BASE_URL", fake.url)
+    yield fake
+    fake.close()
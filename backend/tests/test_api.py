@@ -1,3 +1,7 @@
+import io
+import os
+from pathlib import Path
+
 from backend.database import SessionLocal
 from backend.models import Meeting
 
@@ -33,3 +37,862 @@ def test_followup_endpoint(client):
     data = response.json
     assert data["summary"]
     assert len(data["action_items"]) == 1
+
+
+def test_assemblyai_webhook_resumes_meeting(client, fake_assemblyai, monkeypatch):
+    monkeypatch.setenv("ASSEMBLYAI_WEBHOOK_URL", "https://agent.example.com/webhooks/assemblyai")
+
+    response = client.post(
+        "/meetings",
+        data={"title": "Standup", "audio": (io.BytesIO(b"fake audio bytes"), "standup.wav")},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 201
+    meeting_id = response.json["id"]
+    assert response.json["status"] == "transcribing"
+
+    submitted = fake_assemblyai.submitted()
+    assert submitted[0]["webhook_url"] == "https://agent.example.com/webhooks/assemblyai"
+    transcript_id = "tx-1"
+    fake_assemblyai.complete(transcript_id, "ACTION: Ship release notes @Priya (due 2024-01-10)")
+
+    webhook = client.post(
+        "/webhooks/assemblyai", json={"transcript_id": transcript_id, "status": "completed"}
+    )
+    assert webhook.status_code == 200
+    assert webhook.json["meeting_id"] == meeting_id
+
+    payload = client.get(f"/meetings/{meeting_id}").json
+    assert payload["status"] == "done"
+    assert payload["transcript"].startswith("ACTION: Ship release notes")
+
+
+def test_lost_assemblyai_webhook_is_reconciled_by_polling(app, client, fake_assemblyai, monkeypatch):
+    from datetime import datetime, timedelta
+
+    from backend.models import Job
+    from backend.pipelines import orchestrator
+    from backend.services.background import BackgroundTaskRunner
+
+    monkeypatch.setenv("ASSEMBLYAI_WEBHOOK_URL", "https://agent.example.com/webhooks/assemblyai")
+    monkeypatch.setenv("ASSEMBLYAI_WEBHOOK_TIMEOUT", "60")
+    # Enabled but not started: jobs run only when the test calls run_next
+    runner = BackgroundTaskRunner()
+    for task in (
+        orchestrator.process_meeting,
+        orchestrator.complete_assemblyai_transcription,
+        orchestrator.reconcile_assemblyai_transcription,
+    ):
+        runner.register(task)
+    app.extensions["background_runner"] = runner
+
+    meeting_id = client.post(
+        "/meetings",
+        data={"title": "Standup", "audio": (io.BytesIO(b"lost webhook audio"), "standup.wav")},
+        content_type="multipart/form-data",
+    ).json["id"]
+    assert runner.run_next()
+    assert client.get(f"/meetings/{meeting_id}").json["status"] == "transcribing"
+    assert client.post(f"/meetings/{meeting_id}/retry").status_code == 409
+
+    session = SessionLocal()
+    reconcile = session.query(Job).filter(Job.task == "reconcile_assemblyai_transcription").one()
+    assert reconcile.available_at > datetime.utcnow() + timedelta(seconds=50)
+    # Still transcribing at the first poll: the next one is scheduled
+    reconcile.available_at = datetime.utcnow()
+    session.commit()
+    assert runner.run_next()
+    polls = session.query(Job).filter(Job.task == "reconcile_assemblyai_transcription").order_by(Job.id).all()
+    assert [job.status for job in polls] == ["done", "queued"]
+
+    # The webhook never arrives; the next poll collects the transcript
+    fake_assemblyai.complete("tx-1", "ACTION: Ship release notes @Priya (due 2024-01-10)")
+    polls[1].available_at = datetime.utcnow()
+    session.commit()
+    session.close()
+    assert runner.run_next()
+
+    payload = client.get(f"/meetings/{meeting_id}").json
+    assert payload["status"] == "done"
+    assert payload["transcript"].startswith("ACTION: Ship release notes")
+    # A late webhook for the same job does not process the meeting again
+    assert client.post("/webhooks/assemblyai", json={"transcript_id": "tx-1"}).status_code == 200
+    assert len(fake_assemblyai.submitted()) == 1
+
+
+def test_stale_transcribing_meeting_is_recovered_and_retryable(app, client, fake_assemblyai, monkeypatch):
+    from datetime import datetime, timedelta
+
+    from backend.models import Job, MeetingStage
+    from backend.pipelines import orchestrator
+    from backend.services.background import BackgroundTaskRunner
+
+    monkeypatch.setenv("ASSEMBLYAI_WEBHOOK_URL", "https://agent.example.com/webhooks/assemblyai")
+    meeting_id = client.post(
+        "/meetings",
+        data={"title": "Standup", "audio": (io.BytesIO(b"stale webhook audio"), "standup.wav")},
+        content_type="multipart/form-data",
+    ).json["id"]
+    session = SessionLocal()
+    stage = session.query(MeetingStage).filter(MeetingStage.meeting_id == meeting_id).one()
+    stage.started_at = datetime.utcnow() - timedelta(hours=1)
+    session.commit()
+
+    runner = BackgroundTaskRunner()
+    runner.register(orchestrator.process_meeting)
+    runner.register(orchestrator.reconcile_assemblyai_transcription)
+    assert orchestrator.recover_orphaned_meetings(runner) == 1
+    assert session.query(Job.task).scalar() == "reconcile_assemblyai_transcription"
+    session.close()
+
+    retried = client.post(f"/meetings/{meeting_id}/retry")
+    assert retried.status_code == 202
+    assert retried.json["status"] == "transcribing"
+    # The audio was submitted again under a new AssemblyAI job
+    assert len(fake_assemblyai.submitted()) == 2
+    assert client.post("/webhooks/assemblyai", json={"transcript_id": "tx-1"}).status_code == 404
+
+
+def test_assemblyai_webhook_unknown_transcript(client):
+    response = client.post("/webhooks/assemblyai", json={"transcript_id": "missing", "status": "completed"})
+    assert response.status_code == 404
+
+
+def test_health_stats_reports_pools(client):
+    response = client.get("/health/stats")
+    assert response.status_code == 200
+    assert "assemblyai" in response.json
+    assert "hits" in response.json["llm_cache"]
+
+
+def test_identical_audio_reuses_transcript(client, monkeypatch):
+    from backend.pipelines import orchestrator
+
+    calls = []
+
+    def _transcribe(path):
+        calls.append(path)
+        return "ACTION: Book the venue @Sam (due 2024-02-01). The team will confirm catering."
+
+    monkeypatch.setattr(orchestrator, "transcribe_audio", _transcribe)
+
+    ids = []
+    for name in ("first.wav", "second.wav"):
+        response = client.post(
+            "/meetings",
+            data={"title": "Offsite", "audio": (io.BytesIO(b"identical audio bytes"), name)},
+            content_type="multipart/form-data",
+        )
+        assert response.status_code == 201
+        ids.append(response.json["id"])
+
+    assert len(calls) == 1
+    second = client.get(f"/meetings/{ids[1]}").json
+    assert second["status"] == "done"
+    assert second["transcript"].startswith("ACTION: Book the venue")
+
+
+def test_supervisor_reuses_transcript_for_identical_audio(client, monkeypatch):
+    import base64
+
+    from backend.routes import supervisor_adapter
+
+    calls = []
+
+    def _transcribe(path):
+        calls.append(path)
+        return "ACTION: Draft the launch plan @Mia (due 2024-03-01). Everyone will review it by Friday."
+
+    monkeypatch.setattr(supervisor_adapter, "transcribe_audio", _transcribe)
+    body = {
+        "request_id": "req-1",
+        "agent_name": "meeting_followup_agent",
+        "intent": "meeting.followup",
+        "input": {
+            "text": "summarize this meeting",
+            "metadata": {
+                "file_base64": base64.b64encode(b"same recording").decode(),
+                "mime_type": "audio/wav",
+                "filename": "launch.wav",
+            },
+        },
+        "context": {},
+    }
+    for _ in range(2):
+        response = client.post("/agents/supervisor/meeting-followup", json=body)
+        assert response.status_code == 200
+
+    assert len(calls) == 1
+
+
+def _supervisor_request(**metadata):
+    return {
+        "request_id": "req-upload",
+        "agent_name": "meeting_followup_agent",
+        "intent": "meeting.followup",
+        "input": {"text": "summarize this meeting", "metadata": metadata},
+        "context": {},
+    }
+
+
+def test_supervisor_multipart_upload_keeps_memory_bounded(client, monkeypatch, tmp_path):
+    import json
+    import tracemalloc
+
+    from backend.routes import supervisor_adapter
+
+    received = []
+
+    def _transcribe(path):
+        received.append(Path(path).stat().st_size)
+        return "ACTION: Publish the all-hands recording @Jo (due 2024-04-01). Everyone will watch it."
+
+    monkeypatch.setattr(supervisor_adapter, "transcribe_audio", _transcribe)
+    size = 24 * 1024 * 1024
+    audio_path = tmp_path / "all-hands.wav"
+    with audio_path.open("wb") as file_obj:
+        for _ in range(size // (1024 * 1024)):
+            file_obj.write(os.urandom(1024 * 1024))
+
+    tracemalloc.start()
+    try:
+        with audio_path.open("rb") as audio:
+            response = client.post(
+                "/agents/supervisor/meeting-followup/upload",
+                data={
+                    "request": json.dumps(_supervisor_request(language="en")),
+                    "audio": (audio, "all-hands.wav", "audio/wav"),
+                },
+                content_type="multipart/form-data",
+            )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert response.status_code == 200
+    assert received == [size]
+    # the whole recording never sits in memory at once
+    assert peak < size / 4
+
+
+def test_supervisor_multipart_upload_requires_request_field(client):
+    response = client.post(
+        "/agents/supervisor/meeting-followup/upload",
+        data={"audio": (io.BytesIO(b"audio"), "a.wav", "audio/wav")},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 400
+
+
+def test_create_meeting_applies_backpressure_when_queue_full(app, client):
+    from backend.pipelines.orchestrator import process_meeting
+    from backend.services.background import BackgroundTaskRunner
+
+    # Enabled but not started: submitted jobs stay queued
+    runner = BackgroundTaskRunner(max_depth=1)
+    runner.register(process_meeting)
+    app.extensions["background_runner"] = runner
+    transcript = "Alice will send the deck by Friday."
+
+    first = client.post("/meetings", json={"title": "One", "transcript": transcript})
+    assert first.status_code == 201
+
+    second = client.post("/meetings", json={"title": "Two", "transcript": transcript})
+    assert second.status_code == 429
+    assert int(second.headers["Retry-After"]) >= 1
+    assert second.get_json()["lane"] == "normal"
+
+    # Other lanes have their own depth
+    urgent = client.post("/meetings", json={"title": "Urgent", "transcript": transcript, "priority": "high"})
+    assert urgent.status_code == 201
+
+    session = SessionLocal()
+    assert session.query(Meeting).count() == 2
+    session.close()
+
+    queue = client.get("/health/queue")
+    assert queue.status_code == 503
+    body = queue.get_json()
+    assert body["lanes"]["normal"]["depth"] == 1
+    assert body["lanes"]["normal"]["saturated"] is True
+    assert body["lanes"]["high"]["depth"] == 1
+    assert body["lanes"]["normal"]["estimated_wait_seconds"] > body["lanes"]["high"]["estimated_wait_seconds"] > 0
+
+    # A request that passes check_capacity but loses the last slot publishes no "queued" event
+    from backend.services.events import get_event_broker
+
+    runner.check_capacity = lambda lane="normal": None
+    published = get_event_broker().published
+    raced = client.post("/meetings", json={"title": "Three", "transcript": transcript})
+    assert raced.status_code == 429
+    assert get_event_broker().published == published
+    admitted = client.post("/meetings", json={"title": "Later", "transcript": transcript, "priority": "low"})
+    assert admitted.status_code == 201
+    assert get_event_broker().published == published + 1
+
+
+def test_create_meeting_rejects_unknown_priority(client):
+    response = client.post("/meetings", json={"transcript": "Some transcript text", "priority": "urgent"})
+    assert response.status_code == 400
+
+
+def test_retry_resumes_from_first_incomplete_stage(client, monkeypatch):
+    from backend.pipelines import orchestrator
+
+    transcriptions = []
+    summaries = []
+
+    def _transcribe(path):
+        transcriptions.append(path)
+        return "ACTION: Book the venue @Sam (due 2024-02-01). The team will confirm catering."
+
+    def _summarize(transcript):
+        summaries.append(transcript)
+        if len(summaries) == 1:
+            raise RuntimeError("Gemini unavailable")
+        return "Venue and catering discussed."
+
+    monkeypatch.setattr(orchestrator, "transcribe_audio", _transcribe)
+    monkeypatch.setattr(orchestrator, "summarize_transcript", _summarize)
+
+    # Synchronous runner: the first pass fails inside the request
+    client.post(
+        "/meetings",
+        data={"title": "Offsite", "audio": (io.BytesIO(b"retry audio bytes"), "offsite.wav")},
+        content_type="multipart/form-data",
+    )
+    session = SessionLocal()
+    meeting_id = session.query(Meeting.id).filter(Meeting.title == "Offsite").scalar()
+    session.close()
+    failed = client.get(f"/meetings/{meeting_id}").json
+    assert failed["status"] == "failed"
+    stages = {stage["name"]: stage for stage in failed["stages"]}
+    assert stages["transcribe"]["status"] == "done"
+    assert stages["transcribe"]["model"] == "mock/mock"
+    assert stages["transcribe"]["duration_ms"] >= 0
+    assert stages["summarize"]["status"] == "failed"
+    assert "Gemini unavailable" in stages["summarize"]["error"]
+    assert "extract" not in stages
+
+    retried = client.post(f"/meetings/{meeting_id}/retry")
+    assert retried.status_code == 202
+    done = client.get(f"/meetings/{meeting_id}").json
+    assert done["status"] == "done"
+    assert [stage["status"] for stage in done["stages"]] == ["done", "done", "done"]
+    assert len(transcriptions) == 1
+    assert len(summaries) == 2
+
+    # Explicitly re-running summarization repeats it but not transcription
+    client.post(f"/meetings/{meeting_id}/retry", json={"from_stage": "summarize"})
+    assert len(transcriptions) == 1
+    assert len(summaries) == 3
+
+    # Re-running transcription bypasses the transcript stored for this audio
+    client.post(f"/meetings/{meeting_id}/retry", json={"from_stage": "transcribe"})
+    assert len(transcriptions) == 2
+    assert len(summaries) == 4
+    assert client.get(f"/meetings/{meeting_id}").json["status"] == "done"
+
+
+def test_retry_rejects_unknown_stage_and_meeting(client):
+    assert client.post("/meetings/999/retry").status_code == 404
+    response = client.post("/meetings/1/retry", json={"from_stage": "translate"})
+    assert response.status_code == 400
+
+
+def test_concurrent_mode_checkpoints_items_when_summary_fails(client, monkeypatch):
+    from backend.pipelines import minutes
+
+    def _summarize(transcript, max_sentences=5):
+        raise RuntimeError("Gemini unavailable")
+
+    monkeypatch.setenv("MINUTES_MODE", "concurrent")
+    monkeypatch.setattr(minutes, "summarize_transcript", _summarize)
+    client.post("/meetings", json={"title": "Concurrent", "transcript": "ACTION: Book the venue @Sam."})
+
+    session = SessionLocal()
+    meeting = session.query(Meeting).filter(Meeting.title == "Concurrent").one()
+    stages = {stage.name: stage for stage in meeting.stages}
+    assert meeting.status == "failed"
+    assert stages["summarize"].status == "failed"
+    assert stages["extract"].status == "done"
+    assert stages["extract"].duration_ms is not None
+    assert len(meeting.action_items) == 1
+    session.close()
+
+
+def test_process_meeting_writes_results_in_one_transaction(client, monkeypatch):
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Session
+
+    from backend.pipelines import orchestrator
+
+    items = [
+        {"description": "Book the venue", "owner": "Sam", "due_date": "2024-02-01"},
+        {"description": "Send the agenda", "owner": "Alex"},
+    ]
+    monkeypatch.setattr(orchestrator, "extract_action_items", lambda transcript, summary: items)
+
+    session = SessionLocal()
+    meeting = Meeting(title="Batched", transcript="ACTION: Book the venue @Sam.\nACTION: Send the agenda @Alex.")
+    session.add(meeting)
+    session.commit()
+    meeting_id = meeting.id
+    session.close()
+
+    commits = []
+    item_inserts = []
+
+    def _count_commit(session):
+        commits.append(session)
+
+    def _count_insert(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("INSERT INTO ACTION_ITEMS"):
+            item_inserts.append(statement)
+
+    event.listen(Session, "after_commit", _count_commit)
+    event.listen(Engine, "before_cursor_execute", _count_insert)
+    try:
+        orchestrator.process_meeting(meeting_id)
+    finally:
+        event.remove(Session, "after_commit", _count_commit)
+        event.remove(Engine, "before_cursor_execute", _count_insert)
+
+    # processing, results (summary, stages, action items), done
+    assert len(commits) == 3
+    assert len(item_inserts) == 1
+
+    payload = client.get(f"/meetings/{meeting_id}").json
+    assert payload["status"] == "done"
+    assert payload["summary"]
+    assert [(item["description"], item["owner"]) for item in payload["action_items"]] == [
+        ("Book the venue", "Sam"),
+        ("Send the agenda", "Alex"),
+    ]
+    assert payload["action_items"][0]["due_date"] == "2024-02-01"
+    assert [stage["status"] for stage in payload["stages"]] == ["done", "done", "done"]
+
+
+def _seed_meetings(count, with_items=True):
+    from datetime import datetime
+
+    from backend.models import ActionItem
+
+    session = SessionLocal()
+    created_at = datetime(2025, 1, 1, 12, 0, 0)
+    for index in range(count):
+        # Pairs of meetings share a timestamp so the id tie-breaker matters
+        meeting = Meeting(
+            title=f"Meeting {index}",
+            transcript="long transcript " * 50,
+            summary="summary",
+            status="done",
+            created_at=created_at.replace(minute=index // 2),
+        )
+        if with_items:
+            meeting.action_items.append(ActionItem(description=f"Task {index}"))
+        session.add(meeting)
+    session.commit()
+    session.close()
+
+
+def test_list_meetings_keyset_pagination(client):
+    _seed_meetings(7)
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        url = "/meetings?limit=3" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url)
+        assert response.status_code == 200
+        seen.extend(meeting["id"] for meeting in response.json)
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        assert 'rel="next"' in response.headers["Link"]
+
+    assert pages == 3
+    assert seen == list(range(7, 0, -1))
+    assert client.get("/meetings?cursor=not-a-cursor").status_code == 400
+
+    # Cross-origin dashboards can read the cursor
+    response = client.get("/meetings?limit=3", headers={"Origin": "http://localhost:8080"})
+    exposed = {name.strip().lower() for name in response.headers["Access-Control-Expose-Headers"].split(",")}
+    assert {"x-next-cursor", "link", "etag", "retry-after"} <= exposed
+
+
+def test_list_meetings_projection_and_bounded_limit(app, client):
+    _seed_meetings(5)
+    app.config["MEETINGS_PAGE_MAX_LIMIT"] = 4
+
+    response = client.get("/meetings?fields=title,status&limit=100")
+    assert response.status_code == 200
+    assert len(response.json) == 4
+    assert set(response.json[0]) == {"id", "title", "status"}
+    assert client.get("/meetings?fields=title,secret").status_code == 400
+
+
+def test_list_meetings_loads_action_items_without_n_plus_one(app, client):
+    from sqlalchemy import event
+
+    from backend.database import _engine
+
+    _seed_meetings(20)
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(_engine, "before_cursor_execute", _record)
+    try:
+        response = client.get("/meetings?fields=title,action_items&limit=20")
+    finally:
+        event.remove(_engine, "before_cursor_execute", _record)
+
+    assert len(response.json) == 20
+    assert all(len(meeting["action_items"]) == 1 for meeting in response.json)
+    selects = [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 2  # one page query + one action item query
+    assert "transcript" not in selects[0]
+    assert not any("meeting_contents" in statement for statement in selects)
+
+
+def test_transcripts_are_compressed_and_loaded_only_when_requested(app, client):
+    from sqlalchemy import event, text
+
+    from backend.database import _engine
+
+    _seed_meetings(5, with_items=False)
+    session = SessionLocal()
+    stored = session.execute(text("SELECT length(transcript) FROM meeting_contents LIMIT 1")).scalar()
+    session.close()
+    assert stored < len("long transcript " * 50)
+
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(_engine, "before_cursor_execute", _record)
+    try:
+        response = client.get("/meetings?fields=title,transcript&limit=5")
+    finally:
+        event.remove(_engine, "before_cursor_execute", _record)
+
+    assert all(meeting["transcript"] == "long transcript " * 50 for meeting in response.json)
+    assert len([statement for statement in statements if "meeting_contents" in statement]) == 1
+
+
+def _create_done_meeting(client):
+    response = client.post("/meetings", json={"title": "Poll", "transcript": "ACTION: Book the venue @Sam."})
+    return response.json["id"]
+
+
+def test_get_meeting_etag_and_not_modified(client):
+    from backend.models import ActionItem
+
+    meeting_id = _create_done_meeting(client)
+    first = client.get(f"/meetings/{meeting_id}")
+    etag = first.headers["ETag"]
+    assert not etag.startswith("W/")
+
+    unchanged = client.get(f"/meetings/{meeting_id}", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.data == b""
+    assert unchanged.headers["ETag"] == etag
+
+    # Changing a child row bumps the meeting's version
+    session = SessionLocal()
+    session.add(ActionItem(meeting_id=meeting_id, description="Follow up"))
+    session.commit()
+    session.close()
+
+    changed = client.get(f"/meetings/{meeting_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert len(changed.json["action_items"]) == len(first.json["action_items"]) + 1
+
+
+def test_get_meeting_long_poll_wakes_on_change(client):
+    import threading
+    import time
+
+    meeting_id = _create_done_meeting(client)
+    etag = client.get(f"/meetings/{meeting_id}").headers["ETag"]
+
+    def _rename():
+        time.sleep(0.2)
+        session = SessionLocal.session_factory()
+        session.get(Meeting, meeting_id).title = "Renamed"
+        session.commit()
+        session.close()
+
+    updater = threading.Thread(target=_rename)
+    updater.start()
+    start = time.perf_counter()
+    response = client.get(f"/meetings/{meeting_id}?wait=10", headers={"If-None-Match": etag})
+    elapsed = time.perf_counter() - start
+    updater.join()
+
+    assert response.status_code == 200
+    assert response.json["title"] == "Renamed"
+    assert elapsed < 0.9  # woken by the commit, not by the periodic re-check
+
+    start = time.perf_counter()
+    timed_out = client.get(
+        f"/meetings/{meeting_id}?wait=0.3", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert timed_out.status_code == 304
+    assert 0.25 < time.perf_counter() - start < 2
+
+
+def test_meeting_events_stream_stage_transitions(app, client):
+    import json
+    import threading
+
+    from backend.pipelines.orchestrator import process_meeting
+    from backend.services.background import BackgroundTaskRunner
+
+    runner = BackgroundTaskRunner()
+    runner.register(process_meeting)
+    app.extensions["background_runner"] = runner
+    meeting_id = client.post(
+        "/meetings", json={"title": "Streamed", "transcript": "ACTION: Book the venue @Sam."}
+    ).json["id"]
+
+    response = client.get(f"/meetings/{meeting_id}/events", buffered=False)
+    assert response.mimetype == "text/event-stream"
+    chunks = iter(response.response)
+    assert next(chunks).startswith(b"retry:")
+    assert b"event: queued" in next(chunks)
+
+    worker = threading.Thread(target=runner.run_next)
+    worker.start()
+    events = []
+    for chunk in chunks:
+        text = chunk.decode() if isinstance(chunk, bytes) else chunk
+        if text.startswith("id:"):
+            lines = dict(line.split(": ", 1) for line in text.strip().splitlines())
+            events.append((lines["event"], json.loads(lines["data"])))
+    worker.join()
+    response.close()
+
+    names = [name for name, _ in events]
+    assert names == ["summarizing", "extracting", "done"]
+    done = events[-1][1]
+    assert done["stages"]["summarize"]["status"] == "done"
+    assert done["stages"]["summarize"]["duration_ms"] is not None
+    assert done["total_ms"] >= 0
+
+    # A finished meeting streams its final state and closes
+    replay = client.get(f"/meetings/{meeting_id}/events")
+    assert b"event: done" in replay.data
+    assert client.get("/meetings/999/events").status_code == 404
+
+
+def test_asgi_event_streams_share_the_event_loop(app, client):
+    import asyncio
+    import threading
+
+    from backend.app import create_asgi_app
+    from backend.pipelines.orchestrator import process_meeting
+    from backend.services.background import BackgroundTaskRunner
+    from backend.services.events import get_event_broker
+
+    runner = BackgroundTaskRunner()
+    runner.register(process_meeting)
+    app.extensions["background_runner"] = runner
+    meeting_id = client.post("/meetings", json={"title": "Streamed", "transcript": "ACTION: Book the venue @Sam."}).json["id"]
+    asgi_app = create_asgi_app(app)
+    streams = 200
+
+    async def _open(path, leave=None):
+        chunks = []
+
+        async def receive():
+            if not chunks:
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await (leave.wait() if leave else asyncio.Event().wait())
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                chunks.append(message["status"])
+            elif message.get("body"):
+                chunks.append(message["body"].decode())
+
+        scope = {"type": "http", "method": "GET", "path": path, "headers": [], "query_string": b""}
+        return chunks, asyncio.ensure_future(asgi_app(scope, receive, send))
+
+    async def _scenario():
+        subscribers_before = get_event_broker().stats()["subscribers"]
+        threads_before = threading.active_count()
+        opened = [await _open(f"/meetings/{meeting_id}/events") for _ in range(streams)]
+        while not all(len(chunks) >= 3 for chunks, _ in opened):
+            await asyncio.sleep(0.01)
+        # Hundreds of idle streams, a handful of executor threads at most
+        assert threading.active_count() - threads_before < 40
+        assert get_event_broker().stats()["subscribers"] == subscribers_before + streams
+
+        await asyncio.to_thread(runner.run_next)
+        await asyncio.wait_for(asyncio.gather(*(task for _, task in opened)), timeout=10)
+        assert all(chunks[0] == 200 and "event: done" in chunks[-1] for chunks, _ in opened)
+
+        # A client that leaves mid-wait is unsubscribed without waiting for a keep-alive
+        other = client.post("/meetings", json={"title": "Left", "transcript": "ACTION: Call the venue."}).json["id"]
+        leave = asyncio.Event()
+        chunks, task = await _open(f"/meetings/{other}/events", leave)
+        while len(chunks) < 3:
+            await asyncio.sleep(0.01)
+        leave.set()
+        await asyncio.wait_for(task, timeout=2)
+        assert get_event_broker().stats()["subscribers"] == subscribers_before
+
+        missing, task = await _open("/meetings/999/events")
+        await task
+        assert missing[0] == 404
+
+    asyncio.run(_scenario())
+
+
+def test_search_meetings_ranks_and_tracks_pipeline_commits(client):
+    first = client.post(
+        "/meetings",
+        json={"title": "Offsite planning", "transcript": "We need to book the venue and confirm catering budgets."},
+    ).json["id"]
+    second = client.post(
+        "/meetings", json={"title": "Catering review", "transcript": "The catering contract was renewed."}
+    ).json["id"]
+    # Enough non-matching meetings that BM25's IDF for "catering" is positive
+    for index in range(4):
+        client.post("/meetings", json={"title": f"Standup {index}", "transcript": "Nothing about food today."})
+
+    response = client.get("/meetings/search?q=catering")
+    assert response.status_code == 200
+    results = response.json
+    # Title matches outrank transcript-only matches
+    assert [result["id"] for result in results] == [second, first]
+    assert "**catering**" in results[1]["snippet"].lower()
+    assert results[0]["score"] > results[1]["score"]
+
+    # Every word must match; stems match; operators and quotes are plain text
+    assert [result["id"] for result in client.get("/meetings/search?q=venue+budget").json] == [first]
+    assert client.get('/meetings/search?q=venue OR "').status_code == 200
+    assert client.get("/meetings/search?q=").status_code == 400
+
+    # Pipeline output is searchable once committed, and edits/deletes are re-indexed
+    session = SessionLocal()
+    summary = session.get(Meeting, first).summary
+    assert client.get(f"/meetings/search?q={summary.split()[0]}").json
+    session = SessionLocal()
+    session.get(Meeting, first).title = "Quarterly roadmap"
+    session.commit()
+    assert [result["id"] for result in client.get("/meetings/search?q=roadmap").json] == [first]
+    session.delete(session.get(Meeting, second))
+    session.commit()
+    session.close()
+    assert [result["id"] for result in client.get("/meetings/search?q=catering").json] == [first]
+
+
+def test_batch_create_meetings_json_and_ndjson(app, client):
+    import json
+
+    app.config["MEETINGS_BATCH_CHUNK_SIZE"] = 2
+    response = client.post(
+        "/meetings/batch",
+        json=[
+            {"title": "Backfill 1", "transcript": "ACTION: Book the venue @Sam.", "created_at": "2024-03-01T10:00:00"},
+            {"title": "Missing transcript"},
+            {"title": "Backfill 2", "transcript": "We agreed on the catering budget."},
+            {"title": "Backfill 3", "transcript": "Quarterly roadmap review."},
+        ],
+    )
+    assert response.status_code == 201
+    body = response.json
+    assert body["created"] == 3
+    assert body["ids"][1] is None
+    assert body["errors"] == [{"index": 1, "error": "transcript is required"}]
+
+    first = client.get(f"/meetings/{body['ids'][0]}").json
+    assert first["status"] == "done"  # processed by the synchronous test runner
+    assert first["created_at"].startswith("2024-03-01T10:00:00")
+    assert first["transcript"] == "ACTION: Book the venue @Sam."
+    assert [result["id"] for result in client.get("/meetings/search?q=catering").json] == [body["ids"][2]]
+
+    lines = "\n".join(json.dumps({"title": f"Line {index}", "transcript": "Line transcript."}) for index in range(3))
+    ndjson = client.post(
+        "/meetings/batch", data=lines + "\n\nnot json\n[1]\n", content_type="application/x-ndjson"
+    )
+    assert ndjson.status_code == 201
+    assert ndjson.json["created"] == 3
+    assert ndjson.json["errors"] == [
+        {"index": 3, "error": "line 5: invalid JSON: Expecting value at column 1"},
+        {"index": 4, "error": "must be a JSON object"},
+    ]
+
+    agent = client.post(
+        "/meetings/batch", json=[{"transcript": "Agent transcript.", "source_agent": "x" * 300}]
+    ).json["ids"][0]
+    assert client.get(f"/meetings/{agent}").json["source_agent"] == "x" * 255
+
+    assert client.post("/meetings/batch", json={"title": "not a list"}).status_code == 400
+    assert client.post("/meetings/batch", json=[{"title": "no transcript"}]).status_code == 400
+    app.config["MEETINGS_BATCH_MAX_ITEMS"] = 3
+    too_large = client.post("/meetings/batch", json=[{"transcript": f"Backlog transcript {text}."} for text in "abcd"])
+    assert too_large.status_code == 413
+    # The first chunk was stored; the parsed item still pending is reported, not silently dropped
+    assert [meeting_id is not None for meeting_id in too_large.json["ids"]] == [True, True, False]
+    assert too_large.json["errors"] == [{"index": 2, "error": "not stored: batch limit exceeded"}]
+
+
+def test_batch_enqueues_jobs_as_a_group(app, client):
+    import json
+
+    import pytest
+
+    from backend.models import Job
+    from backend.pipelines.orchestrator import process_meeting
+    from backend.services.background import BackgroundTaskRunner, QueueFullError
+
+    runner = BackgroundTaskRunner(max_depth=5)
+    runner.register(process_meeting)
+    app.extensions["background_runner"] = runner
+    app.config["MEETINGS_BATCH_CHUNK_SIZE"] = 2
+    response = client.post(
+        "/meetings/batch?priority=normal",
+        json=[{"title": f"Queued {index}", "transcript": "Queued transcript."} for index in range(3)],
+    )
+    assert response.status_code == 201
+
+    session = SessionLocal()
+    jobs = session.query(Job).order_by(Job.id).all()
+    assert [json.loads(job.payload)["args"] for job in jobs] == [[meeting_id] for meeting_id in response.json["ids"]]
+    assert {job.priority for job in jobs} == {1}
+
+    # Two slots left: the first chunk fits, the second is refused before it is stored
+    partial = client.post(
+        "/meetings/batch?priority=normal",
+        json=[{"title": f"More {index}", "transcript": "More transcript."} for index in range(50)],
+    )
+    assert partial.status_code == 429
+    assert partial.headers["Retry-After"]
+    assert all(partial.json["ids"][:2])
+    assert partial.json["ids"][2:] == [None, None]
+    assert partial.json["errors"] == [
+        {"index": 2, "error": "not stored: processing queue is full"},
+        {"index": 3, "error": "not stored: processing queue is full"},
+    ]
+    assert session.query(Job).filter(Job.priority == 1).count() == 5
+    assert session.query(Meeting).count() == 5
+
+    # The lane is now full, so the next batch is turned away up front
+    rejected = client.post("/meetings/batch?priority=normal", json=[{"transcript": "More."}])
+    assert rejected.status_code == 429
+    # Direct group enqueues are admitted or rejected as a whole
+    with pytest.raises(QueueFullError):
+        runner.enqueue_many(process_meeting, [(meeting_id,) for meeting_id in range(101, 107)], lane="low")
+    assert session.query(Job).filter(Job.priority == 2).count() == 0
+    session.close()
@@ -0,0 +1,73 @@
+"""
+Import-time budget for booting the app.
+
+Boots ``create_app`` in a fresh interpreter under ``python -X importtime``
+and fails if the imports it pays for exceed IMPORT_BUDGET_MS, or if it
+loads a provider SDK that should only be imported on first use. Every
+web worker and test process pays this cost.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# About 0.6 s today; importing LangChain and the Gemini SDK at boot added over 1 s
+IMPORT_BUDGET_MS = 1500
+LAZY_MODULES = ("langchain", "langchain_core", "langchain_google_genai", "google.generativeai", "whisper", "torch")
+
+BOOT_SCRIPT = """
+import json
+import sys
+from pathlib import Path
+
+from backend.app import create_app
+from backend.config import DefaultConfig
+
+
+class BootConfig(DefaultConfig):
+    TESTING = True
+    ENABLE_BACKGROUND_JOBS = False
+    SQLALCHEMY_DATABASE_URI = sys.argv[1]
+    STORAGE_DIR = Path(sys.argv[2])
+
+
+create_app(BootConfig)
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _boot(tmp_path):
+    root = Path(__file__).resolve().parents[2]
+    env = dict(os.environ, PYTHONPATH=str(root), LLM_CACHE_PATH=str(tmp_path / "llm_cache.db"))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT, f"sqlite:///{tmp_path / 'boot.db'}", str(tmp_path)],
+        capture_output=True,
+        text=True,
+        cwd=root,
+        env=env,
+        check=True,
+    )
+    total_ms = 0.0
+    by_package = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented; a top-level entry's time includes them
+        if not name[1:].startswith(" "):
+            total_ms += int(cumulative_us) / 1000
+        package = name.strip().split(".")[0]
+        by_package[package] = by_package.get(package, 0.0) + int(self_us) / 1000
+    return total_ms, by_package, json.loads(result.stdout.splitlines()[-1])
+
+
+def test_create_app_import_time_budget(tmp_path):
+    total_ms, by_package, modules = _boot(tmp_path)
+
+    loaded = [name for name in LAZY_MODULES if name in modules]
+    assert not loaded, f"create_app imported {loaded}; import them on first use"
+
+    slowest = sorted(by_package.items(), key=lambda item: -item[1])[:5]
+    breakdown = ", ".join(f"{package} {ms:.0f} ms" for package, ms in slowest)
+    assert total_ms < IMPORT_BUDGET_MS, f"Boot imports took {total_ms:.0f} ms (budget {IMPORT_BUDGET_MS} ms): {breakdown}"
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from backend.pipelines.action_items import extract_action_items
 from backend.pipelines.summarization import summarize_transcript
 from backend.pipelines.transcription import transcribe_audio
@@ -25,3 +27,179 @@ def test_extract_action_items_rule_based(monkeypatch):
     items = extract_action_items(transcript)
     assert len(items) == 1
     assert items[0]["owner"] == "Alice"
+
+
+def test_split_into_windows_overlaps():
+    from backend.pipelines.summarization import _split_into_windows
+
+    text = " ".join(f"w{i}" for i in range(10))
+    windows = _split_into_windows(text, window_tokens=4, overlap_tokens=1)
+    assert windows == ["w0 w1 w2 w3", "w3 w4 w5 w6", "w6 w7 w8 w9"]
+
+
+def test_summarize_transcript_chunked(monkeypatch, fake_llm):
+    fake_llm.reply = lambda messages: f"partial {len(fake_llm.calls)}"
+    monkeypatch.setenv("SUMMARY_CHUNK_THRESHOLD_TOKENS", "50")
+    monkeypatch.setenv("SUMMARY_CHUNK_TOKENS", "40")
+    monkeypatch.setenv("SUMMARY_CHUNK_OVERLAP_TOKENS", "5")
+
+    transcript = " ".join(f"word{i}" for i in range(100))
+    summary = summarize_transcript(transcript)
+
+    # three map calls over overlapping windows, then one reduce call
+    assert len(fake_llm.calls) == 4
+    assert "Section Summaries" in fake_llm.calls[-1][-1].content
+    assert summary == "partial 4"
+
+
+def test_summarize_transcript_uses_llm_cache(fake_llm):
+    fake_llm.reply = "Cached summary"
+
+    assert summarize_transcript("We agreed to ship on Friday.") == "Cached summary"
+    assert summarize_transcript("We agreed  to ship on Friday.\n") == "Cached summary"
+    assert len(fake_llm.calls) == 1
+
+
+def test_action_items_cache_skips_unparseable_replies(fake_llm):
+    from backend.pipelines.action_items import extract_action_items
+
+    transcript = "Priya will send the release notes by Friday."
+    fake_llm.reply = "Sorry, I cannot help with that."
+    assert extract_action_items(transcript) == []
+
+    fake_llm.reply = '[{"description": "Send the release notes", "owner": "Priya"}]'
+    assert extract_action_items(transcript)[0]["owner"] == "Priya"
+    assert extract_action_items(transcript)[0]["owner"] == "Priya"
+    assert len(fake_llm.calls) == 2
+
+
+def test_gemini_client_is_shared_across_calls(fake_llm):
+    from backend.services.llm import get_chat_model
+
+    first = get_chat_model("gemini-2.5-flash", temperature=0.2, api_key="test-key")
+    second = get_chat_model("gemini-2.5-flash", temperature=0.2, api_key="test-key")
+    other = get_chat_model("gemini-2.5-flash", temperature=0, api_key="test-key")
+    assert first is second
+    assert first is not other
+
+
+def test_generate_minutes_fused_single_call(monkeypatch, fake_llm):
+    from backend.pipelines.minutes import generate_minutes
+
+    monkeypatch.setenv("MINUTES_MODE", "fused")
+    fake_llm.reply = (
+        '```json\n{"summary": "Budget approved.", "action_items": '
+        '[{"description": "Send invoice", "owner": "Ana", "due_date": null, "status": "pending"}]}\n```'
+    )
+
+    minutes = generate_minutes("We approved the budget. Ana will send the invoice.")
+
+    assert len(fake_llm.calls) == 1
+    assert minutes["summary"] == "Budget approved."
+    assert minutes["action_items"][0]["owner"] == "Ana"
+
+
+def test_generate_minutes_fused_uses_response_schema(monkeypatch, fake_llm):
+    from backend.pipelines.minutes import MINUTES_SCHEMA, generate_minutes
+
+    schemas = []
+
+    class _Structured:
+        def invoke(self, messages):
+            fake_llm.calls.append(messages)
+            return {"summary": "Budget approved.", "action_items": [{"description": "Send invoice", "owner": "Ana"}]}
+
+    def _with_structured_output(self, schema):
+        schemas.append(schema)
+        return _Structured()
+
+    monkeypatch.setattr(fake_llm, "with_structured_output", _with_structured_output, raising=False)
+    monkeypatch.setenv("MINUTES_MODE", "fused")
+
+    for week in ("this week", "next week"):
+        minutes = generate_minutes(f"We approved the budget for {week}. Ana will send the invoice.")
+        assert minutes["summary"] == "Budget approved."
+        assert minutes["action_items"][0]["owner"] == "Ana"
+    assert len(fake_llm.calls) == 2
+    assert schemas == [MINUTES_SCHEMA]  # bound once, shared by later calls
+
+
+def test_generate_minutes_falls_back_when_unparseable(monkeypatch, fake_llm):
+    from backend.pipelines.minutes import generate_minutes
+
+    monkeypatch.setenv("MINUTES_MODE", "fused")
+    fake_llm.reply = lambda messages: "not json" if len(fake_llm.calls) == 1 else "Plain summary"
+
+    minutes = generate_minutes("We approved the budget. Ana will send the invoice.")
+
+    # fused attempt, then summarization and extraction calls
+    assert len(fake_llm.calls) == 3
+    assert minutes["summary"] == "Plain summary"
+    assert "Extract actionable tasks" in fake_llm.calls[-1][0].content
+
+
+def test_split_on_silence_cuts_in_quiet_frames():
+    np = pytest.importorskip("numpy")
+    from backend.pipelines.transcription import _split_on_silence
+
+    sample_rate = 1000
+    audio = np.ones(30 * sample_rate, dtype=np.float32)
+    # silences around 9s and 19s, near the 10s segment targets
+    audio[9000:9300] = 0.0
+    audio[19000:19300] = 0.0
+
+    bounds = _split_on_silence(audio, sample_rate, target_seconds=10, search_seconds=2)
+
+    assert len(bounds) == 3
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(audio)
+    for (_, end), (start, _) in zip(bounds, bounds[1:]):
+        assert end == start
+        assert audio[end] == 0.0
+
+
+def test_segmented_whisper_decodes_short_audio_once(tmp_path, monkeypatch):
+    np = pytest.importorskip("numpy")
+    from backend.pipelines import transcription
+    from backend.services.whisper_models import WhisperModelRegistry
+
+    decoded = np.zeros(10 * 16000, dtype=np.float32)
+    loads = []
+    received = []
+
+    class _Model:
+        def transcribe(self, source):
+            received.append(source)
+            return {"text": " Short meeting. "}
+
+    audio_path = tmp_path / "short.wav"
+    audio_path.write_bytes(b"audio")
+    monkeypatch.setenv("WHISPER_SEGMENTED", "true")
+    monkeypatch.setattr(transcription, "_load_whisper_audio", lambda path: loads.append(path) or (decoded, 16000))
+    registry = WhisperModelRegistry(loader=lambda name: _Model())
+    monkeypatch.setattr(transcription, "get_whisper_registry", lambda: registry)
+
+    assert transcription._transcribe_with_whisper(str(audio_path)) == "Short meeting."
+    assert loads == [audio_path]
+    assert received[0] is decoded
+
+
+def test_concurrent_minutes_overlap_llm_calls(fake_llm):
+    import time
+
+    from backend.pipelines.minutes import generate_minutes
+
+    def _reply(messages):
+        time.sleep(0.3)
+        if "Extract actionable tasks" in messages[0].content:
+            return '[{"description": "Send the deck", "owner": "Alice", "due_date": null, "status": "pending"}]'
+        return "Deck review."
+
+    fake_llm.reply = _reply
+    start = time.perf_counter()
+    minutes = generate_minutes("Alice will send the deck by Friday.", mode="concurrent")
+    elapsed = time.perf_counter() - start
+
+    assert len(fake_llm.calls) == 2
+    assert elapsed < 0.55  # two 0.3s round trips overlapped, not summed
+    assert minutes["summary"] == "Deck review."
+    assert minutes["action_items"][0]["owner"] == "Alice"
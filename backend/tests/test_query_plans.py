@@ -0,0 +1,92 @@
+"""
+Query plan coverage: exercise the hot endpoints and job queue, capture every
+SELECT they issue, and fail if SQLite plans a full scan of a growing table,
+or sorts in a temporary B-tree for a top-N (LIMIT) query, which means reading
+every matching row to return a page.
+"""
+import re
+
+import pytest
+from sqlalchemy import event
+
+from backend.database import SessionLocal
+
+# Tables that grow with usage; a plain "SCAN <table>" on these is a regression
+HOT_TABLES = {"meetings", "action_items", "meeting_stages", "jobs", "audio_transcripts"}
+
+
+@pytest.fixture
+def captured_selects(app):
+    from backend.database import _engine
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(_engine, "before_cursor_execute", _record)
+
+
+def _plan_problems(connection, statement, parameters):
+    problems = []
+    for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters):
+        detail = row[-1]
+        scan = re.match(r"SCAN (\w+)(?: AS \w+)?$", detail)
+        if scan and scan.group(1) in HOT_TABLES:
+            problems.append(detail)
+        if "USE TEMP B-TREE" in detail and " LIMIT " in statement:
+            problems.append(detail)
+    return problems
+
+
+def _exercise_app(client):
+    from backend.pipelines.orchestrator import process_meeting, recover_orphaned_meetings
+    from backend.services.background import BackgroundTaskRunner
+    from backend.services.transcript_store import find_transcript
+
+    transcript = "ACTION: Book the venue @Sam (due 2024-02-01). The team will confirm catering."
+    for index in range(3):
+        client.post(
+            "/meetings",
+            json={"title": f"Plan {index}", "transcript": transcript, "source_agent": "dashboard"},
+        )
+
+    page = client.get("/meetings?limit=2")
+    client.get(f"/meetings?limit=2&cursor={page.headers['X-Next-Cursor']}")
+    client.get("/meetings?limit=2&fields=title,action_items,stages")
+    client.get("/meetings?limit=2&status=done")
+    client.get("/meetings?limit=2&source_agent=dashboard")
+    client.get("/meetings/1")
+    client.get("/meetings/search?q=venue+catering&limit=5")
+
+    session = SessionLocal()
+    find_transcript(session, "0" * 64, "mock", "mock")
+    session.close()
+
+    runner = BackgroundTaskRunner(poll_interval=0.01)
+    runner.register(process_meeting)
+    recover_orphaned_meetings(runner)
+    runner.enqueue(process_meeting, args=(1,))
+    while runner.run_next():
+        pass
+    runner.queue_status()
+
+
+def test_hot_queries_use_indexes(client, captured_selects):
+    from backend.database import _engine
+
+    _exercise_app(client)
+    assert captured_selects
+
+    failures = {}
+    with _engine.connect() as connection:
+        for statement, parameters in captured_selects:
+            problems = _plan_problems(connection, statement, parameters)
+            if problems:
+                failures[" ".join(statement.split())] = problems
+    assert not failures, "Queries without a usable index:\n" + "\n".join(
+        f"{statement}\n    -> {problems}" for statement, problems in failures.items()
+    )
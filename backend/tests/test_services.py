@@ -0,0 +1,525 @@
+from backend.services.llm_cache import LLMResultCache, make_cache_key
+
+
+def test_cache_key_normalizes_whitespace():
+    first = make_cache_key("summary", "Hello   team\n", "gemini", "v1", max_sentences=5)
+    second = make_cache_key("summary", " Hello team", "gemini", "v1", max_sentences=5)
+    other = make_cache_key("summary", "Hello team", "gemini", "v1", max_sentences=3)
+    assert first == second
+    assert first != other
+
+
+def test_llm_cache_lru_eviction_and_counters(tmp_path):
+    cache = LLMResultCache(tmp_path / "cache.db", max_entries=2)
+    cache.set("a", "summary a")
+    cache.set("b", "summary b")
+    assert cache.get("a") == "summary a"  # "b" is now least recently used
+    cache.set("c", "summary c")
+
+    assert cache.get("b") is None
+    assert cache.get("c") == "summary c"
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["entries"] == 2
+
+
+def test_llm_cache_ttl_expiry(tmp_path, monkeypatch):
+    from backend.services import llm_cache
+
+    cache = LLMResultCache(tmp_path / "cache.db", ttl_seconds=60)
+    cache.set("a", ["item"])
+    now = llm_cache.time.time()
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now + 120)
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_whisper_registry_loads_once_and_evicts_idle_models():
+    from backend.services.whisper_models import WhisperModelRegistry
+
+    loaded = []
+
+    def _loader(name):
+        loaded.append(name)
+        return object()
+
+    # "tiny" and "base" fall back to the approximate sizes (~75 MB, ~145 MB)
+    registry = WhisperModelRegistry(memory_budget_bytes=200 * 1024 * 1024, loader=_loader)
+    with registry.use("tiny") as first:
+        pass
+    with registry.use("tiny") as second:
+        assert second is first
+    assert loaded == ["tiny"]
+
+    with registry.use("base"):
+        pass
+    assert loaded == ["tiny", "base"]
+    assert registry.loaded_models() == ["base"]
+    assert registry.stats()["evictions"] == 1
+
+
+def test_whisper_registry_keeps_models_in_use():
+    from backend.services.whisper_models import WhisperModelRegistry
+
+    registry = WhisperModelRegistry(memory_budget_bytes=1, loader=lambda name: object())
+    with registry.use("tiny"):
+        with registry.use("base"):
+            assert sorted(registry.loaded_models()) == ["base", "tiny"]
+
+
+def test_whisper_pool_workers_fit_memory_budget(monkeypatch):
+    from backend.services.whisper_models import _pool_workers
+
+    monkeypatch.delenv("WHISPER_WORKERS", raising=False)
+    monkeypatch.delenv("WHISPER_MEMORY_BUDGET_MB", raising=False)
+    assert _pool_workers("small", cpu_count=16) == 16
+    # ~480 MB per "small" copy: a 2 GB budget holds four
+    monkeypatch.setenv("WHISPER_MEMORY_BUDGET_MB", "2048")
+    assert _pool_workers("small", cpu_count=16) == 4
+    assert _pool_workers("small", cpu_count=2) == 2
+    # Always at least one worker, even if the model alone exceeds the budget
+    assert _pool_workers("large", cpu_count=16) == 1
+
+
+def _init_echo_worker(name, threads_per_worker):
+    pass
+
+
+def _echo_segment(audio):
+    return str(audio)
+
+
+def test_whisper_pool_is_replaced_after_a_worker_dies(monkeypatch):
+    import os
+    import signal
+
+    from backend.services import whisper_models
+
+    # Workers are spawned, so the stand-ins must be importable module-level functions
+    monkeypatch.setattr(whisper_models, "_init_pool_worker", _init_echo_worker)
+    monkeypatch.setattr(whisper_models, "_transcribe_in_worker", _echo_segment)
+    monkeypatch.setenv("WHISPER_WORKERS", "1")
+    monkeypatch.delenv("WHISPER_MEMORY_BUDGET_MB", raising=False)
+    monkeypatch.setattr(whisper_models, "_pools", {})
+    try:
+        assert whisper_models.transcribe_segments("tiny", [1, 2]) == ["1", "2"]
+        broken = whisper_models._pools["tiny"]
+        for process in list(broken._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+            process.join(timeout=10)
+
+        assert whisper_models.transcribe_segments("tiny", [3, 4, 5]) == ["3", "4", "5"]
+        assert whisper_models._pools["tiny"] is not broken
+    finally:
+        for pool in whisper_models._pools.values():
+            pool.shutdown(wait=True)
+
+
+def test_assemblyai_poll_backs_off_exponentially(fake_assemblyai, monkeypatch):
+    from backend.services import assembly
+
+    sleeps = []
+    monkeypatch.setattr(assembly.time, "sleep", sleeps.append)
+    client = assembly.AssemblyAIClient(
+        api_key="test-key", base_url=fake_assemblyai.url, poll_interval=1, max_poll_interval=2
+    )
+    transcript_id = client.request_transcription("https://cdn.fake-assemblyai/upload/1")
+    fake_assemblyai.transcripts[transcript_id].update(
+        text="Hello team", script=["queued", "processing", "processing", "completed"]
+    )
+
+    result = client.poll_transcription(transcript_id)
+
+    assert client.transcript_text(result) == "Hello team"
+    assert sleeps == [1, 1.5, 2]
+
+
+def test_assemblyai_client_retries_transient_errors(fake_assemblyai, monkeypatch, tmp_path):
+    from backend.services import assembly
+
+    sleeps = []
+    monkeypatch.setattr(assembly.time, "sleep", sleeps.append)
+    audio = tmp_path / "meeting.wav"
+    audio.write_bytes(b"fake audio bytes")
+    client = assembly.AssemblyAIClient(api_key="test-key", base_url=fake_assemblyai.url, max_retries=2)
+
+    fake_assemblyai.fail_next = [503, 429]
+    assert client.upload_file(audio).startswith("https://")
+
+    uploads = [body for method, path, body in fake_assemblyai.requests if path.endswith("/upload")]
+    assert uploads == [b"fake audio bytes"] * 3  # body replayed on every attempt
+    assert len(sleeps) == 2
+    stats = client.pool_stats()
+    assert stats["retries"] == 2
+    assert stats["pools"][0]["connections_opened"] >= 1
+
+
+def test_assemblyai_transcript_request_is_not_retried_after_server_errors(fake_assemblyai, monkeypatch):
+    import pytest
+    import requests
+
+    from backend.services import assembly
+
+    monkeypatch.setattr(assembly.time, "sleep", lambda delay: None)
+    client = assembly.AssemblyAIClient(api_key="test-key", base_url=fake_assemblyai.url, max_retries=2)
+
+    # A 5xx may come after the job was created, so POST /transcript is not repeated
+    fake_assemblyai.fail_next = [500]
+    with pytest.raises(assembly.AssemblyAIError):
+        client.request_transcription("https://cdn.example.com/audio.wav")
+    assert len(fake_assemblyai.submitted()) == 1
+
+    # Rate limiting means nothing was created: retried
+    fake_assemblyai.fail_next = [429]
+    assert client.request_transcription("https://cdn.example.com/audio.wav") == "tx-1"
+    assert len(fake_assemblyai.submitted()) == 3
+
+    def _read_timeout(*args, **kwargs):
+        raise requests.ReadTimeout("read timed out")
+
+    monkeypatch.setattr(client.session, "request", _read_timeout)
+    requests_sent = client.requests_sent
+    with pytest.raises(assembly.AssemblyAIError):
+        client.request_transcription("https://cdn.example.com/audio.wav")
+    assert client.requests_sent == requests_sent + 1
+    # GETs keep retrying read timeouts
+    with pytest.raises(assembly.AssemblyAIError):
+        client.get_transcription("tx-1")
+    assert client.requests_sent == requests_sent + 4
+
+    # Nothing listening: the request never left, so it is safe to repeat
+    refused = assembly.AssemblyAIClient(api_key="test-key", base_url="http://127.0.0.1:1", max_retries=2)
+    with pytest.raises(assembly.AssemblyAIError):
+        refused.request_transcription("https://cdn.example.com/audio.wav")
+    assert refused.requests_sent == 3
+
+
+def test_shared_assemblyai_client_is_reused(fake_assemblyai):
+    from backend.services.assembly import get_assemblyai_client
+
+    first = get_assemblyai_client("test-key", fake_assemblyai.url)
+    assert get_assemblyai_client("test-key", fake_assemblyai.url + "/") is first
+    assert get_assemblyai_client("other-key", fake_assemblyai.url) is not first
+
+
+def test_save_audio_file_hashes_while_writing(tmp_path):
+    import hashlib
+    import io
+
+    from werkzeug.datastructures import FileStorage
+
+    from backend.services.storage import save_audio_file
+
+    data = b"\x00\x01audio" * 1000
+    path, digest = save_audio_file(FileStorage(io.BytesIO(data), filename="call.mp3"), tmp_path)
+
+    assert path.suffix == ".mp3"
+    assert path.read_bytes() == data
+    assert digest == hashlib.sha256(data).hexdigest()
+
+
+def _job_runner(**kwargs):
+    from backend.services.background import BackgroundTaskRunner
+
+    options = {"poll_interval": 0.01, "retry_backoff": 0}
+    options.update(kwargs)
+    return BackgroundTaskRunner(**options)
+
+
+def test_event_broker_wakes_waiting_coroutines():
+    import asyncio
+    import threading
+
+    from backend.services.events import EventBroker
+
+    broker = EventBroker(history=10)
+
+    async def _wait_all():
+        subscriptions = [broker.subscribe(1) for _ in range(50)]
+        threading.Timer(0.1, broker.publish, args=(1, "done", {})).start()
+        results = await asyncio.gather(*(subscription.wait_events(timeout=5) for subscription in subscriptions))
+        timed_out = await broker.subscribe(2).wait_events(timeout=0.05)
+        return results, timed_out
+
+    results, timed_out = asyncio.run(_wait_all())
+    assert all([name for _, name, _ in events] == ["done"] for events in results)
+    assert timed_out == []
+
+
+def test_job_queue_persists_and_retries_failed_jobs(app):
+    from backend.database import get_session
+    from backend.models import Job
+
+    calls = []
+
+    def flaky(value):
+        calls.append(value)
+        if len(calls) == 1:
+            raise RuntimeError("transient")
+
+    runner = _job_runner(max_attempts=3)
+    runner.register(flaky)
+    job_id = runner.enqueue(flaky, args=("x",))
+    assert runner.enqueue(flaky, args=("x",)) is None  # de-duplicated while queued
+
+    assert runner.run_next() is True
+    assert runner.run_next() is True
+    assert runner.run_next() is False
+    assert calls == ["x", "x"]
+
+    session = get_session()
+    job = session.get(Job, job_id)
+    assert job.status == "done"
+    assert job.attempts == 2
+    assert job.last_error is None
+    session.close()
+
+
+def test_job_queue_fails_invalid_meetings_without_retrying(app):
+    from backend.database import get_session
+    from backend.models import Job, Meeting
+    from backend.pipelines.orchestrator import process_meeting
+
+    session = get_session()
+    meeting = Meeting(title="Too short", transcript="ok")
+    session.add(meeting)
+    session.commit()
+    meeting_id = meeting.id
+    session.close()
+
+    runner = _job_runner(max_attempts=3)
+    runner.register(process_meeting)
+    job_id = runner.enqueue(process_meeting, args=(meeting_id,))
+    assert runner.run_next() is True
+    assert runner.run_next() is False  # not requeued for another attempt
+
+    session = get_session()
+    job = session.get(Job, job_id)
+    assert job.status == "failed"
+    assert job.attempts == 1
+    assert job.last_error.startswith("PermanentJobError: Transcript is too short")
+    assert session.get(Meeting, meeting_id).status == "failed"
+    session.close()
+
+
+def test_job_queue_reclaims_expired_leases(app):
+    from datetime import datetime, timedelta
+
+    from backend.database import get_session
+    from backend.models import Job
+
+    calls = []
+    runner = _job_runner()
+    runner.register(calls.append, name="record")
+
+    session = get_session()
+    # A job whose worker died mid-flight: still "running" but its lease has expired
+    session.add(
+        Job(
+            task="record",
+            payload='{"args": [1], "kwargs": {}}',
+            status="running",
+            attempts=1,
+            locked_by="dead-worker",
+            locked_until=datetime.utcnow() - timedelta(seconds=1),
+        )
+    )
+    session.add(
+        Job(
+            task="record",
+            payload='{"args": [2], "kwargs": {}}',
+            status="running",
+            attempts=1,
+            locked_by="live-worker",
+            locked_until=datetime.utcnow() + timedelta(minutes=5),
+        )
+    )
+    session.commit()
+    session.close()
+
+    assert runner.run_next() is True
+    assert runner.run_next() is False
+    assert calls == [1]
+
+
+def test_job_queue_gives_up_after_max_attempts(app):
+    from backend.database import get_session
+    from backend.models import Job
+
+    def broken():
+        raise RuntimeError("boom")
+
+    runner = _job_runner(max_attempts=2)
+    runner.register(broken)
+    job_id = runner.enqueue(broken)
+    while runner.run_next():
+        pass
+
+    session = get_session()
+    job = session.get(Job, job_id)
+    assert job.status == "failed"
+    assert job.attempts == 2
+    assert "boom" in job.last_error
+    session.close()
+
+
+def test_job_queue_purges_old_done_jobs(app, monkeypatch):
+    from datetime import datetime, timedelta
+
+    from backend.database import get_session
+    from backend.models import Job
+    from backend.services import background
+
+    monkeypatch.setattr(background, "PURGE_BATCH_SIZE", 2)
+    runner = _job_runner(retention_hours=24)
+    session = get_session()
+    old = datetime.utcnow() - timedelta(hours=25)
+    for index in range(5):
+        session.add(Job(task="old", payload="{}", dedupe_key=f"old-{index}", status="done", finished_at=old))
+    session.add(Job(task="recent", payload="{}", dedupe_key="recent", status="done", finished_at=datetime.utcnow()))
+    session.add(Job(task="failed", payload="{}", dedupe_key="failed", status="failed", finished_at=old))
+    session.add(Job(task="queued", payload="{}", dedupe_key="queued", status="queued"))
+    session.commit()
+
+    runner._maybe_purge()  # what an idle worker does between polls
+    assert sorted(task for (task,) in session.query(Job.task)) == ["failed", "queued", "recent"]
+    # Swept at most once per interval
+    session.add(Job(task="old", payload="{}", dedupe_key="old-again", status="done", finished_at=old))
+    session.commit()
+    runner._maybe_purge()
+    assert session.query(Job).filter(Job.task == "old").count() == 1
+    assert runner.purge_finished() == 1
+    session.close()
+
+
+def test_job_queue_workers_drain_and_recover_orphaned_meetings(app):
+    import time
+
+    from backend.database import get_session
+    from backend.models import Meeting
+    from backend.pipelines.orchestrator import process_meeting, recover_orphaned_meetings
+
+    session = get_session()
+    meeting = Meeting(title="Orphan", transcript="A long enough transcript to summarize.", status="processing")
+    session.add(meeting)
+    session.commit()
+    meeting_id = meeting.id
+    session.close()
+
+    runner = _job_runner()
+    runner.register(process_meeting)
+    assert recover_orphaned_meetings(runner) == 1
+    assert recover_orphaned_meetings(runner) == 0  # already queued
+    runner.start()
+    try:
+        deadline = time.time() + 5
+        while time.time() < deadline and runner.stats()["jobs"]["done"] < 1:
+            time.sleep(0.02)
+    finally:
+        runner.shutdown()
+
+    session = get_session()
+    assert session.get(Meeting, meeting_id).status == "done"
+    session.close()
+
+
+def test_event_broker_fans_out_per_meeting():
+    import threading
+
+    from backend.services.events import EventBroker
+
+    broker = EventBroker(history=10)
+    idle = [broker.subscribe(meeting_id) for meeting_id in range(100, 600)]
+    watcher = broker.subscribe(1)
+    assert broker.stats()["subscribers"] == 501
+
+    timer = threading.Timer(0.1, broker.publish, args=(1, "summarizing", {"stage": "summarize"}))
+    timer.start()
+    events = watcher.next_events(timeout=5)
+    assert [(name, data["stage"]) for _, name, data in events] == [("summarizing", "summarize")]
+    assert all(subscription.next_events(timeout=0) == [] for subscription in idle[:5])
+
+    broker.publish(1, "done", {})
+    late = broker.subscribe(1)
+    late.replay_after(0)  # reconnect with Last-Event-ID: 0
+    assert [name for _, name, _ in late.next_events(timeout=0)] == ["summarizing", "done"]
+
+    for subscription in idle + [watcher, late]:
+        subscription.close()
+    assert broker.stats()["subscribers"] == 0
+
+
+LEGACY_MEETINGS_DDL = """
+CREATE TABLE meetings (
+    id INTEGER PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    created_at DATETIME NOT NULL,
+    audio_url VARCHAR(1024),
+    transcript TEXT,
+    summary TEXT,
+    status VARCHAR(50) NOT NULL,
+    source_agent VARCHAR(255),
+    error_message TEXT
+)
+"""
+
+
+def test_migration_moves_inline_transcripts_to_compressed_table(tmp_path, monkeypatch):
+    import sqlite3
+
+    from sqlalchemy import text
+
+    from backend.app import create_app
+    from backend.database import SessionLocal
+    from backend.models import Meeting
+    from backend.tests.conftest import TestConfig
+
+    db_file = tmp_path / "legacy.sqlite"
+    legacy = sqlite3.connect(db_file)
+    legacy.execute(LEGACY_MEETINGS_DDL)
+    legacy.executemany(
+        "INSERT INTO meetings (title, created_at, transcript, summary, status) VALUES (?, ?, ?, ?, ?)",
+        [
+            ("Budget review", "2025-01-01 10:00:00", "We went over the budget. " * 100, "Budget approved.", "done"),
+            ("No transcript yet", "2025-01-02 10:00:00", None, None, "pending"),
+        ],
+    )
+    legacy.commit()
+    legacy.close()
+
+    class _Config(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_file}"
+        STORAGE_DIR = tmp_path / "uploads"
+
+    monkeypatch.setenv("MOCK_SUMMARY", "1")
+    client = create_app(_Config).test_client()
+
+    session = SessionLocal()
+    columns = {row[1] for row in session.execute(text("PRAGMA table_info(meetings)"))}
+    assert "transcript" not in columns and "summary" not in columns
+    stored = session.execute(text("SELECT meeting_id, length(transcript) FROM meeting_contents")).all()
+    assert len(stored) == 1 and stored[0][1] < len("We went over the budget. " * 100)
+    meeting = session.get(Meeting, stored[0][0])
+    assert meeting.transcript == "We went over the budget. " * 100
+    assert meeting.summary == "Budget approved."
+    assert session.query(Meeting).filter(Meeting.title == "No transcript yet").one().transcript is None
+    session.close()
+
+    assert client.get(f"/meetings/{stored[0][0]}").json["summary"] == "Budget approved."
+    assert [result["title"] for result in client.get("/meetings/search?q=budget").json] == ["Budget review"]
+
+
+def test_sqlite_engine_profile(app):
+    from sqlalchemy import text
+    from sqlalchemy.pool import QueuePool
+
+    from backend.database import _engine
+
+    assert isinstance(_engine.pool, QueuePool)
+    assert _engine.pool.size() == app.config["DB_POOL_SIZE"]
+    with _engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == app.config["SQLITE_BUSY_TIMEOUT_MS"]
+        assert connection.execute(text("PRAGMA cache_size")).scalar() == -app.config["SQLITE_CACHE_SIZE_MB"] * 1024
@@ -2,7 +2,7 @@ import type { CreateMeetingResponse, FollowupResponse, Meeting } from "@/types/a
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL ?? "http://localhost:5000";
 
-async function request<T>(path: string, init?: RequestInit): Promise<T> {
+async function requestWithHeaders<T>(path: string, init?: RequestInit): Promise<{ data: T; headers: Headers }> {
   const response = await fetch(`${API_BASE_URL}${path}`, {
     ...init,
     headers: init?.body instanceof FormData
@@ -32,12 +32,36 @@ async function request<T>(path: string, init?: RequestInit): Promise<T> {
     throw new Error(message || "Request failed");
   }
 
-  return data as T;
+  return { data: data as T, headers: response.headers };
+}
+
+async function request<T>(path: string, init?: RequestInit): Promise<T> {
+  return (await requestWithHeaders<T>(path, init)).data;
 }
 
-export function fetchMeetings(limit?: number) {
-  const query = typeof limit === "number" ? `?limit=${limit}` : "";
-  return request<Meeting[]>(`/meetings${query}`);
+// Fields the list views render; transcripts are only loaded by fetchMeeting
+const MEETING_LIST_FIELDS = "title,status,created_at,source_agent,summary,action_items";
+const MEETINGS_PAGE_SIZE = 200;
+
+/**
+ * Meetings newest first. With `limit`, only that many; otherwise every page,
+ * following the `X-Next-Cursor` header the API sends while more remain.
+ */
+export async function fetchMeetings(limit?: number) {
+  const params = new URLSearchParams({
+    fields: MEETING_LIST_FIELDS,
+    limit: String(typeof limit === "number" ? limit : MEETINGS_PAGE_SIZE),
+  });
+  const meetings: Meeting[] = [];
+  for (;;) {
+    const { data, headers } = await requestWithHeaders<Meeting[]>(`/meetings?${params}`);
+    meetings.push(...data);
+    const cursor = headers.get("X-Next-Cursor");
+    if (typeof limit === "number" || !cursor) {
+      return meetings;
+    }
+    params.set("cursor", cursor);
+  }
 }
 
 export function fetchMeeting(meetingId: number | string) {
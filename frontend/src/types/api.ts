@@ -11,8 +11,9 @@ export interface Meeting {
   title: string;
   status: string;
   created_at: string;
-  audio_url: string | null;
-  transcript: string | null;
+  // Only in single-meeting payloads; list requests leave them out via `fields=`
+  audio_url?: string | null;
+  transcript?: string | null;
   summary: string | null;
   source_agent: string | null;
   action_items: ActionItem[];